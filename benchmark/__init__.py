@@ -0,0 +1,5 @@
+"""
+性能基准测试
+
+各模块可通过 ``python -m benchmark.<模块名>`` 单独运行
+"""
@@ -0,0 +1,309 @@
+from argparse import ArgumentParser
+from pathlib import Path
+from platform import python_version
+from tempfile import TemporaryDirectory
+from time import perf_counter_ns
+from typing import Any, Callable, List, get_args
+
+from orjson import OPT_INDENT_2, dumps
+from pydantic import BaseModel
+from yaml import __with_libyaml__
+
+from internal.config import ConfigManager
+from internal.config.autosave import AutoSaveConfig
+from internal.config.buyer import BuyerConfig, BuyerData
+from internal.config.cipher import derive_key
+from internal.config.notification import NotificationConfig
+
+
+def _fill_notification(notification: NotificationConfig):
+    """
+    启用并填写全部通知渠道
+
+    :param notification: 通知配置
+    """
+    notification.isEnable = True
+    methods = get_args(NotificationConfig.model_fields["methods"].annotation)[0]
+    notification.methods = list(get_args(methods))
+
+    for name in NotificationConfig.model_fields:
+        channel = getattr(notification, name)
+        if not isinstance(channel, AutoSaveConfig):
+            continue
+        for field_name, field in type(channel).model_fields.items():
+            if getattr(channel, field_name) not in ("", None):
+                continue
+            if str in (field.annotation, *get_args(field.annotation)):
+                setattr(channel, field_name, f"{name}-{field_name}")
+
+
+def _prepare(config_path: Path, buyers: int, encrypt: bool = True):
+    """
+    生成测试配置文件
+
+    :param config_path: 配置文件路径
+    :param buyers: 购票人数量
+    :param encrypt: 是否加密保存
+    """
+    manager = ConfigManager(config_path=config_path, auto_save=False)
+    manager.setting.isEncrypt = encrypt
+    manager.account.account = "13800000000"
+    manager.account.token = "t" * 64
+    manager.buyer.buyer = [
+        BuyerData(
+            id=i,
+            realname=f"buyer-{i}",
+            idcard=f"{i:018d}",
+            mobile=f"{i:011d}",
+            validType=0,
+        )
+        for i in range(buyers)
+    ]
+    manager.buyer.count = buyers
+    _fill_notification(manager.notification)
+    manager.init_config(force=True)
+
+
+def _time_ms(action: Callable[[], Any], rounds: int) -> float:
+    """
+    测量平均耗时
+
+    :param action: 被测操作
+    :param rounds: 测量次数
+    :return: 单次平均耗时（毫秒）
+    """
+    total = 0
+    for _ in range(rounds):
+        start = perf_counter_ns()
+        action()
+        total += perf_counter_ns() - start
+    return total / rounds / 1e6
+
+
+def bench_load(config_path: Path, rounds: int) -> dict:
+    """
+    加载耗时：冷加载与启动缓存加载（均含密钥派生，与实际启动一致）、热加载（密钥已缓存）
+
+    :param config_path: 配置文件路径
+    :param rounds: 测量次数
+    :return: 各方式单次加载耗时（毫秒）
+    """
+
+    def cold():
+        derive_key.cache_clear()
+        ConfigManager(config_path=config_path, auto_save=False).load()
+
+    def warm():
+        ConfigManager(config_path=config_path, auto_save=False).load()
+
+    def cached():
+        derive_key.cache_clear()
+        ConfigManager(config_path=config_path, auto_save=False, cache=True).load()
+
+    cold_ms = _time_ms(cold, rounds)
+    warm_ms = _time_ms(warm, rounds)
+    # 首次加载生成启动缓存
+    cached()
+    cached_ms = _time_ms(cached, rounds)
+    return {"cold_ms": cold_ms, "warm_ms": warm_ms, "cached_ms": cached_ms}
+
+
+def _measure_writes(
+    manager: ConfigManager, action: Callable[[int], Any], count: int
+) -> dict:
+    """
+    执行一组修改并统计耗时与磁盘写入次数
+
+    :param manager: 配置管理器
+    :param action: 修改操作（参数为序号）
+    :param count: 修改次数
+    :return: 单次修改耗时、写入结束耗时与写入次数
+    """
+    before = manager.save_stats["performed"]
+    start = perf_counter_ns()
+    for i in range(count):
+        action(i)
+    elapsed = perf_counter_ns() - start
+    start = perf_counter_ns()
+    manager.flush()
+    flush = perf_counter_ns() - start
+    return {
+        "per_change_us": elapsed / count / 1000,
+        "flush_ms": flush / 1e6,
+        "writes": manager.save_stats["performed"] - before,
+    }
+
+
+def bench_update(config_path: Path, count: int) -> dict:
+    """
+    单字段修改：立即写入与合并写入
+
+    :param config_path: 配置文件路径
+    :param count: 修改次数
+    :return: 各方式的耗时与写入次数
+    """
+
+    def update(manager: ConfigManager):
+        return lambda i: setattr(manager.setting, "refreshInterval", 1000 + i)
+
+    immediate = ConfigManager(config_path=config_path, save_delay=0).load()
+    debounced = ConfigManager(config_path=config_path).load()
+    return {
+        "immediate": _measure_writes(immediate, update(immediate), count),
+        "debounced": _measure_writes(debounced, update(debounced), count),
+    }
+
+
+def bench_burst(config_path: Path, count: int) -> dict:
+    """
+    AutoSaveList 连续追加：合并写入与批量事务
+
+    :param config_path: 配置文件路径
+    :param count: 追加次数
+    :return: 各方式的耗时与写入次数
+    """
+
+    def append(manager: ConfigManager):
+        return lambda i: manager.buyer.buyer.append(
+            BuyerData(
+                id=100000 + i,
+                realname=f"burst-{i}",
+                idcard=f"{i:018d}",
+                mobile=f"{i:011d}",
+                validType=0,
+            )
+        )
+
+    debounced = ConfigManager(config_path=config_path).load()
+    result = {"debounced": _measure_writes(debounced, append(debounced), count)}
+
+    batched = ConfigManager(config_path=config_path).load()
+    before = batched.save_stats["performed"]
+    start = perf_counter_ns()
+    with batched.batch():
+        for i in range(count):
+            append(batched)(i)
+    elapsed = perf_counter_ns() - start
+    result["batch"] = {
+        "per_change_us": elapsed / count / 1000,
+        "flush_ms": 0.0,
+        "writes": batched.save_stats["performed"] - before,
+    }
+    return result
+
+
+def _legacy_setup_refs(obj: Any, parent: ConfigManager):
+    """
+    旧版父级引用设置（递归遍历整棵配置树，仅用于对比）
+    """
+    if isinstance(obj, BaseModel):
+        if isinstance(obj, AutoSaveConfig):
+            object.__setattr__(obj, "_legacy_parent", parent)
+        for field_name in type(obj).model_fields:
+            _legacy_setup_refs(getattr(obj, field_name, None), parent)
+    elif isinstance(obj, list):
+        for item in obj:
+            _legacy_setup_refs(item, parent)
+
+
+def bench_parent_refs(config_path: Path, rounds: int) -> dict:
+    """
+    对比关联配置分组时旧版递归遍历与上下文关联的耗时
+
+    :param config_path: 配置文件路径
+    :param rounds: 测量次数
+    :return: 各方式单次关联耗时（微秒）
+    """
+    manager = ConfigManager(config_path=config_path, auto_save=False).load()
+    legacy_section = BuyerConfig.model_validate(manager.buyer.model_dump())
+    section = BuyerConfig.model_validate(manager.buyer.model_dump())
+
+    legacy_ms = _time_ms(lambda: _legacy_setup_refs(legacy_section, manager), rounds)
+    context_ms = _time_ms(lambda: manager._attach("buyer", section), rounds)  # noqa
+    return {"legacy_us": legacy_ms * 1000, "context_us": context_ms * 1000}
+
+
+def run_all(sizes: List[int], rounds: int, changes: int) -> dict:
+    """
+    在临时目录中按配置规模与加密方式运行全部场景
+
+    :param sizes: 购票人数量列表
+    :param rounds: 加载测量次数
+    :param changes: 修改场景的修改次数
+    :return: 全部场景结果
+    """
+    results = {
+        "meta": {
+            "python": python_version(),
+            "libyaml": __with_libyaml__,
+            "rounds": rounds,
+            "changes": changes,
+        },
+        "cases": [],
+    }
+    with TemporaryDirectory() as temp_dir:
+        for buyers in sizes:
+            for encrypt in (False, True):
+                config_path = Path(temp_dir) / f"config-{buyers}-{int(encrypt)}.yaml"
+                _prepare(config_path, buyers, encrypt)
+                results["cases"].append(
+                    {
+                        "buyers": buyers,
+                        "encrypt": encrypt,
+                        "config_bytes": config_path.stat().st_size,
+                        "load": bench_load(config_path, rounds),
+                        "update": bench_update(config_path, changes),
+                        "burst": bench_burst(config_path, changes),
+                        "parent_refs": bench_parent_refs(config_path, rounds),
+                    }
+                )
+    return results
+
+
+def main():
+    """
+    主函数
+    """
+    parser = ArgumentParser(description="配置加载与保存性能基准测试")
+    parser.add_argument("-b", "--buyers", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("-r", "--rounds", type=int, default=10)
+    parser.add_argument("-c", "--changes", type=int, default=100)
+    parser.add_argument("-o", "--output", type=Path, help="结果输出文件（JSON）")
+    args = parser.parse_args()
+
+    results = run_all(args.buyers, args.rounds, args.changes)
+
+    print(f"LibYAML: {'可用' if __with_libyaml__ else '不可用'}")
+    for case in results["cases"]:
+        load, update, burst = case["load"], case["update"], case["burst"]
+        print(
+            f"购票人 {case['buyers']:>5}  {'加密' if case['encrypt'] else '明文'}  "
+            f"文件 {case['config_bytes']:>8} B"
+        )
+        print(
+            f"  加载  冷={load['cold_ms']:.2f}ms  热={load['warm_ms']:.2f}ms  "
+            f"缓存={load['cached_ms']:.2f}ms"
+        )
+        for label, result in (
+            ("修改（立即写入）", update["immediate"]),
+            ("修改（合并写入）", update["debounced"]),
+            ("追加（合并写入）", burst["debounced"]),
+            ("追加（批量事务）", burst["batch"]),
+        ):
+            print(
+                f"  {label}  {result['per_change_us']:.1f}us/次  "
+                f"写入结束={result['flush_ms']:.2f}ms  写入={result['writes']}次"
+            )
+        refs = case["parent_refs"]
+        print(
+            f"  关联分组  递归遍历={refs['legacy_us']:.1f}us  "
+            f"上下文={refs['context_us']:.1f}us"
+        )
+
+    if args.output:
+        args.output.write_bytes(dumps(results, option=OPT_INDENT_2))
+        print(f"结果已保存至 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
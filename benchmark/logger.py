@@ -0,0 +1,327 @@
+import sys
+from argparse import ArgumentParser
+from asyncio import run
+from pathlib import Path
+from platform import python_version
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import perf_counter, perf_counter_ns
+from typing import Callable, List
+
+from orjson import OPT_INDENT_2, dumps
+
+from internal.util.logger import (
+    LoggerManager,
+    NonBlockingFileHandler,
+    log,
+    log_settings,
+)
+
+
+def _legacy_get_caller() -> str:
+    """
+    旧版调用者解析（逐帧遍历调用栈，仅用于对比）
+    """
+    caller_name = None
+
+    try:
+        frame = sys._getframe(3)  # noqa
+    except (AttributeError, ValueError):
+        return "log.py"
+
+    while frame:
+        filepath = Path(frame.f_code.co_filename)
+        parts = filepath.parts
+
+        if not caller_name:
+            if parts[-1] == "__init__.py" and len(parts) >= 2:
+                caller_name = parts[-2]
+            else:
+                caller_name = parts[-1]
+
+        if caller_name:
+            if "internal" in parts or "cli.py" in parts:
+                break
+
+        try:
+            frame = frame.f_back
+        except AttributeError:
+            break
+
+    return caller_name or "log.py"
+
+
+def _cached_get_caller() -> str:
+    """
+    当前调用者解析（按代码文件缓存）
+    """
+    return LoggerManager._LoggerManager__get_caller()  # noqa
+
+
+def _measure(resolver, iterations: int) -> float:
+    """
+    测量调用者解析的单次耗时
+
+    :param resolver: 调用者解析函数
+    :param iterations: 调用次数
+    :return: 单次调用耗时（纳秒）
+    """
+
+    # 模拟 调用方 -> info() -> logger() -> __get_caller() 的调用深度
+    def logger():
+        return resolver()
+
+    def info():
+        return logger()
+
+    start = perf_counter_ns()
+    for _ in range(iterations):
+        info()
+    return (perf_counter_ns() - start) / iterations
+
+
+def bench_caller(iterations: int = 200000) -> dict:
+    """
+    调用者解析微基准
+
+    :param iterations: 调用次数
+    :return: 旧版与当前实现的单次耗时（纳秒）
+    """
+    return {
+        "legacy_ns": _measure(_legacy_get_caller, iterations),
+        "cached_ns": _measure(_cached_get_caller, iterations),
+    }
+
+
+def _summary(latencies: List[int], count: int, elapsed: float, before: dict) -> dict:
+    """
+    汇总单个场景的结果
+
+    :param latencies: 每次调用耗时（纳秒）
+    :param count: 日志条数
+    :param elapsed: 写入并排空的总耗时（秒）
+    :param before: 场景开始前的队列统计
+    :return: 吞吐量与延迟分位数
+    """
+    latencies.sort()
+    after = log.stats()
+    return {
+        "messages": count,
+        "messages_per_second": count / elapsed if elapsed else 0.0,
+        "p50_us": latencies[len(latencies) // 2] / 1000 if latencies else 0.0,
+        "p99_us": latencies[int(len(latencies) * 0.99)] / 1000 if latencies else 0.0,
+        "max_us": latencies[-1] / 1000 if latencies else 0.0,
+        "dropped": after["dropped"] - before["dropped"],
+        "spilled": after["spilled"] - before["spilled"],
+    }
+
+
+def _run(producer: Callable[[List[int]], None], count: int) -> dict:
+    """
+    运行一个场景：调用生产者写入日志，并等待后台写入完成
+
+    :param producer: 生产者，将每次调用耗时追加至传入的列表
+    :param count: 日志条数
+    :return: 场景结果
+    """
+    before = log.stats()
+    latencies: List[int] = []
+    start = perf_counter()
+    producer(latencies)
+    log.drain(timeout=60)
+    return _summary(latencies, count, perf_counter() - start, before)
+
+
+def _produce(latencies: List[int], count: int, method: Callable, offset: int = 0):
+    """
+    逐条写入日志并记录调用耗时
+    """
+    for i in range(offset, offset + count):
+        start = perf_counter_ns()
+        method("benchmark message %d", i)
+        latencies.append(perf_counter_ns() - start)
+
+
+def bench_filtered(iterations: int = 200000) -> dict:
+    """
+    被过滤日志级别的单次耗时
+
+    :param iterations: 调用次数
+    :return: 单次调用耗时（纳秒）
+    """
+    original_debug = log_settings.DEBUG
+    original_level = log_settings.LOG_LEVEL
+    log_settings.DEBUG = False
+    log_settings.LOG_LEVEL = "INFO"
+    log.update_loggers()
+    try:
+        start = perf_counter_ns()
+        for _ in range(iterations):
+            log.debug("filtered %s", 1)
+        return {"filtered_ns": (perf_counter_ns() - start) / iterations}
+    finally:
+        log_settings.DEBUG = original_debug
+        log_settings.LOG_LEVEL = original_level
+        log.update_loggers()
+
+
+def bench_single_thread(count: int) -> dict:
+    """
+    单线程写入
+    """
+    return _run(lambda latencies: _produce(latencies, count, log.info), count)
+
+
+def bench_multi_thread(count: int, threads: int = 4) -> dict:
+    """
+    多线程并发写入
+    """
+
+    def producer(latencies: List[int]):
+        per_thread = count // threads
+        results = [[] for _ in range(threads)]
+        workers = [
+            Thread(
+                target=_produce,
+                args=(results[i], per_thread, log.info, i * per_thread),
+            )
+            for i in range(threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        for result in results:
+            latencies.extend(result)
+
+    return _run(producer, count // threads * threads)
+
+
+def bench_event_loop(count: int) -> dict:
+    """
+    协程环境中写入
+    """
+
+    async def produce(latencies: List[int]):
+        _produce(latencies, count, log.info)
+
+    return _run(lambda latencies: run(produce(latencies)), count)
+
+
+def bench_rotation(count: int) -> dict:
+    """
+    高负载下的日志滚动（单个文件 1 MB）
+    """
+    original_size = log_settings.LOG_MAX_FILE_SIZE
+    log_settings.LOG_MAX_FILE_SIZE = 1
+    NonBlockingFileHandler._rotating_handlers.clear()
+    try:
+        padding = "x" * 200
+        return _run(
+            lambda latencies: _produce(
+                latencies, count, lambda msg, i: log.info(f"{msg} {padding}", i)
+            ),
+            count,
+        )
+    finally:
+        log_settings.LOG_MAX_FILE_SIZE = original_size
+        NonBlockingFileHandler._rotating_handlers.clear()
+
+
+def bench_handler(count: int) -> dict:
+    """
+    直接调用 NonBlockingFileHandler 写入（不经过 LoggerManager）
+    """
+    handler = NonBlockingFileHandler()
+    file_path = log_settings.LOG_PATH / "handler.log"
+    return _run(
+        lambda latencies: _produce(
+            latencies,
+            count,
+            lambda msg, i: handler.write_log("INFO", msg % i, file_path),
+        ),
+        count,
+    )
+
+
+def run_all(count: int, threads: int) -> dict:
+    """
+    在临时目录中运行全部场景
+
+    :param count: 每个场景的日志条数
+    :param threads: 多线程场景的线程数
+    :return: 全部场景结果
+    """
+    original_dir = log_settings.CONFIG_DIR
+    with TemporaryDirectory() as temp_dir:
+        log_settings.CONFIG_DIR = temp_dir
+        NonBlockingFileHandler._rotating_handlers.clear()
+        log.update_loggers()
+        LoggerManager._state.console.disabled = True
+        try:
+            results = {
+                "meta": {
+                    "python": python_version(),
+                    "messages": count,
+                    "threads": threads,
+                    "async_mode": log_settings.ASYNC_FILE_MODE,
+                    "overflow": log_settings.ASYNC_FILE_OVERFLOW,
+                    "flush_policy": log_settings.LOG_FLUSH_POLICY,
+                    "ring_size": log_settings.LOG_RING_SIZE,
+                    "ring_level": log_settings.LOG_RING_LEVEL,
+                },
+                "caller": bench_caller(count),
+                "filtered": bench_filtered(count),
+                "single_thread": bench_single_thread(count),
+                "multi_thread": bench_multi_thread(count, threads),
+                "event_loop": bench_event_loop(count),
+                "rotation": bench_rotation(count),
+                "handler": bench_handler(count),
+            }
+        finally:
+            log.drain(timeout=60)
+            LoggerManager._state.console.disabled = False
+            for handler in NonBlockingFileHandler._rotating_handlers.values():
+                handler.close()
+            NonBlockingFileHandler._rotating_handlers.clear()
+            log_settings.CONFIG_DIR = original_dir
+            log.update_loggers()
+    return results
+
+
+def main():
+    """
+    主函数
+    """
+    parser = ArgumentParser(description="日志性能基准测试")
+    parser.add_argument("-n", "--messages", type=int, default=50000)
+    parser.add_argument("-t", "--threads", type=int, default=4)
+    parser.add_argument("-o", "--output", type=Path, help="结果输出文件（JSON）")
+    args = parser.parse_args()
+
+    results = run_all(args.messages, args.threads)
+
+    print(f"调用者解析（旧版）: {results['caller']['legacy_ns']:.0f} ns/次")
+    print(f"调用者解析（缓存）: {results['caller']['cached_ns']:.0f} ns/次")
+    print(f"过滤级别日志: {results['filtered']['filtered_ns']:.0f} ns/次")
+    for name in (
+        "single_thread",
+        "multi_thread",
+        "event_loop",
+        "rotation",
+        "handler",
+    ):
+        result = results[name]
+        print(
+            f"{name:<14} {result['messages_per_second']:>10.0f} 条/秒  "
+            f"p50={result['p50_us']:.1f}us  p99={result['p99_us']:.1f}us  "
+            f"丢弃={result['dropped']}  转交={result['spilled']}"
+        )
+
+    if args.output:
+        args.output.write_bytes(dumps(results, option=OPT_INDENT_2))
+        print(f"结果已保存至 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
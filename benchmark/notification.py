@@ -0,0 +1,664 @@
+from argparse import ArgumentParser
+from asyncio import new_event_loop, run_coroutine_threadsafe
+from collections import Counter
+from concurrent.futures import wait
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from platform import python_version
+from socket import socket
+from socketserver import StreamRequestHandler, ThreadingTCPServer
+from tempfile import TemporaryDirectory
+from threading import Event, Lock, Thread
+from time import perf_counter, sleep
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from apprise.plugins.bark import NotifyBark
+from apprise.plugins.dingtalk import NotifyDingTalk
+from apprise.plugins.email import NotifyEmail
+from apprise.plugins.gotify import NotifyGotify
+from apprise.plugins.pushdeer import NotifyPushDeer
+from apprise.plugins.pushme import NotifyPushMe
+from apprise.plugins.pushplus import NotifyPushplus
+from apprise.plugins.serverchan import NotifyServerChan
+from apprise.plugins.slack import NotifySlack
+from apprise.plugins.telegram import NotifyTelegram
+from apprise.plugins.wecombot import NotifyWeComBot
+from orjson import OPT_INDENT_2, dumps, loads
+from websockets import connect
+
+from internal.config import configer
+from internal.config.notification import NotificationConfig
+from internal.core.notification import (
+    NotificationManager,
+    notification_dispatcher,
+    notification_metrics,
+)
+from internal.core.notification.external.dglab import dglab_manager
+from internal.core.notification.spool import NotificationSpool
+
+SINK_HOST = "127.0.0.1"
+
+# 参与测试的通知方式（桌面通知依赖系统环境，不参与测试）
+BENCH_METHODS = [
+    "pushplus",
+    "bark",
+    "gotify",
+    "dingtalk",
+    "mailto",
+    "pushme",
+    "pushdeer",
+    "schan",
+    "tgram",
+    "slack",
+    "wecombot",
+    "dglab",
+]
+
+# 固定地址的渠道：(插件, 属性) -> 本地接收端路径，路径首段即通知方式
+SINK_ENDPOINTS = {
+    (NotifyPushplus, "notify_url"): "/pushplus/send",
+    (NotifyDingTalk, "notify_url"): "/dingtalk/robot/send?access_token={token}",
+    (NotifyPushMe, "notify_url"): "/pushme/",
+    (NotifyServerChan, "notify_url"): "/schan/{token}.send",
+    (NotifySlack, "webhook_url"): "/slack/services",
+    (NotifyTelegram, "notify_url"): "/tgram/bot",
+    (NotifyWeComBot, "notify_url"): "/wecombot/send?key={key}",
+}
+
+# 可自定义主机的渠道使用插件自身的路径
+SINK_ROUTES = {"push": "bark", "message": "pushdeer"}
+
+# 各渠道的请求限速（Apprise 默认同一渠道两次请求至少间隔数秒）
+THROTTLED_PLUGINS = (
+    NotifyBark,
+    NotifyDingTalk,
+    NotifyEmail,
+    NotifyGotify,
+    NotifyPushDeer,
+    NotifyPushMe,
+    NotifyPushplus,
+    NotifyServerChan,
+    NotifySlack,
+    NotifyTelegram,
+    NotifyWeComBot,
+)
+
+# 同时满足各渠道成功判断的响应（Slack Webhook 只接受纯文本 ok）
+SINK_RESPONSE = dumps({"ok": True, "code": 0, "errcode": 0, "result": {}})
+SINK_RESPONSES = {"slack": b"ok"}
+
+
+def _free_port() -> int:
+    """
+    获取本地空闲端口
+
+    :return: 端口
+    """
+    with socket() as sock:
+        sock.bind((SINK_HOST, 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until(condition: Callable[[], bool], timeout: float) -> bool:
+    """
+    等待条件成立
+
+    :param condition: 条件
+    :param timeout: 最长等待时间（秒）
+    :return: 条件是否成立
+    """
+    deadline = perf_counter() + timeout
+    while not condition():
+        if perf_counter() >= deadline:
+            return False
+        sleep(0.01)
+    return True
+
+
+def _summary(samples: List[float]) -> dict:
+    """
+    统计耗时分布
+
+    :param samples: 耗时（毫秒）
+    :return: 平均值、中位数、95 分位数与最大值
+    """
+    if not samples:
+        return {"avg": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    ordered = sorted(samples)
+    return {
+        "avg": sum(ordered) / len(ordered),
+        "p50": ordered[int(0.5 * (len(ordered) - 1))],
+        "p95": ordered[int(0.95 * (len(ordered) - 1))],
+        "max": ordered[-1],
+    }
+
+
+class _HTTPHandler(BaseHTTPRequestHandler):
+    """
+    HTTP 推送接口 - 按路径首段记录渠道，统一返回成功
+    """
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        segment = urlsplit(self.path).path.strip("/").split("/")[0]
+        protocol = SINK_ROUTES.get(segment, segment)
+        self.server.sink.receive(protocol)
+
+        body = SINK_RESPONSES.get(protocol, SINK_RESPONSE)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _SMTPHandler(StreamRequestHandler):
+    """
+    SMTP 服务 - 接受任意认证与收件人，每封邮件记录一次
+    """
+
+    def reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.reply("220 localhost ESMTP")
+        for raw in self.rfile:
+            command = raw.decode(errors="ignore").strip().split(" ")[0].upper()
+            if command in ("EHLO", "HELO"):
+                self.wfile.write(b"250-localhost\r\n250-AUTH PLAIN LOGIN\r\n250 OK\r\n")
+            elif command == "AUTH":
+                self.reply("235 OK")
+            elif command in ("MAIL", "RCPT", "RSET", "NOOP"):
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                for line in self.rfile:
+                    if line in (b".\r\n", b".\n"):
+                        break
+                self.server.sink.receive("mailto")
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Not implemented")
+
+
+class NotificationSink:
+    """
+    本地通知接收端 - 代替各推送服务的 HTTP 接口与 SMTP 服务器，统计各渠道收到的通知
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """
+        :param latency: 模拟的服务端处理耗时（秒）
+        """
+        self.latency = latency
+        self._counts: Counter = Counter()
+        self._lock = Lock()
+        self._http = ThreadingHTTPServer((SINK_HOST, 0), _HTTPHandler)
+        self._smtp = ThreadingTCPServer((SINK_HOST, 0), _SMTPHandler)
+        for server in (self._http, self._smtp):
+            server.daemon_threads = True
+            server.sink = self
+
+    @property
+    def http_port(self) -> int:
+        return self._http.server_address[1]
+
+    @property
+    def smtp_port(self) -> int:
+        return self._smtp.server_address[1]
+
+    def start(self):
+        """
+        启动接收端
+        """
+        for server in (self._http, self._smtp):
+            Thread(target=server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        """
+        停止接收端
+        """
+        for server in (self._http, self._smtp):
+            server.shutdown()
+            server.server_close()
+
+    def receive(self, protocol: str):
+        """
+        记录收到的通知
+
+        :param protocol: 通知方式
+        """
+        if self.latency:
+            sleep(self.latency)
+        with self._lock:
+            self._counts[protocol] += 1
+
+    def counts(self) -> Dict[str, int]:
+        """
+        各渠道收到的通知数量
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self):
+        """
+        清空统计
+        """
+        with self._lock:
+            self._counts.clear()
+
+
+class FakeDGLabApp:
+    """
+    模拟 DG-Lab App - 连接本地 DGLab WebSocket 服务并完成绑定，统计收到的强度指令
+    """
+
+    def __init__(self, port: int):
+        """
+        :param port: DGLab WebSocket 服务端口
+        """
+        self.port = port
+        self.received = 0
+        self._bound = Event()
+        self._loop = new_event_loop()
+        self._thread = Thread(
+            target=self._loop.run_until_complete, args=(self._run(),), daemon=True
+        )
+        self._websocket = None
+
+    def start(self, timeout: float = 10.0) -> bool:
+        """
+        连接并等待绑定完成
+
+        :param timeout: 最长等待时间（秒）
+        :return: 是否绑定成功
+        """
+        self._thread.start()
+        return self._bound.wait(timeout) and _wait_until(dglab_manager.status, timeout)
+
+    def stop(self):
+        """
+        断开连接
+        """
+        if self._websocket is not None:
+            run_coroutine_threadsafe(self._websocket.close(), self._loop).result(5)
+        self._thread.join(timeout=5)
+
+    async def _run(self):
+        async with connect(f"ws://{SINK_HOST}:{self.port}") as websocket:
+            self._websocket = websocket
+            async for raw in websocket:
+                message = loads(raw)
+                if message["type"] == "bind" and message["message"] == "targetId":
+                    # 与扫描二维码后的 App 相同，请求绑定本地终端
+                    bind = {
+                        "type": "bind",
+                        "clientId": str(dglab_manager.client.client_id),
+                        "targetId": message["clientId"],
+                        "message": "DGLAB",
+                    }
+                    await websocket.send(dumps(bind).decode())
+                elif message["type"] == "bind" and message["message"] == "200":
+                    self._bound.set()
+                elif message["type"] == "msg" and message["message"].startswith(
+                    "strength-"
+                ):
+                    self.received += 1
+
+
+@contextmanager
+def redirect_channels(port: int, throttle: bool):
+    """
+    将固定地址的渠道指向本地接收端，退出时恢复
+
+    :param port: 接收端 HTTP 端口
+    :param throttle: 是否保留 Apprise 的请求限速
+    """
+    patched = {key: getattr(*key) for key in SINK_ENDPOINTS}
+    rates = {plugin: plugin.request_rate_per_sec for plugin in THROTTLED_PLUGINS}
+    try:
+        for (plugin, attr), path in SINK_ENDPOINTS.items():
+            setattr(plugin, attr, f"http://{SINK_HOST}:{port}{path}")
+        if not throttle:
+            for plugin in THROTTLED_PLUGINS:
+                plugin.request_rate_per_sec = 0
+        yield
+    finally:
+        for (plugin, attr), value in patched.items():
+            setattr(plugin, attr, value)
+        for plugin, rate in rates.items():
+            plugin.request_rate_per_sec = rate
+
+
+def build_notification(
+    sink: NotificationSink, methods: List[str], window: float = 0.0
+) -> NotificationConfig:
+    """
+    生成指向本地接收端的通知配置
+
+    :param sink: 本地接收端
+    :param methods: 通知方式
+    :param window: 合并窗口（秒）
+    :return: 通知配置
+    """
+    notification = NotificationConfig(
+        isEnable=True, methods=methods, coalesceWindow=window
+    )
+    token = "bench" * 8
+
+    notification.pushplus.token = token
+    notification.bark.token = f"{SINK_HOST}:{sink.http_port}/{token}"
+    notification.gotify.host = SINK_HOST
+    notification.gotify.port = sink.http_port
+    notification.gotify.path = "/gotify/"
+    notification.gotify.token = token
+    notification.dingtalk.token = token
+    notification.email.smtp_host = "localhost"
+    notification.email.smtp_port = sink.smtp_port
+    notification.email.smtp_user = "bench"
+    notification.email.smtp_pass = "bench"
+    notification.email.use_tls = False
+    notification.email.from_addr = "bench@example.com"
+    notification.email.to_addr = ["sink@example.com"]
+    notification.pushme.token = token
+    notification.pushdeer.host = SINK_HOST
+    notification.pushdeer.port = sink.http_port
+    notification.pushdeer.push_key = token
+    notification.serverchan.token = token
+    notification.telegram.bot_token = "123456789:bench_token"
+    notification.telegram.chat_id = "123456789"
+    notification.slack.token_a = "T1BENCH"
+    notification.slack.token_b = "B1BENCH"
+    notification.slack.token_c = token
+    notification.wecombot.bot_key = token
+    notification.dglab.pulses = ["呼吸"]
+    notification.dglab.interval = 0
+
+    # 失败直接计入结果，避免退避重试干扰耗时
+    for protocol in methods:
+        notification.channel(protocol).retries = 0
+    return notification
+
+
+def _received(sink: NotificationSink, app: Optional[FakeDGLabApp]) -> Dict[str, int]:
+    """
+    各渠道实际收到的通知数量
+
+    :param sink: 本地接收端
+    :param app: 模拟 App
+    :return: 通知方式 -> 数量
+    """
+    received = sink.counts()
+    if app is not None:
+        received["dglab"] = app.received
+    return received
+
+
+def _collect(
+    sink: NotificationSink,
+    app: Optional[FakeDGLabApp],
+    methods: List[str],
+    expected: int,
+) -> dict:
+    """
+    等待各渠道收齐通知并汇总送达与发送统计
+
+    :param sink: 本地接收端
+    :param app: 模拟 App
+    :param methods: 通知方式
+    :param expected: 每个渠道应收到的数量
+    :return: 送达数量、缺失数量与各渠道发送统计
+    """
+    # DGLab 指令异步发出，发送完成后稍等 App 收齐
+    _wait_until(
+        lambda: all(_received(sink, app).get(m, 0) >= expected for m in methods), 5.0
+    )
+    received = _received(sink, app)
+    return {
+        "received": {m: received.get(m, 0) for m in methods},
+        "missing": {
+            m: expected - received.get(m, 0)
+            for m in methods
+            if received.get(m, 0) < expected
+        },
+        "channels": notification_metrics.to_dict()["channels"],
+    }
+
+
+def _use(
+    notification: NotificationConfig,
+    sink: NotificationSink,
+    app: Optional[FakeDGLabApp],
+):
+    """
+    切换通知配置并清空统计（仅发布快照，不写入配置文件）
+    """
+    configer.notification = notification
+    sink.reset()
+    if app is not None:
+        app.received = 0
+    notification_metrics.reset()
+
+
+def bench_latency(
+    sink: NotificationSink,
+    app: Optional[FakeDGLabApp],
+    methods: List[str],
+    rounds: int,
+) -> dict:
+    """
+    扇出耗时：逐条推送并等待全部渠道完成
+
+    :param sink: 本地接收端
+    :param app: 模拟 App
+    :param methods: 通知方式
+    :param rounds: 推送次数
+    :return: 单次推送耗时分布与各渠道统计
+    """
+    _use(build_notification(sink, methods), sink, app)
+    samples, failed = [], 0
+    for _ in range(rounds):
+        start = perf_counter()
+        report = NotificationManager.push().result()
+        samples.append((perf_counter() - start) * 1000)
+        failed += not report.success
+    return {"push_ms": _summary(samples), "failed": failed} | _collect(
+        sink, app, methods, rounds
+    )
+
+
+def bench_throughput(
+    sink: NotificationSink,
+    app: Optional[FakeDGLabApp],
+    methods: List[str],
+    count: int,
+) -> dict:
+    """
+    吞吐量：连续提交一批推送，统计提交耗时与全部送达耗时
+
+    :param sink: 本地接收端
+    :param app: 模拟 App
+    :param methods: 通知方式
+    :param count: 推送数量（超出分发队列容量的推送会被拒绝）
+    :return: 提交耗时、完成耗时、吞吐量与各渠道统计
+    """
+    _use(build_notification(sink, methods), sink, app)
+    start = perf_counter()
+    futures = [NotificationManager.push() for _ in range(count)]
+    submitted = perf_counter() - start
+    wait(futures)
+    elapsed = perf_counter() - start
+
+    accepted = sum(future.exception() is None for future in futures)
+    result = _collect(sink, app, methods, accepted)
+    deliveries = sum(result["received"].values())
+    return {
+        "submit_us": submitted / count * 1e6,
+        "elapsed_ms": elapsed * 1000,
+        "accepted": accepted,
+        "pushes_per_sec": accepted / elapsed,
+        "deliveries_per_sec": deliveries / elapsed,
+    } | result
+
+
+def bench_coalesce(
+    sink: NotificationSink,
+    app: Optional[FakeDGLabApp],
+    methods: List[str],
+    count: int,
+    window: float,
+) -> dict:
+    """
+    合并推送：合并窗口内的一批推送应只向每个渠道发送一条摘要
+
+    :param sink: 本地接收端
+    :param app: 模拟 App
+    :param methods: 通知方式
+    :param count: 推送数量
+    :param window: 合并窗口（秒）
+    :return: 完成耗时与各渠道统计
+    """
+    _use(build_notification(sink, methods, window), sink, app)
+    start = perf_counter()
+    futures = [NotificationManager.push() for _ in range(count)]
+    wait(futures)
+    elapsed = perf_counter() - start
+    return {"elapsed_ms": elapsed * 1000, "window": window} | _collect(
+        sink, app, methods, 1
+    )
+
+
+def run_all(
+    rounds: int, burst: int, window: float, latency: float, throttle: bool
+) -> dict:
+    """
+    启动本地接收端与模拟 App，在不访问外部网络的情况下运行全部场景
+
+    :param rounds: 扇出耗时的推送次数
+    :param burst: 吞吐量与合并场景的推送数量
+    :param window: 合并窗口（秒）
+    :param latency: 模拟的服务端处理耗时（秒）
+    :param throttle: 是否保留 Apprise 的请求限速
+    :return: 全部场景结果
+    """
+    sink = NotificationSink(latency)
+    sink.start()
+
+    # 本地 DGLab 服务与模拟 App，绑定失败时不测试 DGLab 渠道
+    dglab_manager._host = SINK_HOST  # noqa
+    dglab_manager._port = _free_port()  # noqa
+    dglab_manager.start()
+    app: Optional[FakeDGLabApp] = None
+    if _wait_until(lambda: dglab_manager.client is not None, 5.0):
+        app = FakeDGLabApp(dglab_manager._port)  # noqa
+        if not app.start():
+            app = None
+    methods = [m for m in BENCH_METHODS if m != "dglab" or app is not None]
+
+    configer._auto_save = False  # noqa
+    results = {
+        "meta": {
+            "python": python_version(),
+            "methods": methods,
+            "rounds": rounds,
+            "burst": burst,
+            "sink_latency_ms": latency * 1000,
+            "throttle": throttle,
+        }
+    }
+    try:
+        with TemporaryDirectory() as temp_dir, redirect_channels(
+            sink.http_port, throttle
+        ):
+            # 未送达的通知暂存至临时目录
+            spool = NotificationSpool(Path(temp_dir) / "notification.spool")
+            notification_dispatcher._spool = spool  # noqa
+
+            results["latency"] = bench_latency(sink, app, methods, rounds)
+            results["throughput"] = bench_throughput(sink, app, methods, burst)
+            results["coalesce"] = bench_coalesce(sink, app, methods, burst, window)
+
+            # 停止分发器时先发送合并器中等待的通知
+            notification_dispatcher.stop()
+    finally:
+        # DGLab 服务线程为守护线程，随进程退出
+        if app is not None:
+            app.stop()
+        sink.stop()
+    return results
+
+
+def main():
+    """
+    主函数
+    """
+    parser = ArgumentParser(description="通知扇出性能基准测试（本地模拟各推送服务）")
+    parser.add_argument("-r", "--rounds", type=int, default=20)
+    parser.add_argument("-n", "--burst", type=int, default=50)
+    parser.add_argument(
+        "-w", "--window", type=float, default=0.5, help="合并窗口（秒）"
+    )
+    parser.add_argument(
+        "-l", "--latency", type=float, default=0.0, help="模拟的服务端处理耗时（毫秒）"
+    )
+    parser.add_argument(
+        "-t", "--throttle", action="store_true", help="保留 Apprise 的请求限速"
+    )
+    parser.add_argument("-o", "--output", type=Path, help="结果输出文件（JSON）")
+    args = parser.parse_args()
+
+    results = run_all(
+        args.rounds, args.burst, args.window, args.latency / 1000, args.throttle
+    )
+
+    print(f"通知方式: {', '.join(results['meta']['methods'])}")
+    latency = results["latency"]
+    push = latency["push_ms"]
+    print(
+        f"扇出耗时  {args.rounds} 次  平均={push['avg']:.1f}ms  "
+        f"P50={push['p50']:.1f}ms  P95={push['p95']:.1f}ms  最大={push['max']:.1f}ms  "
+        f"失败={latency['failed']}次"
+    )
+    for protocol, channel in sorted(latency["channels"].items()):
+        print(
+            f"  {protocol:<10} 成功率={channel['success_rate']:.0%}  "
+            f"平均={channel['latency_avg'] * 1000:.1f}ms  "
+            f"最大={channel['latency_max'] * 1000:.1f}ms"
+        )
+    throughput = results["throughput"]
+    print(
+        f"吞吐量  接受 {throughput['accepted']}/{args.burst} 条  "
+        f"提交={throughput['submit_us']:.1f}us/条  "
+        f"完成={throughput['elapsed_ms']:.1f}ms  "
+        f"{throughput['pushes_per_sec']:.1f} 条/s  "
+        f"送达 {throughput['deliveries_per_sec']:.1f} 次/s"
+    )
+    coalesce = results["coalesce"]
+    print(
+        f"合并推送  {args.burst} 条  窗口={coalesce['window']}s  "
+        f"完成={coalesce['elapsed_ms']:.1f}ms  "
+        f"送达={sum(coalesce['received'].values())}次"
+    )
+    for label in ("latency", "throughput", "coalesce"):
+        if results[label]["missing"]:
+            print(f"  {label} 未送达: {results[label]['missing']}")
+
+    if args.output:
+        args.output.write_bytes(dumps(results, option=OPT_INDENT_2))
+        print(f"结果已保存至 {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,3 @@
-import os
 import signal
 from argparse import ArgumentParser, RawDescriptionHelpFormatter
 
@@ -9,13 +8,12 @@ from internal.util import SystemUtils, log
 
 def signal_handler(signum, frame):
     """
-    信号处理器，处理 Ctrl+C 等中断信号
+    信号处理器，处理 Ctrl+C 等中断信号（中断主线程，由 main 执行退出流程）
 
     :param signum: 信号编号
     :param frame: 当前堆栈帧
     """
-    log.info("收到退出信号，正在安全退出...")
-    os._exit(0)
+    SystemUtils.request_exit(0)
 
 
 def main():
@@ -59,6 +57,9 @@ def main():
     except KeyboardInterrupt:
         log.info("用户中断，正在退出...")
         SystemUtils.exit(0)
+    except SystemExit as e:
+        log.info("收到退出信号，正在安全退出...")
+        SystemUtils.exit(e.code if isinstance(e.code, int) else 0)
     except Exception as e:
         log.error(f"程序运行出错: {e}")
         SystemUtils.exit(1)
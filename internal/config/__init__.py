@@ -1,3 +1,8 @@
 from internal.config.manager import ConfigManager
+from internal.config.snapshot import ConfigSnapshot
+from internal.util import SystemUtils
 
-configer = ConfigManager()
+configer = ConfigManager(cache=True)
+SystemUtils.add_exit_hook(configer.on_exit)
+
+__all__ = ["ConfigManager", "ConfigSnapshot", "configer"]
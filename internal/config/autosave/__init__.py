@@ -1,4 +1,6 @@
 from internal.config.autosave.base import AutoSaveConfig
+from internal.config.autosave.context import ConfigContext
 from internal.config.autosave.list import AutoSaveList
+from internal.config.autosave.scheduler import SaveScheduler
 
-__all__ = ["AutoSaveConfig", "AutoSaveList"]
+__all__ = ["AutoSaveConfig", "AutoSaveList", "ConfigContext", "SaveScheduler"]
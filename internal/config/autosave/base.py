@@ -1,42 +1,56 @@
-from typing import TYPE_CHECKING, Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, PrivateAttr
 
+from internal.config.autosave.context import ConfigContext
 from internal.config.autosave.list import AutoSaveList
 
-if TYPE_CHECKING:
-    from internal.config.manager import ConfigManager
-
 
 class AutoSaveConfig(BaseModel):
     """
     自动保存配置基类
     """
 
-    _parent_config: Optional["ConfigManager"] = PrivateAttr(default=None)
+    _context: Optional[ConfigContext] = PrivateAttr(default=None)
 
-    def _should_save(self) -> bool:
+    def model_post_init(self, __context: Any) -> None:
         """
-        判断是否应该触发保存
+        创建配置上下文，并关联直接子配置（子配置在自身构造时已完成关联）
         """
-        parent = getattr(self, "_parent_config", None)
-        return (
-            parent is not None
-            and hasattr(parent, "_auto_save")
-            and parent._auto_save
-            and hasattr(parent, "_initialized")
-            and parent._initialized
-        )
+        self._context = ConfigContext()
+        for name in type(self).model_fields:
+            value = self.__dict__.get(name)
+            if isinstance(value, list):
+                value = self._adopt_list(value)
+                self.__dict__[name] = value
+            else:
+                self._adopt(value)
+
+    def _adopt(self, value: Any) -> None:
+        """
+        将子配置的上下文关联至自身
+        """
+        if isinstance(value, AutoSaveConfig) and value._context is not None:
+            value._context.parent = self._context
+
+    def _adopt_list(self, value: list) -> AutoSaveList:
+        """
+        将列表包装为自动保存列表，并关联其中的子配置
+        """
+        if isinstance(value, AutoSaveList):
+            value._context = self._context
+        else:
+            value = AutoSaveList(value, context=self._context)
+        for item in value:
+            self._adopt(item)
+        return value
 
     def _trigger_save(self):
         """
-        触发父级配置保存
+        触发所属配置保存（由配置管理器合并后延迟写入）
         """
-        if self._should_save():
-            try:
-                self._parent_config.save()
-            except Exception:
-                pass
+        if self._context is not None:
+            self._context.request_save()
 
     def __setattr__(self, name: str, value) -> None:
         """
@@ -46,24 +60,17 @@ class AutoSaveConfig(BaseModel):
             super().__setattr__(name, value)
             return
 
+        if self._context is not None:
+            self._context.check()
+
         old_value = getattr(self, name, None)
 
         if isinstance(value, list):
-            if not isinstance(value, AutoSaveList):
-                parent = getattr(self, "_parent_config", None)
-                value = AutoSaveList(value, parent=parent)
+            value = self._adopt_list(value)
+        else:
+            self._adopt(value)
 
         super().__setattr__(name, value)
 
-        parent = getattr(self, "_parent_config", None)
-        if isinstance(value, BaseModel) and hasattr(value, "_parent_config"):
-            if parent is not None:
-                object.__setattr__(value, "_parent_config", parent)
-        elif isinstance(value, list):
-            for item in value:
-                if isinstance(item, BaseModel) and hasattr(item, "_parent_config"):
-                    if parent is not None:
-                        object.__setattr__(item, "_parent_config", parent)
-
         if old_value != value:
             self._trigger_save()
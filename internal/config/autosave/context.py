@@ -0,0 +1,86 @@
+from typing import TYPE_CHECKING, Optional
+from weakref import ref
+
+if TYPE_CHECKING:
+    from internal.config.manager import ConfigManager
+
+
+class ConfigContext:
+    """
+    配置上下文
+
+    每个自动保存配置对象持有一个上下文，上下文只记录直接上级的上下文，
+    顶层分组的上下文记录分组名称与所属的配置管理器（弱引用）。
+    挂载子树时只需修改子树根节点的上下文，无需遍历整棵配置树。
+    """
+
+    __slots__ = ("parent", "name", "_owner", "_frozen", "__weakref__")
+
+    def __init__(self, parent: Optional["ConfigContext"] = None):
+        self.parent = parent
+        self.name: Optional[str] = None
+        self._owner = None
+        self._frozen = False
+
+    def __reduce__(self):
+        """
+        序列化时不包含配置管理器与只读标记
+        """
+        return self.__class__, (self.parent,)
+
+    @property
+    def owner(self) -> Optional["ConfigManager"]:
+        """
+        直接所属的配置管理器（仅顶层分组）
+        """
+        return self._owner() if self._owner is not None else None
+
+    @owner.setter
+    def owner(self, manager: Optional["ConfigManager"]) -> None:
+        self._owner = ref(manager) if manager is not None else None
+
+    @property
+    def root(self) -> "ConfigContext":
+        """
+        顶层分组的上下文（查找深度为配置的嵌套层数）
+        """
+        context = self
+        while context.parent is not None:
+            context = context.parent
+        return context
+
+    @property
+    def manager(self) -> Optional["ConfigManager"]:
+        """
+        所属的配置管理器
+        """
+        return self.root.owner
+
+    @property
+    def frozen(self) -> bool:
+        """
+        是否只读（属于已发布的配置快照）
+        """
+        return self.root._frozen
+
+    def freeze(self) -> None:
+        """
+        将整棵配置树标记为只读
+        """
+        self._frozen = True
+
+    def check(self) -> None:
+        """
+        检查是否允许修改
+        """
+        if self.root._frozen:
+            raise TypeError("配置快照为只读，请修改 configer 中的配置")
+
+    def request_save(self) -> None:
+        """
+        通知所属的配置管理器配置已修改（由配置管理器发布快照并合并写入）
+        """
+        root = self.root
+        manager = root.owner
+        if manager is not None and manager._initialized:
+            manager.request_save(root.name)
@@ -1,7 +1,6 @@
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 
-if TYPE_CHECKING:
-    from internal.config.manager import ConfigManager
+from internal.config.autosave.context import ConfigContext
 
 T = TypeVar("T")
 
@@ -12,67 +11,80 @@ class AutoSaveList(list, Generic[T]):
     """
 
     def __init__(
-        self, items: list[T] | None = None, parent: "ConfigManager | None" = None
+        self, items: list[T] | None = None, context: Optional[ConfigContext] = None
     ):
         super().__init__(items or [])
-        self._parent_config: ConfigManager | None = parent
+        self._context: Optional[ConfigContext] = context
+
+    def __reduce__(self):
+        """
+        序列化为列表内容与所属上下文
+        """
+        return self.__class__, (list(self), self._context)
+
+    def _check(self):
+        """
+        检查是否允许修改（已发布快照中的列表为只读）
+        """
+        if self._context is not None:
+            self._context.check()
 
     def _save(self):
         """
-        触发父级配置保存
+        触发所属配置保存（由配置管理器合并后延迟写入）
         """
-        parent = self._parent_config
-        if (
-            parent is not None
-            and hasattr(parent, "_auto_save")
-            and parent._auto_save
-            and hasattr(parent, "_initialized")
-            and parent._initialized
-        ):
-            try:
-                parent.save()
-            except Exception:
-                pass
+        if self._context is not None:
+            self._context.request_save()
 
     def append(self, item: T) -> None:
+        self._check()
         super().append(item)
         self._save()
 
     def extend(self, iterable: list[T]) -> None:
+        self._check()
         super().extend(iterable)
         self._save()
 
     def insert(self, index: int, item: T) -> None:
+        self._check()
         super().insert(index, item)
         self._save()
 
     def remove(self, item: T) -> None:
+        self._check()
         super().remove(item)
         self._save()
 
     def pop(self, index: int = -1) -> T:
+        self._check()
         result = super().pop(index)
         self._save()
         return result
 
     def clear(self) -> None:
+        self._check()
         super().clear()
         self._save()
 
     def __setitem__(self, index: int | slice, value: T | list[T]) -> None:
+        self._check()
         super().__setitem__(index, value)
         self._save()
 
     def __delitem__(self, index: int | slice) -> None:
+        self._check()
         super().__delitem__(index)
         self._save()
 
     def __iadd__(self, other: list[T]) -> "AutoSaveList[T]":
+        self._check()
         result = super().__iadd__(other)
         self._save()
         return result  # noqa
 
     def __imul__(self, n: int) -> "AutoSaveList[T]":
+        self._check()
         result = super().__imul__(n)
         self._save()
         return result  # noqa
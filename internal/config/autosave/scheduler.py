@@ -0,0 +1,72 @@
+from threading import Condition, Thread
+from time import monotonic
+from typing import Callable, Optional
+
+
+class SaveScheduler:
+    """
+    保存调度器 - 合并短时间内的多次保存请求，静默期结束后只执行一次
+    """
+
+    def __init__(self, callback: Callable[[], None], delay: float = 0.5):
+        """
+        :param callback: 静默期结束后执行的保存函数
+        :param delay: 静默期（秒）
+        """
+        self._callback = callback
+        self._delay = delay
+        self._condition = Condition()
+        self._due: Optional[float] = None
+        self._thread: Optional[Thread] = None
+
+    @property
+    def delay(self) -> float:
+        """
+        静默期（秒）
+        """
+        return self._delay
+
+    @property
+    def pending(self) -> bool:
+        """
+        是否有待执行的保存
+        """
+        return self._due is not None
+
+    def schedule(self) -> None:
+        """
+        请求保存（重新开始计算静默期）
+        """
+        with self._condition:
+            self._due = monotonic() + self._delay
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._run, name="ConfigSaver", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def cancel(self) -> None:
+        """
+        取消待执行的保存
+        """
+        with self._condition:
+            self._due = None
+            self._condition.notify()
+
+    def _run(self) -> None:
+        """
+        后台调度线程（空闲时阻塞等待，不占用 CPU）
+        """
+        while True:
+            with self._condition:
+                while self._due is None:
+                    self._condition.wait()
+                remaining = self._due - monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                self._due = None
+
+            try:
+                self._callback()
+            except Exception:
+                pass
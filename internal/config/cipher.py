@@ -0,0 +1,192 @@
+from functools import lru_cache
+from io import BytesIO
+from os import urandom
+from typing import BinaryIO
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.hashes import SHA256
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+# 加密文件头：标识(4) + 版本(1) + 盐(16) + 随机数(12)，文件尾为认证标签(16)
+CIPHER_MAGIC = b"ZKCE"
+CIPHER_VERSION = 2
+SALT_SIZE = 16
+NONCE_SIZE = 12
+TAG_SIZE = 16
+HEADER_SIZE = len(CIPHER_MAGIC) + 1 + SALT_SIZE + NONCE_SIZE
+
+# 版本 1 的密钥派生迭代次数（仅用于读取旧文件）与流式处理块大小
+LEGACY_KDF_ITERATIONS = 200000
+CHUNK_SIZE = 64 * 1024
+KDF_INFO = b"zako-config"
+
+
+@lru_cache(maxsize=8)
+def derive_key(secret: str, salt: bytes, version: int = CIPHER_VERSION) -> bytes:
+    """
+    派生加密密钥（进程内缓存，同一密钥与盐只计算一次）
+
+    密钥原文为设备标识而非口令，密钥拉伸不能增加安全性，使用 HKDF 单次派生；
+    版本 1 的文件使用 PBKDF2 派生。
+
+    :param secret: 密钥原文（设备标识）
+    :param salt: 盐
+    :param version: 加密版本
+    :return: 256 位密钥
+    """
+    if version == 1:
+        kdf = PBKDF2HMAC(
+            algorithm=SHA256(), length=32, salt=salt, iterations=LEGACY_KDF_ITERATIONS
+        )
+    else:
+        kdf = HKDF(algorithm=SHA256(), length=32, salt=salt, info=KDF_INFO)
+    return kdf.derive(secret.encode("utf-8"))
+
+
+class DecryptingReader:
+    """
+    解密读取流 - 按块解密，读取结束时校验认证标签
+    """
+
+    def __init__(self, stream: BinaryIO, decryptor, size: int):
+        """
+        :param stream: 已定位至密文起始位置的文件流
+        :param decryptor: 解密器
+        :param size: 密文长度
+        """
+        self._stream = stream
+        self._decryptor = decryptor
+        self._remaining = size
+        self._finalized = False
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        读取并解密
+
+        :param size: 读取长度，小于 0 时读取全部
+        :return: 明文
+        """
+        if self._remaining <= 0:
+            return self._finalize()
+
+        length = self._remaining if size < 0 else min(size, self._remaining)
+        data = self._stream.read(length)
+        if len(data) < length:
+            raise ValueError("加密配置文件不完整")
+        self._remaining -= len(data)
+
+        plain = self._decryptor.update(data)
+        if self._remaining <= 0:
+            plain += self._finalize()
+        return plain
+
+    def _finalize(self) -> bytes:
+        """
+        结束解密并校验认证标签（标签不符时抛出异常）
+        """
+        if self._finalized:
+            return b""
+        self._finalized = True
+        try:
+            return self._decryptor.finalize()
+        except InvalidTag:
+            raise ValueError("加密配置文件校验失败（文件已损坏或来自其他设备）")
+
+
+class ConfigCipher:
+    """
+    配置加密器（AES-256-GCM，密钥由设备标识派生）
+    """
+
+    def __init__(self, secret: str):
+        """
+        :param secret: 密钥原文（设备标识）
+        """
+        self._secret = secret
+        # 写入共用一个盐（读取当前版本的文件后沿用其盐），密钥只需派生一次
+        self._salt = urandom(SALT_SIZE)
+
+    @staticmethod
+    def is_encrypted(head: bytes) -> bool:
+        """
+        根据文件头判断是否为加密格式
+
+        :param head: 文件开头的字节
+        :return: 是否为加密格式
+        """
+        return head[: len(CIPHER_MAGIC)] == CIPHER_MAGIC
+
+    def encrypt(self, data: bytes, stream: BinaryIO) -> None:
+        """
+        加密并按块写入文件流
+
+        :param data: 明文
+        :param stream: 目标文件流
+        """
+        nonce = urandom(NONCE_SIZE)
+        encryptor = Cipher(
+            algorithms.AES(derive_key(self._secret, self._salt)), modes.GCM(nonce)
+        ).encryptor()
+
+        stream.write(CIPHER_MAGIC + bytes([CIPHER_VERSION]) + self._salt + nonce)
+        view = memoryview(data)
+        for offset in range(0, len(view), CHUNK_SIZE):
+            stream.write(encryptor.update(view[offset : offset + CHUNK_SIZE]))
+        stream.write(encryptor.finalize())
+        stream.write(encryptor.tag)
+
+    def reader(self, stream: BinaryIO) -> DecryptingReader:
+        """
+        创建解密读取流
+
+        :param stream: 加密文件流（需支持定位）
+        :return: 解密读取流
+        """
+        start = stream.tell()
+        header = stream.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE or not self.is_encrypted(header):
+            raise ValueError("不是有效的加密配置文件")
+        version = header[len(CIPHER_MAGIC)]
+        if version not in (1, CIPHER_VERSION):
+            raise ValueError(f"不支持的加密版本: {version}")
+
+        salt_start = len(CIPHER_MAGIC) + 1
+        salt = header[salt_start : salt_start + SALT_SIZE]
+        nonce = header[salt_start + SALT_SIZE :]
+
+        end = stream.seek(0, 2)
+        size = end - start - HEADER_SIZE - TAG_SIZE
+        if size < 0:
+            raise ValueError("加密配置文件不完整")
+        stream.seek(end - TAG_SIZE)
+        tag = stream.read(TAG_SIZE)
+        stream.seek(start + HEADER_SIZE)
+
+        key = derive_key(self._secret, salt, version)
+        if version == CIPHER_VERSION:
+            # 之后的写入沿用该盐，无需再次派生密钥
+            self._salt = salt
+        decryptor = Cipher(algorithms.AES(key), modes.GCM(nonce, tag)).decryptor()
+        return DecryptingReader(stream, decryptor, size)
+
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """
+        加密字节串
+
+        :param data: 明文
+        :return: 密文（含文件头与认证标签）
+        """
+        buffer = BytesIO()
+        self.encrypt(data, buffer)
+        return buffer.getvalue()
+
+    def decrypt_bytes(self, data: bytes) -> bytes:
+        """
+        解密字节串
+
+        :param data: 密文（含文件头与认证标签）
+        :return: 明文
+        """
+        return self.reader(BytesIO(data)).read()
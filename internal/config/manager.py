@@ -1,18 +1,105 @@
+from contextlib import contextmanager
+from functools import lru_cache
+from hashlib import blake2b
+from hmac import compare_digest
+from hmac import new as hmac_new
 from pathlib import Path
-from typing import Any, Optional
+from threading import Lock, RLock
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Set, Tuple, Type, get_args
 
+from orjson import dumps, loads
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
-from yaml import dump, safe_load
+from yaml import dump, load
+
+try:
+    # 优先使用 LibYAML 的 C 实现
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
 
 from internal.config.account import AccountConfig
-from internal.config.autosave import AutoSaveList
+from internal.config.autosave import AutoSaveConfig, SaveScheduler
 from internal.config.buyer import BuyerConfig
+from internal.config.cipher import CIPHER_MAGIC, ConfigCipher
 from internal.config.cloud import CloudConfig
 from internal.config.notification import NotificationConfig
 from internal.config.product import ProductConfig
 from internal.config.setting import SettingConfig
+from internal.config.snapshot import CONFIG_SECTIONS, ConfigSnapshot
+from internal.config.watcher import ConfigWatcher
 from internal.util import AESUtils, DeviceUtils, SystemUtils
 
+# 配置缓存文件标识与格式版本（配置模型的变化由结构指纹判断，无需修改版本）
+CACHE_MAGIC = b"ZKCS"
+CACHE_VERSION = 5
+SCHEMA_DIGEST_SIZE = 16
+
+
+@lru_cache(maxsize=1)
+def schema_fingerprint() -> bytes:
+    """
+    配置模型结构指纹（各分组及嵌套模型的字段名称与类型），模型变化时旧缓存自动失效
+
+    :return: 指纹
+    """
+    hasher = blake2b(digest_size=SCHEMA_DIGEST_SIZE)
+    pending = [ConfigManager.model_fields[name].annotation for name in CONFIG_SECTIONS]
+    seen: Set[type] = set()
+    while pending:
+        annotation = pending.pop()
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            if annotation in seen:
+                continue
+            seen.add(annotation)
+            hasher.update(f"{annotation.__module__}.{annotation.__qualname__}".encode())
+            for name, field in annotation.model_fields.items():
+                hasher.update(f"|{name}:{field.annotation!r}".encode())
+                pending.append(field.annotation)
+        else:
+            pending.extend(get_args(annotation))
+    return hasher.digest()
+
+
+def model_of(annotation: Any) -> Optional[Type[BaseModel]]:
+    """
+    获取字段类型中的配置模型（如 List[BuyerData] 中的 BuyerData）
+
+    :param annotation: 字段类型
+    :return: 配置模型，不包含时返回 None
+    """
+    pending = [annotation]
+    while pending:
+        current = pending.pop(0)
+        if isinstance(current, type) and issubclass(current, BaseModel):
+            return current
+        pending.extend(get_args(current))
+    return None
+
+
+def construct(annotation: Any, value: Any) -> Any:
+    """
+    按字段类型由已校验的数据重建配置对象（跳过校验，嵌套模型先于上级模型创建）
+
+    :param annotation: 字段类型
+    :param value: 由 model_dump 导出的数据
+    :return: 配置对象
+    """
+    if isinstance(value, list):
+        return [construct(annotation, item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    model = model_of(annotation)
+    if model is None:
+        return {key: construct(Any, item) for key, item in value.items()}
+    return model.model_construct(
+        **{
+            name: construct(field.annotation, value[name])
+            for name, field in model.model_fields.items()
+            if name in value
+        }
+    )
+
 
 class ConfigManager(BaseModel):
     """
@@ -30,22 +117,58 @@ class ConfigManager(BaseModel):
     _machine_id: Optional[str] = PrivateAttr(default=None)
     _auto_save: bool = PrivateAttr(default=True)
     _initialized: bool = PrivateAttr(default=False)
+    _save_lock: Optional[RLock] = PrivateAttr(default=None)
+    _save_scheduler: Optional[SaveScheduler] = PrivateAttr(default=None)
+    _batch_depth: int = PrivateAttr(default=0)
+    _dirty: bool = PrivateAttr(default=False)
+    _saved_digest: Optional[str] = PrivateAttr(default=None)
+    _save_performed: int = PrivateAttr(default=0)
+    _save_skipped: int = PrivateAttr(default=0)
+    _cache: bool = PrivateAttr(default=False)
+    _cache_outdated: bool = PrivateAttr(default=False)
+    _published: Optional[ConfigSnapshot] = PrivateAttr(default=None)
+    _stale: Set[str] = PrivateAttr(default_factory=set)
+    _publish_lock: Optional[Lock] = PrivateAttr(default=None)
+    _reapply: bool = PrivateAttr(default=False)
+    _watcher: Optional[ConfigWatcher] = PrivateAttr(default=None)
+    _raw_sections: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    _cipher: Optional[ConfigCipher] = PrivateAttr(default=None)
 
     def __init__(
-        self, config_path: Optional[Path] = None, auto_save: bool = True, **data
+        self,
+        config_path: Optional[Path] = None,
+        auto_save: bool = True,
+        save_delay: float = 0.5,
+        cache: bool = False,
+        **data,
     ):
         """
         初始化配置管理器
 
         :param config_path: 配置文件路径，如果不提供则使用默认路径
         :param auto_save: 是否自动保存（更新时自动写入）
+        :param save_delay: 自动保存的静默期（秒），期间的多次修改合并为一次写入，0 表示立即写入
+        :param cache: 是否使用本机配置缓存加速启动（配置文件未变化时跳过解析与校验）
         """
         super().__init__(**data)
         self._config_path = config_path or SystemUtils.get_config_path() / "config.yaml"
         self._machine_id = DeviceUtils.get_guid()
+        self._cipher = ConfigCipher(self._machine_id)
         self._auto_save = auto_save
+        self._cache = cache
+        self._save_lock = RLock()
+        self._publish_lock = Lock()
+        self._save_scheduler = SaveScheduler(self.flush, save_delay)
+        self._watcher = ConfigWatcher(self._config_path, self._on_file_changed)
         self._initialized = True
-        self._setup_parent_refs()
+        self._attach_sections()
+        self._published = ConfigSnapshot(
+            0,
+            {
+                name: ConfigSnapshot.freeze(getattr(self, name))
+                for name in CONFIG_SECTIONS
+            },
+        )
 
     @model_validator(mode="after")
     def _mark_initialized(self):
@@ -88,48 +211,53 @@ class ConfigManager(BaseModel):
         self._auto_save = False
 
         try:
-            if not self._config_path.exists():
-                self.init_config()
-                self._apply_config()
-                return self
-
-            try:
-                with open(self._config_path, "r", encoding="utf-8") as f:
-                    content = f.read().strip()
-
-                if self.setting.isEncrypt:
-                    try:
-                        decrypted_content = AESUtils.decrypt(content, self._machine_id)
-                        config_data = safe_load(decrypted_content)
-                    except Exception:
-                        config_data = safe_load(content)
-                else:
-                    config_data = safe_load(content)
-
-                if config_data is None:
-                    config_data = {}
-
-                for key, value in config_data.items():
-                    if not hasattr(self, key):
-                        continue
-
-                    if isinstance(value, dict):
-                        config_obj = getattr(self, key)
-                        if isinstance(config_obj, BaseModel) and hasattr(
-                            config_obj, "model_validate"
-                        ):
-                            updated_obj = config_obj.model_validate(value)
-                            setattr(self, key, updated_obj)
+            # 加载期间的修改合并为一次快照发布
+            with self.batch():
+                if not self._config_path.exists():
+                    self.init_config()
+                    self._apply_config()
+                    return self
+
+                try:
+                    if self._cache and self._load_cache():
+                        self._watcher.mark(ConfigWatcher.signature(self._config_path))
+                        self._apply_config()
+                        return self
+
+                    with open(self._config_path, "rb") as f:
+                        config_data, encrypted = self._parse(f)
+
+                    for key, value in config_data.items():
+                        if not hasattr(self, key):
+                            continue
+
+                        if isinstance(value, dict):
+                            config_obj = getattr(self, key)
+                            if isinstance(config_obj, BaseModel) and hasattr(
+                                config_obj, "model_validate"
+                            ):
+                                updated_obj = config_obj.model_validate(value)
+                                setattr(self, key, updated_obj)
+                            else:
+                                setattr(self, key, value)
                         else:
                             setattr(self, key, value)
+
+                    self._apply_config()
+                    config_dict = self.model_dump(exclude_none=False)
+                    self._raw_sections = config_dict
+                    self._watcher.mark(ConfigWatcher.signature(self._config_path))
+                    # 文件格式与加密设置不一致（如旧版加密格式）时，下次保存需重新写入
+                    if encrypted == self.setting.isEncrypt:
+                        self._saved_digest = self._digest(self._serialize(config_dict))
                     else:
-                        setattr(self, key, value)
+                        self._saved_digest = None
 
-                self._setup_parent_refs()
-                self._apply_config()
+                    if self._cache:
+                        self._save_cache()
 
-            except Exception as e:
-                raise ValueError(f"配置文件加载失败: {e}")
+                except Exception as e:
+                    raise ValueError(f"配置文件加载失败: {e}")
         finally:
             self._auto_save = old_auto_save
 
@@ -137,27 +265,27 @@ class ConfigManager(BaseModel):
 
     def save(self) -> "ConfigManager":
         """
-        保存配置到文件
+        保存配置到文件（内容与上次写入完全一致时跳过）
 
         :return: 自身实例（支持链式调用）
         """
-        self._config_path.parent.mkdir(parents=True, exist_ok=True)
-
         config_dict = self.model_dump(exclude_none=False)
+        yaml_content = self._serialize(config_dict)
 
-        yaml_content = dump(
-            config_dict, default_flow_style=False, allow_unicode=True, sort_keys=False
-        )
+        digest = self._digest(yaml_content)
+        if digest == self._saved_digest and self._config_path.exists():
+            self._save_skipped += 1
+            return self
 
-        if self.setting.isEncrypt:
-            file_content = AESUtils.encrypt(yaml_content, self._machine_id)
-        else:
-            file_content = yaml_content
+        self._config_path.parent.mkdir(parents=True, exist_ok=True)
 
         temp_path = self._config_path.with_suffix(self._config_path.suffix + ".tmp")
         try:
-            with open(temp_path, "w", encoding="utf-8") as f:
-                f.write(file_content)
+            with open(temp_path, "wb") as f:
+                if self.setting.isEncrypt:
+                    self._cipher.encrypt(yaml_content.encode("utf-8"), f)
+                else:
+                    f.write(yaml_content.encode("utf-8"))
 
             temp_path.replace(self._config_path)
         except Exception as e:
@@ -165,20 +293,362 @@ class ConfigManager(BaseModel):
                 temp_path.unlink()
             raise RuntimeError(f"配置文件保存失败: {e}")
 
+        self._saved_digest = digest
+        self._raw_sections = config_dict
+        self._save_performed += 1
+        self._watcher.mark(ConfigWatcher.signature(self._config_path))
+        # 缓存在退出时更新，避免每次保存重复写入
+        self._cache_outdated = self._cache
+
         return self
 
+    def reload(self) -> Set[str]:
+        """
+        重新加载外部修改后的配置文件（仅重新校验内容有变化的顶层分组，其余分组保持不变）
+
+        :return: 已更新的配置分组
+        """
+        with self._save_lock:
+            self._watcher.mark(ConfigWatcher.signature(self._config_path))
+            try:
+                with open(self._config_path, "rb") as f:
+                    config_data, encrypted = self._parse(f)
+            except Exception as e:
+                raise ValueError(f"配置文件加载失败: {e}")
+
+            current = self._raw_sections
+            if current is None:
+                current = self.model_dump(exclude_none=False)
+
+            changed = {}
+            for name in CONFIG_SECTIONS:
+                value = config_data.get(name)
+                if not isinstance(value, dict) or value == current.get(name):
+                    continue
+                changed[name] = type(getattr(self, name)).model_validate(value)
+
+            if not changed:
+                return set()
+
+            old_auto_save = self._auto_save
+            self._auto_save = False
+            try:
+                with self.batch():
+                    for name, section in changed.items():
+                        setattr(self, name, section)
+            finally:
+                self._auto_save = old_auto_save
+
+            config_dict = self.model_dump(exclude_none=False)
+            self._raw_sections = config_dict
+            # 存在尚未写入的本地修改时，下次保存需写入合并后的配置
+            if self._dirty or encrypted != self.setting.isEncrypt:
+                self._saved_digest = None
+            else:
+                self._saved_digest = self._digest(self._serialize(config_dict))
+                self._cache_outdated = self._cache
+
+            return set(changed)
+
+    def _on_file_changed(self) -> None:
+        """
+        配置文件被外部修改时重新加载
+        """
+        from internal.util.logger import log
+
+        try:
+            changed = self.reload()
+        except Exception as e:
+            log.error(f"重新加载配置失败: {e}")
+            return
+
+        if changed:
+            log.info(f"已重新加载配置: {', '.join(sorted(changed))}")
+
+    def _parse(self, stream: BinaryIO) -> Tuple[Dict[str, Any], bool]:
+        """
+        解析配置文件内容（根据文件头区分加密与明文，只解析一次）
+
+        :param stream: 配置文件流
+        :return: 配置数据，以及文件是否为加密格式
+        """
+        head = stream.read(len(CIPHER_MAGIC))
+        if ConfigCipher.is_encrypted(head):
+            stream.seek(0)
+            return load(self._cipher.reader(stream), Loader=SafeLoader) or {}, True
+
+        content = (head + stream.read()).decode("utf-8").strip()
+
+        # 兼容旧版加密格式（无文件头）
+        if self.setting.isEncrypt:
+            try:
+                content = AESUtils.decrypt(content, self._machine_id)
+            except Exception:
+                pass
+
+        return load(content, Loader=SafeLoader) or {}, False
+
+    def _serialize(self, config_dict: Optional[Dict[str, Any]] = None) -> str:
+        """
+        序列化配置为 YAML 文本
+
+        :param config_dict: 配置数据，不提供则导出当前配置
+        """
+        if config_dict is None:
+            config_dict = self.model_dump(exclude_none=False)
+
+        return dump(
+            config_dict,
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        )
+
+    @property
+    def _cache_path(self) -> Path:
+        """
+        配置缓存文件路径
+        """
+        return self._config_path.with_name(self._config_path.name + ".cache")
+
+    def _sign_cache(self, payload: bytes) -> bytes:
+        """
+        使用本机标识对缓存签名，防止加载被篡改或来自其他设备的缓存
+        """
+        return hmac_new(self._machine_id.encode("utf-8"), payload, "sha256").digest()
+
+    def _source_digest(self) -> bytes:
+        """
+        按块计算配置文件内容摘要
+        """
+        hasher = blake2b(digest_size=16)
+        with open(self._config_path, "rb") as f:
+            while chunk := f.read(64 * 1024):
+                hasher.update(chunk)
+        return hasher.digest()
+
+    def _save_cache(self) -> None:
+        """
+        保存配置缓存（与配置文件内容绑定，失败时忽略）
+        """
+        try:
+            stat = self._config_path.stat()
+            # 使用 JSON 保存已校验的数据，加载缓存不会执行任何代码
+            payload = dumps(
+                {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "source": self._source_digest().hex(),
+                    "digest": self._saved_digest,
+                    "sections": {
+                        name: getattr(self, name).model_dump()
+                        for name in CONFIG_SECTIONS
+                    },
+                }
+            )
+            # 加密模式下缓存同样加密保存
+            if self.setting.isEncrypt:
+                payload = self._cipher.encrypt_bytes(payload)
+
+            header = CACHE_MAGIC + bytes([CACHE_VERSION, self.setting.isEncrypt])
+            header += schema_fingerprint()
+            temp_path = self._cache_path.with_name(self._cache_path.name + ".tmp")
+            temp_path.write_bytes(header + self._sign_cache(payload) + payload)
+            temp_path.replace(self._cache_path)
+            self._cache_outdated = False
+        except Exception:
+            self._cache_path.unlink(missing_ok=True)
+
+    def _load_cache(self) -> bool:
+        """
+        从配置缓存加载（配置模型结构与配置文件大小、修改时间、内容摘要均一致时生效）
+
+        :return: 是否加载成功
+        """
+        try:
+            data = self._cache_path.read_bytes()
+        except OSError:
+            return False
+
+        try:
+            header_size = len(CACHE_MAGIC) + 2 + SCHEMA_DIGEST_SIZE
+            if (
+                data[: len(CACHE_MAGIC)] != CACHE_MAGIC
+                or data[len(CACHE_MAGIC)] != CACHE_VERSION
+                or data[len(CACHE_MAGIC) + 2 : header_size] != schema_fingerprint()
+            ):
+                return False
+            encrypted = bool(data[len(CACHE_MAGIC) + 1])
+            signature = data[header_size : header_size + 32]
+            payload = data[header_size + 32 :]
+            if not compare_digest(signature, self._sign_cache(payload)):
+                return False
+
+            if encrypted:
+                payload = self._cipher.decrypt_bytes(payload)
+            cache = loads(payload)
+
+            stat = self._config_path.stat()
+            if (
+                cache["size"] != stat.st_size
+                or cache["mtime_ns"] != stat.st_mtime_ns
+                or cache["source"] != self._source_digest().hex()
+            ):
+                return False
+
+            for name in CONFIG_SECTIONS:
+                annotation = ConfigManager.model_fields[name].annotation
+                setattr(self, name, construct(annotation, cache["sections"][name]))
+            # 重建的配置对象不共用缓存数据中的列表与字典，可直接作为重新加载时的比较基准
+            self._raw_sections = cache["sections"]
+            self._saved_digest = cache["digest"]
+            return True
+        except Exception:
+            return False
+
+    def _digest(self, yaml_content: str) -> str:
+        """
+        计算配置内容摘要（包含加密设置，切换加密时需重新写入）
+
+        :param yaml_content: YAML 文本
+        :return: 摘要
+        """
+        hasher = blake2b(yaml_content.encode("utf-8"), digest_size=16)
+        hasher.update(b"\x01" if self.setting.isEncrypt else b"\x00")
+        return hasher.hexdigest()
+
+    @property
+    def save_stats(self) -> Dict[str, int]:
+        """
+        保存统计（实际写入次数与因内容未变化而跳过的次数）
+        """
+        return {"performed": self._save_performed, "skipped": self._save_skipped}
+
     def update(self, **kwargs):
         """
         更新配置并自动保存
 
         :param kwargs: 要更新的配置项
         """
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        with self.batch():
+            for key, value in kwargs.items():
+                if hasattr(self, key):
+                    setattr(self, key, value)
 
-        if self._auto_save:
-            self.save()
+            if self._auto_save:
+                self.request_save()
+
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        获取最新的配置快照（只读，后台线程可无锁读取）
+
+        修改后首次读取时才为已修改的分组创建只读副本，连续多次修改只复制一次；
+        批量修改事务进行中返回事务开始前的快照。
+
+        :return: 配置快照
+        """
+        if self._stale:
+            self._publish()
+        return self._published
+
+    def request_save(self, section: Optional[str] = None) -> None:
+        """
+        提交修改：标记快照需要更新，并请求自动保存（合并短时间内的多次修改，静默期结束后只写入一次）
+
+        :param section: 被修改的配置分组，不提供则视为全部分组
+        """
+        with self._save_lock:
+            with self._publish_lock:
+                self._stale.update(CONFIG_SECTIONS if section is None else (section,))
+            if section in (None, "setting"):
+                self._reapply = True
+            if self._auto_save:
+                self._dirty = True
+            if self._batch_depth > 0:
+                return
+            self._commit()
+            if not self._auto_save:
+                return
+            if self._save_scheduler.delay <= 0:
+                self.flush()
+            else:
+                self._save_scheduler.schedule()
+
+    def flush(self) -> "ConfigManager":
+        """
+        立即写入尚未保存的修改
+
+        :return: 自身实例（支持链式调用）
+        """
+        with self._save_lock:
+            self._save_scheduler.cancel()
+            if not self._dirty:
+                return self
+            self._dirty = False
+            try:
+                self.save()
+            except Exception:
+                pass
+        return self
+
+    @contextmanager
+    def batch(self) -> Iterator["ConfigManager"]:
+        """
+        批量修改事务：期间的修改不触发保存，结束时统一写入一次
+
+        用法::
+
+            with configer.batch():
+                configer.buyer.buyer = selected_buyers
+                configer.buyer.count = len(selected_buyers)
+        """
+        with self._save_lock, self._publish_lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._save_lock:
+                with self._publish_lock:
+                    self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._commit()
+                    if self._dirty:
+                        self.flush()
+
+    def _commit(self) -> None:
+        """
+        修改提交后的处理：系统配置有修改时重新应用（快照在读取时更新）
+        """
+        if self._reapply:
+            self._reapply = False
+            self._apply_config()
+
+    def _publish(self) -> None:
+        """
+        为已修改的配置分组创建只读副本并发布新版本快照（批量修改事务进行中不发布）
+        """
+        with self._publish_lock:
+            if not self._stale or self._batch_depth > 0:
+                return
+            sections = {
+                name: ConfigSnapshot.freeze(getattr(self, name)) for name in self._stale
+            }
+            self._stale.clear()
+            self._published = self._published.replace(sections)
+
+    def on_exit(self, code: int) -> None:
+        """
+        退出钩子：写入尚未保存的修改，并更新配置缓存
+
+        :param code: 退出码
+        """
+        self._watcher.stop()
+        self.flush()
+        with self._save_lock:
+            # 仅在内存中的配置与配置文件一致时更新缓存
+            if self._cache_outdated and not self._dirty and self._saved_digest:
+                self._save_cache()
 
     def _apply_config(self):
         """
@@ -192,86 +662,44 @@ class ConfigManager(BaseModel):
         except Exception:
             pass
 
-    def _setup_parent_refs(self):
+        if self._watcher is not None:
+            if self.setting.isWatch:
+                self._watcher.start()
+            else:
+                self._watcher.stop()
+
+    def _attach_sections(self):
         """
-        为所有嵌套配置对象设置父级引用
+        将顶层配置分组关联至自身（子配置通过上下文逐级查找，无需遍历）
         """
-        if not self._initialized:
-            return
+        for name in CONFIG_SECTIONS:
+            self._attach(name, getattr(self, name, None))
 
-        for attr_name in [
-            "setting",
-            "account",
-            "buyer",
-            "notification",
-            "product",
-            "cloud",
-        ]:
-            if hasattr(self, attr_name):
-                config_obj = getattr(self, attr_name)
-                self._setup_refs_recursive(config_obj, self)
-
-    def _setup_refs_recursive(self, obj: Any, parent: "ConfigManager"):
-        """
-        递归设置父级引用
-        """
-        if isinstance(obj, BaseModel) and hasattr(obj, "_parent_config"):
-            object.__setattr__(obj, "_parent_config", parent)
-            for field_name in obj.model_fields.keys():
-                field_value = getattr(obj, field_name, None)
-                if isinstance(field_value, list) and not isinstance(
-                    field_value, AutoSaveList
-                ):
-                    auto_save_list = AutoSaveList(field_value, parent=parent)
-                    object.__setattr__(obj, field_name, auto_save_list)
-                    field_value = auto_save_list
-                self._setup_refs_recursive(field_value, parent)
-
-        elif isinstance(obj, list):
-            if isinstance(obj, AutoSaveList):
-                object.__setattr__(obj, "_parent_config", parent)
-            for item in obj:
-                self._setup_refs_recursive(item, parent)
+    def _attach(self, name: str, value: Any) -> None:
+        """
+        将配置分组关联至自身
+        """
+        if isinstance(value, AutoSaveConfig) and value._context is not None:
+            value._context.parent = None
+            value._context.name = name
+            value._context.owner = self
 
     def __setattr__(self, name: str, value: Any) -> None:
         """
         设置属性并处理自动保存
         """
-        old_value = (
-            getattr(self, name, None)
-            if hasattr(self, "_initialized") and self._initialized
-            else None
-        )
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+            return
 
-        if self._initialized and isinstance(value, list):
-            if not isinstance(value, AutoSaveList):
-                value = AutoSaveList(value, parent=self)
+        old_value = getattr(self, name, None) if self._initialized else None
 
         super().__setattr__(name, value)
 
         if self._initialized:
-            if isinstance(value, BaseModel) and hasattr(value, "_parent_config"):
-                object.__setattr__(value, "_parent_config", self)
-                self._setup_refs_recursive(value, self)
-            elif isinstance(value, AutoSaveList):
-                object.__setattr__(value, "_parent_config", self)
-
-        if (
-            self._initialized
-            and name == "setting"
-            and isinstance(value, SettingConfig)
-            and old_value != value
-        ):
-            self._apply_config()
+            self._attach(name, value)
+            if old_value is not value and isinstance(old_value, AutoSaveConfig):
+                old_value._context.owner = None
 
-        if (
-            self._auto_save
-            and self._initialized
-            and name
-            not in ("_config_path", "_machine_id", "_auto_save", "_initialized")
-            and old_value != value
-        ):
-            try:
-                self.save()
-            except Exception:
-                pass
+        if self._initialized and old_value != value:
+            self.request_save(name)
@@ -1,17 +1,29 @@
-from typing import List, Literal, Optional, Union
+from typing import ClassVar, Dict, List, Literal, Optional, Union
 
 from pydantic import Field
 
 from internal.config.autosave import AutoSaveConfig
 
 
-class DesktopConfig(AutoSaveConfig):
+class NotificationChannelConfig(AutoSaveConfig):
+    """
+    通知渠道配置基类
+    """
+
+    timeout: float = Field(default=10.0, gt=0, description="发送超时时间（秒）")
+    retries: int = Field(default=2, ge=0, le=10, description="发送失败时的重试次数")
+    min_interval: float = Field(
+        default=0.0, ge=0, description="两次发送之间的最小间隔（秒）"
+    )
+
+
+class DesktopConfig(NotificationChannelConfig):
     """
     桌面通知配置
     """
 
 
-class PushplusConfig(AutoSaveConfig):
+class PushplusConfig(NotificationChannelConfig):
     """
     PushPlus 配置
     """
@@ -19,7 +31,7 @@ class PushplusConfig(AutoSaveConfig):
     token: str = Field(default="", description="PushPlus Token")
 
 
-class BarkConfig(AutoSaveConfig):
+class BarkConfig(NotificationChannelConfig):
     """
     Bark 配置
     """
@@ -30,7 +42,7 @@ class BarkConfig(AutoSaveConfig):
     )
 
 
-class GotifyConfig(AutoSaveConfig):
+class GotifyConfig(NotificationChannelConfig):
     """
     Gotify 配置
     """
@@ -42,7 +54,7 @@ class GotifyConfig(AutoSaveConfig):
     use_tls: bool = Field(default=False, description="是否使用 TLS/SSL")
 
 
-class DingtalkConfig(AutoSaveConfig):
+class DingtalkConfig(NotificationChannelConfig):
     """
     钉钉配置
     """
@@ -50,7 +62,7 @@ class DingtalkConfig(AutoSaveConfig):
     token: str = Field(default="", description="钉钉 Token")
 
 
-class EmailConfig(AutoSaveConfig):
+class EmailConfig(NotificationChannelConfig):
     """
     Email 配置
     """
@@ -66,7 +78,7 @@ class EmailConfig(AutoSaveConfig):
     )
 
 
-class PushmeConfig(AutoSaveConfig):
+class PushmeConfig(NotificationChannelConfig):
     """
     PushMe 配置
     """
@@ -74,7 +86,7 @@ class PushmeConfig(AutoSaveConfig):
     token: str = Field(default="", description="PushMe Token")
 
 
-class PushdeerConfig(AutoSaveConfig):
+class PushdeerConfig(NotificationChannelConfig):
     """
     PushDeer 配置
     """
@@ -87,7 +99,7 @@ class PushdeerConfig(AutoSaveConfig):
     use_tls: bool = Field(default=False, description="是否使用 SSL/TLS")
 
 
-class ServerchanConfig(AutoSaveConfig):
+class ServerchanConfig(NotificationChannelConfig):
     """
     ServerChan 配置
     """
@@ -95,7 +107,7 @@ class ServerchanConfig(AutoSaveConfig):
     token: str = Field(default="", description="ServerChan Token")
 
 
-class TelegramConfig(AutoSaveConfig):
+class TelegramConfig(NotificationChannelConfig):
     """
     Telegram 配置
     """
@@ -104,7 +116,7 @@ class TelegramConfig(AutoSaveConfig):
     chat_id: str = Field(default="", description="Telegram Chat ID")
 
 
-class SlackConfig(AutoSaveConfig):
+class SlackConfig(NotificationChannelConfig):
     """
     Slack 配置
     """
@@ -123,7 +135,7 @@ class SlackConfig(AutoSaveConfig):
     oauth_token: str = Field(default="", description="Slack OAuth Token（OAuth 方式）")
 
 
-class WecombotConfig(AutoSaveConfig):
+class WecombotConfig(NotificationChannelConfig):
     """
     WeCom Bot 配置
     """
@@ -131,11 +143,13 @@ class WecombotConfig(AutoSaveConfig):
     bot_key: str = Field(default="", description="WeCom Bot Key")
 
 
-class DglabConfig(AutoSaveConfig):
+class DglabConfig(NotificationChannelConfig):
     """
     DGLab 配置
     """
 
+    # 需等待全部波形播放完毕，默认超时时间较长
+    timeout: float = Field(default=30.0, gt=0, description="发送超时时间（秒）")
     pulses: List[
         Literal[
             "呼吸",
@@ -169,6 +183,23 @@ class NotificationConfig(AutoSaveConfig):
     通知配置
     """
 
+    # 通知方式 (protocol) 与渠道配置字段的对应关系
+    CHANNEL_FIELDS: ClassVar[Dict[str, str]] = {
+        "desktop": "desktop",
+        "pushplus": "pushplus",
+        "bark": "bark",
+        "gotify": "gotify",
+        "dingtalk": "dingtalk",
+        "mailto": "email",
+        "pushme": "pushme",
+        "pushdeer": "pushdeer",
+        "schan": "serverchan",
+        "tgram": "telegram",
+        "slack": "slack",
+        "wecombot": "wecombot",
+        "dglab": "dglab",
+    }
+
     isEnable: bool = Field(default=False, description="是否启用通知")
     methods: List[
         Literal[
@@ -190,6 +221,11 @@ class NotificationConfig(AutoSaveConfig):
         default_factory=list,
         description="通知方式 (protocol)",
     )
+    coalesceWindow: float = Field(
+        default=0.0,
+        ge=0,
+        description="合并窗口（秒），窗口内的多条通知按渠道合并为一条摘要，0 为不合并",
+    )
 
     desktop: DesktopConfig = Field(
         default_factory=DesktopConfig,
@@ -243,3 +279,12 @@ class NotificationConfig(AutoSaveConfig):
         default_factory=DglabConfig,
         description="DGLab 配置",
     )
+
+    def channel(self, protocol: str) -> NotificationChannelConfig:
+        """
+        获取通知方式对应的渠道配置
+
+        :param protocol: 通知方式 (protocol)
+        :return: 渠道配置
+        """
+        return getattr(self, self.CHANNEL_FIELDS[protocol])
@@ -0,0 +1,77 @@
+from copy import deepcopy
+from typing import Dict, Mapping
+
+from internal.config.account import AccountConfig
+from internal.config.autosave import AutoSaveConfig
+from internal.config.buyer import BuyerConfig
+from internal.config.cloud import CloudConfig
+from internal.config.notification import NotificationConfig
+from internal.config.product import ProductConfig
+from internal.config.setting import SettingConfig
+
+# 配置顶层分组
+CONFIG_SECTIONS = ("setting", "account", "buyer", "notification", "product", "cloud")
+
+
+class ConfigSnapshot:
+    """
+    配置快照
+
+    配置管理器在修改后首次读取时发布的只读副本，后台线程读取 ``configer.snapshot()``
+    即可获得一致的配置，无需加锁。未修改的分组在相邻版本间共享同一对象，
+    可通过 ``is`` 判断分组是否变化。
+    """
+
+    __slots__ = ("version", *CONFIG_SECTIONS)
+
+    version: int
+    setting: SettingConfig
+    account: AccountConfig
+    buyer: BuyerConfig
+    notification: NotificationConfig
+    product: ProductConfig
+    cloud: CloudConfig
+
+    def __init__(self, version: int, sections: Mapping[str, AutoSaveConfig]):
+        """
+        初始化配置快照
+
+        :param version: 版本号（每次发布递增）
+        :param sections: 各配置分组的只读副本
+        """
+        object.__setattr__(self, "version", version)
+        for name in CONFIG_SECTIONS:
+            object.__setattr__(self, name, sections[name])
+
+    def __setattr__(self, name: str, value) -> None:
+        raise TypeError("配置快照为只读，请修改 configer 中的配置")
+
+    def __delattr__(self, name: str) -> None:
+        raise TypeError("配置快照为只读，请修改 configer 中的配置")
+
+    def __repr__(self) -> str:
+        return f"ConfigSnapshot(version={self.version})"
+
+    @staticmethod
+    def freeze(section: AutoSaveConfig) -> AutoSaveConfig:
+        """
+        创建配置分组的只读副本（与原分组及配置管理器无关联）
+
+        :param section: 配置分组
+        :return: 只读副本
+        """
+        # 使用同一 memo 复制字段与上下文，保证子配置的上下文仍指向副本
+        copied = deepcopy(section)
+        copied._context.freeze()
+        return copied
+
+    def replace(self, sections: Dict[str, AutoSaveConfig]) -> "ConfigSnapshot":
+        """
+        以新的分组副本创建下一版本快照，其余分组沿用当前版本
+
+        :param sections: 已修改分组的只读副本
+        :return: 新快照
+        """
+        merged = {name: getattr(self, name) for name in CONFIG_SECTIONS}
+        merged.update(sections)
+        return ConfigSnapshot(self.version + 1, merged)
@@ -0,0 +1,97 @@
+from pathlib import Path
+from threading import Event, Thread
+from typing import Callable, Optional, Tuple
+
+# 文件签名（修改时间, 大小）
+FileSignature = Tuple[int, int]
+
+
+class ConfigWatcher:
+    """
+    配置文件监听器 - 定时比较文件修改时间与大小，发现变化时执行回调
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        callback: Callable[[], None],
+        interval: float = 1.0,
+    ):
+        """
+        :param path: 配置文件路径
+        :param callback: 文件变化时执行的回调（在监听线程中执行）
+        :param interval: 检查间隔（秒）
+        """
+        self._path = path
+        self._callback = callback
+        self._interval = interval
+        self._signature: Optional[FileSignature] = None
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    @staticmethod
+    def signature(path: Path) -> Optional[FileSignature]:
+        """
+        获取文件签名
+
+        :param path: 文件路径
+        :return: 文件签名，文件不存在时返回 None
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @property
+    def running(self) -> bool:
+        """
+        是否正在监听
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def mark(self, signature: Optional[FileSignature]) -> None:
+        """
+        记录已知的文件签名（自身写入后调用，避免重复加载）
+
+        :param signature: 文件签名
+        """
+        self._signature = signature
+
+    def start(self) -> None:
+        """
+        开始监听
+        """
+        if self.running:
+            return
+        if self._signature is None:
+            self._signature = self.signature(self._path)
+        # 每次启动使用新的停止标记，避免与尚未退出的旧线程共用
+        self._stop = Event()
+        self._thread = Thread(
+            target=self._run, args=(self._stop,), name="ConfigWatcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        停止监听（监听线程在当前检查间隔结束后退出，无需等待）
+        """
+        self._stop.set()
+        self._thread = None
+
+    def _run(self, stop: Event) -> None:
+        """
+        后台监听线程
+
+        :param stop: 停止标记
+        """
+        while not stop.wait(self._interval):
+            signature = self.signature(self._path)
+            if signature is None or signature == self._signature:
+                continue
+            self._signature = signature
+            try:
+                self._callback()
+            except Exception:
+                pass
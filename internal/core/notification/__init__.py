@@ -1,4 +1,25 @@
+from internal.core.notification.coalescer import (
+    NotificationCoalescer,
+    notification_coalescer,
+)
 from internal.core.notification.content import NotificationContent
+from internal.core.notification.dispatcher import (
+    NotificationDispatcher,
+    notification_dispatcher,
+)
 from internal.core.notification.manager import NotificationManager
+from internal.core.notification.metrics import NotificationMetrics, notification_metrics
+from internal.core.notification.result import NotificationReport, NotificationResult
 
-__all__ = ["NotificationManager", "NotificationContent"]
+__all__ = [
+    "NotificationManager",
+    "NotificationContent",
+    "NotificationCoalescer",
+    "NotificationDispatcher",
+    "NotificationMetrics",
+    "NotificationReport",
+    "NotificationResult",
+    "notification_coalescer",
+    "notification_dispatcher",
+    "notification_metrics",
+]
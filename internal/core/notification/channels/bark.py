@@ -1,6 +1,6 @@
-from apprise import Apprise
+from typing import Optional
 
-from internal.config import configer
+from internal.config.notification import NotificationConfig
 from internal.core.notification.channels.base import AppriseNotificationChannel
 
 
@@ -12,11 +12,12 @@ class Bark(AppriseNotificationChannel):
     protocol = "bark"
 
     @classmethod
-    def add(cls, queue: Apprise) -> bool:
+    def build(cls, notification: NotificationConfig) -> Optional[str]:
         """
-        添加至队列
+        生成推送地址
 
-        :return bool: 添加成功与否
+        :param notification: 通知配置
+        :return: 推送地址，配置不完整时返回 None
 
         :template:
             "{schema}://{host}/{targets}"
@@ -24,16 +25,13 @@ class Bark(AppriseNotificationChannel):
             "{schema}://{user}:{password}@{host}/{targets}"
             "{schema}://{user}:{password}@{host}:{port}/{targets}"
         """
-        if cls.protocol not in configer.notification.methods:
-            return False
+        if not notification.bark.token:
+            return None
 
-        if not configer.notification.bark.token:
-            return False
-
-        url = f"{cls.protocol}://{configer.notification.bark.token}"
+        url = f"{cls.protocol}://{notification.bark.token}"
         params = {
-            "level": configer.notification.bark.level,
+            "level": notification.bark.level,
         }
         url = f"{url}?{'&'.join([f'{k}={v}' for k, v in params.items()])}"
 
-        return queue.add(url)
+        return url
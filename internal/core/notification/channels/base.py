@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
 from collections import deque
-from typing import ClassVar
+from typing import ClassVar, Optional
 
 from apprise import Apprise
 
-from internal.core.notification import NotificationContent
+from internal.config.notification import NotificationConfig
+from internal.core.notification.content import NotificationContent
 
 
 class BaseNotificationChannel(ABC):
@@ -35,15 +36,29 @@ class AppriseNotificationChannel(BaseNotificationChannel):
 
     @classmethod
     @abstractmethod
-    def add(cls, queue: Apprise) -> bool:
+    def build(cls, notification: NotificationConfig) -> Optional[str]:
+        """
+        生成推送地址
+
+        :param notification: 通知配置
+        :return: 推送地址，配置不完整时返回 None
+        """
+        pass
+
+    @classmethod
+    def add(cls, queue: Apprise, notification: NotificationConfig) -> bool:
         """
         添加至队列
 
         :param queue: Apprise实例
+        :param notification: 通知配置
 
         :return bool: 添加成功与否
         """
-        pass
+        url = cls.build(notification)
+        if not url:
+            return False
+        return queue.add(url)
 
 
 class ExternalNotificationChannel(BaseNotificationChannel):
@@ -1,9 +1,7 @@
 from platform import system
-from typing import ClassVar
+from typing import ClassVar, Optional
 
-from apprise import Apprise
-
-from internal.config import configer
+from internal.config.notification import NotificationConfig
 from internal.core.notification.channels.base import AppriseNotificationChannel
 
 
@@ -21,18 +19,18 @@ class Desktop(AppriseNotificationChannel):
     }
 
     @classmethod
-    def add(cls, queue: Apprise) -> bool:
+    def build(cls, notification: NotificationConfig) -> Optional[str]:
         """
-        添加至队列
+        生成推送地址
 
-        :return bool: 添加成功与否
+        :param notification: 通知配置
+        :return: 推送地址，配置不完整时返回 None
 
         :template:
             "{schema}://"
         """
-        if cls.protocol not in configer.notification.methods:
-            return False
-
-        url = f"{cls.platform_map[system()]}://"
+        schema = cls.platform_map.get(system())
+        if not schema:
+            return None
 
-        return queue.add(url)
+        return f"{schema}://"
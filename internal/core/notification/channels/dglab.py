@@ -1,8 +1,8 @@
 from collections import deque
 
 from internal.config import configer
-from internal.core.notification import NotificationContent
 from internal.core.notification.channels.base import ExternalNotificationChannel
+from internal.core.notification.content import NotificationContent
 from internal.core.notification.external.dglab import dglab_manager
 from internal.error import NotificationError
 
@@ -21,7 +21,9 @@ class DGLab(ExternalNotificationChannel):
 
         :return bool: 添加成功与否
         """
-        if cls.protocol not in configer.notification.methods:
+        notification = configer.snapshot().notification
+
+        if cls.protocol not in notification.methods:
             return False
 
         queue.append(cls.protocol)
@@ -70,7 +72,9 @@ class DGLab(ExternalNotificationChannel):
         """
         发送 DGLab 通知
         """
-        if cls.protocol not in configer.notification.methods:
+        notification = configer.snapshot().notification
+
+        if cls.protocol not in notification.methods:
             return
 
         if not dglab_manager.status():
@@ -80,7 +84,7 @@ class DGLab(ExternalNotificationChannel):
         if not dglab_manager.status():
             raise NotificationError("DGLab 客户端未连接，无法发送通知")
 
-        config = configer.notification.dglab
+        config = notification.dglab
         pulses = config.pulses
         strength = config.strength
         channel_str = config.channel
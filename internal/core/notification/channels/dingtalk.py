@@ -1,6 +1,6 @@
-from apprise import Apprise
+from typing import Optional
 
-from internal.config import configer
+from internal.config.notification import NotificationConfig
 from internal.core.notification.channels.base import AppriseNotificationChannel
 
 
@@ -12,11 +12,12 @@ class DingTalk(AppriseNotificationChannel):
     protocol = "dingtalk"
 
     @classmethod
-    def add(cls, queue: Apprise) -> bool:
+    def build(cls, notification: NotificationConfig) -> Optional[str]:
         """
-        添加至队列
+        生成推送地址
 
-        :return bool: 添加成功与否
+        :param notification: 通知配置
+        :return: 推送地址，配置不完整时返回 None
 
         :template:
             "{schema}://{token}/"
@@ -24,12 +25,9 @@ class DingTalk(AppriseNotificationChannel):
             "{schema}://{secret}@{token}/"
             "{schema}://{secret}@{token}/{targets}/"
         """
-        if cls.protocol not in configer.notification.methods:
-            return False
+        if not notification.dingtalk.token:
+            return None
 
-        if not configer.notification.dingtalk.token:
-            return False
+        url = f"{cls.protocol}://{notification.dingtalk.token}"
 
-        url = f"{cls.protocol}://{configer.notification.dingtalk.token}"
-
-        return queue.add(url)
+        return url
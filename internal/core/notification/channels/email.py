@@ -1,8 +1,7 @@
+from typing import Optional
 from urllib.parse import quote
 
-from apprise import Apprise
-
-from internal.config import configer
+from internal.config.notification import NotificationConfig
 from internal.core.notification.channels.base import AppriseNotificationChannel
 
 
@@ -14,11 +13,12 @@ class Email(AppriseNotificationChannel):
     protocol = "mailto"
 
     @classmethod
-    def add(cls, queue: Apprise) -> bool:
+    def build(cls, notification: NotificationConfig) -> Optional[str]:
         """
-        添加至队列
+        生成推送地址
 
-        :return bool: 添加成功与否
+        :param notification: 通知配置
+        :return: 推送地址，配置不完整时返回 None
 
         :template:
             "{schema}://{host}"
@@ -34,26 +34,23 @@ class Email(AppriseNotificationChannel):
             "{schema}://{user}:{password}@{host}/{targets}"
             "{schema}://{user}:{password}@{host}:{port}/{targets}"
         """
-        if cls.protocol not in configer.notification.methods:
-            return False
-
-        if not configer.notification.email.smtp_host:
-            return False
+        if not notification.email.smtp_host:
+            return None
 
-        if not configer.notification.email.smtp_user:
-            return False
+        if not notification.email.smtp_user:
+            return None
 
-        if not configer.notification.email.smtp_pass:
-            return False
+        if not notification.email.smtp_pass:
+            return None
 
-        if not configer.notification.email.to_addr:
-            return False
+        if not notification.email.to_addr:
+            return None
 
-        smtp_user = configer.notification.email.smtp_user
-        smtp_pass = configer.notification.email.smtp_pass
-        smtp_host = configer.notification.email.smtp_host
-        smtp_port = configer.notification.email.smtp_port
-        use_tls = configer.notification.email.use_tls
+        smtp_user = notification.email.smtp_user
+        smtp_pass = notification.email.smtp_pass
+        smtp_host = notification.email.smtp_host
+        smtp_port = notification.email.smtp_port
+        use_tls = notification.email.use_tls
 
         # 根据是否使用 TLS/SSL 选择协议
         protocol = "mailtos" if use_tls else "mailto"
@@ -62,18 +59,18 @@ class Email(AppriseNotificationChannel):
         url = f"{protocol}://{quote(smtp_user, safe='')}:{quote(smtp_pass, safe='')}@{smtp_host}:{smtp_port}"
 
         # 添加收件人
-        to_emails = configer.notification.email.to_addr
+        to_emails = notification.email.to_addr
         if isinstance(to_emails, str):
             to_emails = [to_emails]
         to_param = ",".join(to_emails)
 
         # 添加可选参数
         params = {"to": to_param}
-        if configer.notification.email.from_addr:
-            params["from"] = configer.notification.email.from_addr
+        if notification.email.from_addr:
+            params["from"] = notification.email.from_addr
 
         # 编码参数值
         param_strings = [f"{k}={quote(str(v), safe='')}" for k, v in params.items()]
         url = f"{url}?{'&'.join(param_strings)}"
 
-        return queue.add(url)
+        return url
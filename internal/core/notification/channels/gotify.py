@@ -1,6 +1,6 @@
-from apprise import Apprise
+from typing import Optional
 
-from internal.config import configer
+from internal.config.notification import NotificationConfig
 from internal.core.notification.channels.base import AppriseNotificationChannel
 
 
@@ -12,11 +12,12 @@ class Gotify(AppriseNotificationChannel):
     protocol = "gotify"
 
     @classmethod
-    def add(cls, queue: Apprise) -> bool:
+    def build(cls, notification: NotificationConfig) -> Optional[str]:
         """
-        添加至队列
+        生成推送地址
 
-        :return bool: 添加成功与否
+        :param notification: 通知配置
+        :return: 推送地址，配置不完整时返回 None
 
         :template:
             "{schema}://{host}/{token}"
@@ -24,33 +25,30 @@ class Gotify(AppriseNotificationChannel):
             "{schema}://{host}{path}{token}"
             "{schema}://{host}:{port}{path}{token}"
         """
-        if cls.protocol not in configer.notification.methods:
-            return False
+        if not notification.gotify.token:
+            return None
 
-        if not configer.notification.gotify.token:
-            return False
+        if not notification.gotify.host:
+            return None
 
-        if not configer.notification.gotify.host:
-            return False
-
-        use_tls = configer.notification.gotify.use_tls
+        use_tls = notification.gotify.use_tls
 
         # 根据是否使用 SSL/TLS 选择协议
         protocol = "gotifys" if use_tls else "gotify"
 
-        url = f"{protocol}://{configer.notification.gotify.host}"
+        url = f"{protocol}://{notification.gotify.host}"
 
         # 如果配置了自定义主机，使用自定义主机格式
-        if configer.notification.gotify.port:
-            url += f":{configer.notification.gotify.port}"
+        if notification.gotify.port:
+            url += f":{notification.gotify.port}"
 
         # 如果配置了自定义路径，使用自定义路径格式
-        if configer.notification.gotify.path != "/":
-            url += f"{configer.notification.gotify.path}"
+        if notification.gotify.path != "/":
+            url += f"{notification.gotify.path}"
         else:
             url += "/"
 
         # 添加 Token
-        url += f"{configer.notification.gotify.token}"
+        url += f"{notification.gotify.token}"
 
-        return queue.add(url)
+        return url
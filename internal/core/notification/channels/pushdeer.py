@@ -1,6 +1,6 @@
-from apprise import Apprise
+from typing import Optional
 
-from internal.config import configer
+from internal.config.notification import NotificationConfig
 from internal.core.notification.channels.base import AppriseNotificationChannel
 
 
@@ -12,33 +12,31 @@ class PushDeer(AppriseNotificationChannel):
     protocol = "pushdeer"
 
     @classmethod
-    def add(cls, queue: Apprise) -> bool:
+    def build(cls, notification: NotificationConfig) -> Optional[str]:
         """
-        添加至队列
+        生成推送地址
 
-        :return bool: 添加成功与否
+        :param notification: 通知配置
+        :return: 推送地址，配置不完整时返回 None
 
         :template:
             "{schema}://{pushkey}"
             "{schema}://{host}/{pushkey}"
             "{schema}://{host}:{port}/{pushkey}"
         """
-        if cls.protocol not in configer.notification.methods:
-            return False
+        if not notification.pushdeer.push_key:
+            return None
 
-        if not configer.notification.pushdeer.push_key:
-            return False
-
-        push_key = configer.notification.pushdeer.push_key
-        use_ssl = configer.notification.pushdeer.use_tls
+        push_key = notification.pushdeer.push_key
+        use_ssl = notification.pushdeer.use_tls
 
         # 根据是否使用 SSL/TLS 选择协议
         protocol = "pushdeers" if use_ssl else "pushdeer"
 
         # 如果配置了自定义主机，使用自定义主机格式
-        if configer.notification.pushdeer.host:
-            host = configer.notification.pushdeer.host
-            port = configer.notification.pushdeer.port
+        if notification.pushdeer.host:
+            host = notification.pushdeer.host
+            port = notification.pushdeer.port
 
             if port:
                 url = f"{protocol}://{host}:{port}/{push_key}"
@@ -49,4 +47,4 @@ class PushDeer(AppriseNotificationChannel):
         else:
             url = f"{protocol}://{push_key}"
 
-        return queue.add(url)
+        return url
@@ -1,6 +1,6 @@
-from apprise import Apprise
+from typing import Optional
 
-from internal.config import configer
+from internal.config.notification import NotificationConfig
 from internal.core.notification.channels.base import AppriseNotificationChannel
 
 
@@ -12,21 +12,19 @@ class PushMe(AppriseNotificationChannel):
     protocol = "pushme"
 
     @classmethod
-    def add(cls, queue: Apprise) -> bool:
+    def build(cls, notification: NotificationConfig) -> Optional[str]:
         """
-        添加至队列
+        生成推送地址
 
-        :return bool: 添加成功与否
+        :param notification: 通知配置
+        :return: 推送地址，配置不完整时返回 None
 
         :template:
             "{schema}://{token}"
         """
-        if cls.protocol not in configer.notification.methods:
-            return False
+        if not notification.pushme.token:
+            return None
 
-        if not configer.notification.pushme.token:
-            return False
+        url = f"{cls.protocol}://{notification.pushme.token}"
 
-        url = f"{cls.protocol}://{configer.notification.pushme.token}"
-
-        return queue.add(url)
+        return url
@@ -1,6 +1,6 @@
-from apprise import Apprise
+from typing import Optional
 
-from internal.config import configer
+from internal.config.notification import NotificationConfig
 from internal.core.notification.channels.base import AppriseNotificationChannel
 
 
@@ -12,11 +12,12 @@ class Slack(AppriseNotificationChannel):
     protocol = "slack"
 
     @classmethod
-    def add(cls, queue: Apprise) -> bool:
+    def build(cls, notification: NotificationConfig) -> Optional[str]:
         """
-        添加至队列
+        生成推送地址
 
-        :return bool: 添加成功与否
+        :param notification: 通知配置
+        :return: 推送地址，配置不完整时返回 None
 
         :template:
             # Webhook
@@ -28,29 +29,23 @@ class Slack(AppriseNotificationChannel):
             "{schema}://{access_token}/",
             "{schema}://{access_token}/{targets}",
         """
-        if cls.protocol not in configer.notification.methods:
-            return False
-
         # Webhook 方式 (token_a, token_b, token_c)
-        if configer.notification.slack.token_a:
-            if (
-                not configer.notification.slack.token_b
-                or not configer.notification.slack.token_c
-            ):
-                return False
+        if notification.slack.token_a:
+            if not notification.slack.token_b or not notification.slack.token_c:
+                return None
 
-            token_a = configer.notification.slack.token_a
-            token_b = configer.notification.slack.token_b
-            token_c = configer.notification.slack.token_c
+            token_a = notification.slack.token_a
+            token_b = notification.slack.token_b
+            token_c = notification.slack.token_c
 
             url = f"{cls.protocol}://{token_a}/{token_b}/{token_c}"
 
         # OAuth 方式 (oauth_token)
-        elif configer.notification.slack.oauth_token:
-            oauth_token = configer.notification.slack.oauth_token
+        elif notification.slack.oauth_token:
+            oauth_token = notification.slack.oauth_token
             url = f"{cls.protocol}://{oauth_token}/"
 
         else:
-            return False
+            return None
 
-        return queue.add(url)
+        return url
@@ -1,6 +1,6 @@
-from apprise import Apprise
+from typing import Optional
 
-from internal.config import configer
+from internal.config.notification import NotificationConfig
 from internal.core.notification.channels.base import AppriseNotificationChannel
 
 
@@ -12,28 +12,26 @@ class Telegram(AppriseNotificationChannel):
     protocol = "tgram"
 
     @classmethod
-    def add(cls, queue: Apprise) -> bool:
+    def build(cls, notification: NotificationConfig) -> Optional[str]:
         """
-        添加至队列
+        生成推送地址
 
-        :return bool: 添加成功与否
+        :param notification: 通知配置
+        :return: 推送地址，配置不完整时返回 None
 
         :template:
             "{schema}://{bot_token}",
             "{schema}://{bot_token}/{targets}",
         """
-        if cls.protocol not in configer.notification.methods:
-            return False
+        if not notification.telegram.bot_token:
+            return None
 
-        if not configer.notification.telegram.bot_token:
-            return False
+        if not notification.telegram.chat_id:
+            return None
 
-        if not configer.notification.telegram.chat_id:
-            return False
-
-        bot_token = configer.notification.telegram.bot_token
-        chat_id = configer.notification.telegram.chat_id
+        bot_token = notification.telegram.bot_token
+        chat_id = notification.telegram.chat_id
 
         url = f"{cls.protocol}://{bot_token}/{chat_id}"
 
-        return queue.add(url)
+        return url
@@ -0,0 +1,246 @@
+from concurrent.futures import Future
+from functools import partial
+from threading import Condition, Lock, Thread
+from time import monotonic
+from typing import Dict, List, Optional, Set, Tuple
+
+from internal.config.notification import NotificationConfig
+from internal.core.notification.content import NotificationContent
+from internal.core.notification.dispatcher import (
+    NotificationDispatcher,
+    notification_dispatcher,
+)
+from internal.core.notification.registry import NotificationRegistry
+from internal.core.notification.result import NotificationReport
+from internal.error import NotificationError
+
+
+class PendingNotification:
+    """
+    等待合并发送的通知
+    """
+
+    __slots__ = ("content", "future", "outstanding", "report")
+
+    def __init__(self, content: NotificationContent, methods: Set[str]):
+        """
+        :param content: 通知内容
+        :param methods: 需要发送的通知方式
+        """
+        self.content = content
+        self.future: "Future[NotificationReport]" = Future()
+        # 尚未发送完成的通知方式
+        self.outstanding = set(methods)
+        # 各次摘要发送结果的汇总
+        self.report: Optional[NotificationReport] = None
+
+
+class NotificationCoalescer:
+    """
+    通知合并器
+
+    合并窗口内产生的多条通知按渠道合并为一条摘要后交给分发器发送，并保证每个渠道
+    两次发送之间不少于其最小间隔，减少短时间内的重复推送。
+    未设置合并窗口与最小间隔时直接交给分发器，不经过合并线程。
+    """
+
+    def __init__(self, dispatcher: NotificationDispatcher):
+        """
+        :param dispatcher: 通知分发器
+        """
+        self._dispatcher = dispatcher
+        # 各渠道等待发送的通知与其中第一条的加入时间
+        self._buffers: Dict[str, List[PendingNotification]] = {}
+        self._first: Dict[str, float] = {}
+        # 各渠道上次发送的时间
+        self._last_sent: Dict[str, float] = {}
+        self._condition = Condition()
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+        self._closed = False
+        # 分发器停止前发送全部等待中的通知
+        dispatcher.add_stop_hook(self.close)
+
+    @staticmethod
+    def digest(contents: List[NotificationContent]) -> NotificationContent:
+        """
+        将多条通知合并为一条摘要
+
+        :param contents: 通知内容（按产生顺序）
+        :return: 摘要
+        """
+        if len(contents) == 1:
+            return contents[0]
+        body = "\n\n".join(
+            f"[{index}] {content.title}\n{content.body}"
+            for index, content in enumerate(contents, 1)
+        )
+        return NotificationContent(
+            title=f"{contents[0].title}（{len(contents)} 条通知）", body=body
+        )
+
+    def submit(self, content: NotificationContent) -> "Future[NotificationReport]":
+        """
+        提交推送（不阻塞）
+
+        :param content: 通知内容
+        :return: 结果句柄，全部渠道发送完成后返回投递报告
+        """
+        notification, apprise_queues, external_queue = NotificationRegistry.resolve()
+        methods = [*apprise_queues, *external_queue]
+
+        with self._condition:
+            if self._closed or not self._enabled(notification, methods):
+                return self._dispatcher.submit(content)
+
+            item = PendingNotification(content, set(methods))
+            now = monotonic()
+            for method in methods:
+                buffer = self._buffers.setdefault(method, [])
+                if not buffer:
+                    self._first[method] = now
+                buffer.append(item)
+
+            self._start()
+            self._condition.notify()
+        return item.future
+
+    def flush(self) -> None:
+        """
+        立即发送全部等待中的通知（不受合并窗口与最小间隔限制）
+        """
+        with self._condition:
+            self._flush_due(force=True)
+
+    def close(self) -> None:
+        """
+        关闭合并器（等待中的通知交给分发器，由分发器发送或暂存，之后的通知不再合并）
+        """
+        with self._condition:
+            self._closed = True
+            self.flush()
+            self._condition.notify()
+
+    def _enabled(self, notification: NotificationConfig, methods: List[str]) -> bool:
+        """
+        是否需要合并（需持有锁）
+
+        :param notification: 通知配置
+        :param methods: 通知方式
+        :return: 是否需要合并
+        """
+        if not methods:
+            return False
+        # 仍有等待中的通知时继续合并，保证发送顺序
+        if self._buffers or notification.coalesceWindow > 0:
+            return True
+        return any(notification.channel(method).min_interval > 0 for method in methods)
+
+    def _start(self) -> None:
+        """
+        启动合并线程（需持有锁）
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = Thread(
+            target=self._run, name="NotificationCoalescer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        """
+        合并线程：等待至最早到期的渠道并发送
+        """
+        with self._condition:
+            while not self._closed:
+                self._condition.wait(self._flush_due())
+
+    def _flush_due(self, force: bool = False) -> Optional[float]:
+        """
+        发送已到期渠道的摘要（需持有锁）
+
+        :param force: 是否忽略合并窗口与最小间隔
+        :return: 距下一个渠道到期的时间（秒），没有等待中的通知时返回 None
+        """
+        notification = NotificationRegistry.resolve()[0]
+        now = monotonic()
+        due: Dict[str, List[PendingNotification]] = {}
+        next_due: Optional[float] = None
+
+        for method, buffer in self._buffers.items():
+            deadline = self._first[method] + notification.coalesceWindow
+            if method in self._last_sent:
+                min_interval = notification.channel(method).min_interval
+                deadline = max(deadline, self._last_sent[method] + min_interval)
+            if force or deadline <= now:
+                due[method] = buffer
+            elif next_due is None or deadline < next_due:
+                next_due = deadline
+
+        for method in due:
+            del self._buffers[method]
+            del self._first[method]
+            self._last_sent[method] = now
+
+        # 等待内容相同的渠道合并为一次推送，仍由分发器并发发送
+        groups: Dict[Tuple[int, ...], Tuple[List[PendingNotification], Set[str]]] = {}
+        for method, items in due.items():
+            key = tuple(id(item) for item in items)
+            groups.setdefault(key, (items, set()))[1].add(method)
+
+        for items, methods in groups.values():
+            future = self._dispatcher.submit(
+                self.digest([item.content for item in items]), methods
+            )
+            future.add_done_callback(partial(self._complete, items, methods))
+
+        return None if next_due is None else max(0.0, next_due - now)
+
+    def _complete(
+        self,
+        items: List[PendingNotification],
+        methods: Set[str],
+        future: "Future[NotificationReport]",
+    ) -> None:
+        """
+        摘要发送完成后汇总各通知的投递报告
+
+        :param items: 摘要包含的通知
+        :param methods: 摘要发送的通知方式
+        :param future: 摘要的结果句柄
+        """
+        if future.cancelled():
+            error = NotificationError("程序正在退出，通知已暂存")
+        else:
+            error = future.exception()
+        report = None if error else future.result()
+
+        finished = []
+        with self._lock:
+            for item in items:
+                if item.future.done() or not item.outstanding & methods:
+                    continue
+                if error is not None:
+                    item.outstanding.clear()
+                    finished.append(item)
+                    continue
+                results = [r for r in report.results if r.protocol in methods]
+                if item.report is None:
+                    item.report = report.model_copy(
+                        update={"title": item.content.title, "results": results}
+                    )
+                else:
+                    item.report.results.extend(results)
+                    item.report.finished = report.finished
+                item.outstanding -= methods
+                if not item.outstanding:
+                    finished.append(item)
+
+        for item in finished:
+            if error is not None:
+                item.future.set_exception(error)
+            else:
+                item.future.set_result(item.report)
+
+
+notification_coalescer = NotificationCoalescer(notification_dispatcher)
@@ -39,15 +39,16 @@ class NotificationContentProvider(BaseModel):
 
         :return str: 内容
         """
+        config = configer.snapshot()
         body = [
-            "账号：{}".format(PrivacyUtils.mask_phone(configer.account.account)),
-            "购票人：{}".format(",".join([b.realname for b in configer.buyer.buyer])),
+            "账号：{}".format(PrivacyUtils.mask_phone(config.account.account)),
+            "购票人：{}".format(",".join([b.realname for b in config.buyer.buyer])),
             "票档：{}".format(
                 " ".join(
                     [
-                        configer.product.ticketMain.name,
-                        configer.product.ticketType.square,
-                        configer.product.ticketType.name,
+                        config.product.ticketMain.name,
+                        config.product.ticketType.square,
+                        config.product.ticketType.name,
                     ]
                 )
             ),
@@ -0,0 +1,557 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Future
+from itertools import count
+from queue import Empty, Full, Queue
+from random import uniform
+from threading import Lock, Thread
+from time import perf_counter, time
+from typing import Awaitable, Callable, Iterable, List, Optional, Set, Tuple
+
+from internal.core.notification.channels.base import ExternalNotificationChannel
+from internal.core.notification.content import NotificationContent
+from internal.core.notification.metrics import NotificationMetrics, notification_metrics
+from internal.core.notification.registry import NotificationRegistry
+from internal.core.notification.result import NotificationReport, NotificationResult
+from internal.core.notification.spool import NotificationSpool, NotificationSpoolEntry
+from internal.error import NotificationError
+from internal.util import SystemUtils, log
+
+# 重试间隔：第 n 次重试的上限为 RETRY_BASE_DELAY * 2^(n-1)，不超过 RETRY_MAX_DELAY
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+# 重新发送暂存通知时等待队列空位的检查间隔（秒）
+REPLAY_POLL_INTERVAL = 0.5
+
+
+class DispatchTask:
+    """
+    推送任务
+    """
+
+    __slots__ = ("report", "content", "future", "methods", "remaining")
+
+    def __init__(
+        self,
+        report: NotificationReport,
+        content: NotificationContent,
+        methods: Optional[Set[str]] = None,
+    ):
+        """
+        :param report: 投递报告
+        :param content: 通知内容
+        :param methods: 发送的通知方式，为 None 时发送全部已配置的渠道
+        """
+        self.report = report
+        self.content = content
+        self.future: "Future[NotificationReport]" = Future()
+        self.methods = methods
+        # 开始发送后记录尚未完成的渠道
+        self.remaining: Optional[Set[str]] = None
+
+    def spool_entry(self) -> Optional[NotificationSpoolEntry]:
+        """
+        生成未送达渠道的暂存记录
+
+        :return: 暂存记录，没有未送达的渠道时返回 None
+        """
+        if self.remaining is not None:
+            methods = self.remaining
+        elif self.methods is not None:
+            methods = self.methods
+        else:
+            _, apprise_queues, external_queue = NotificationRegistry.resolve()
+            methods = {*apprise_queues, *external_queue}
+        if not methods:
+            return None
+        return NotificationSpoolEntry(
+            title=self.content.title,
+            body=self.content.body,
+            methods=sorted(methods),
+        )
+
+
+class NotificationDispatcher:
+    """
+    通知分发器
+
+    推送只放入有界队列并立即返回结果句柄，由后台线程并发发送各渠道，
+    调用方不会因网络请求阻塞。最近的投递报告保留在内存中供查询。
+
+    发送失败的渠道按指数退避（带随机抖动）重试，超出重试次数或退出时仍未送达的通知
+    写入暂存文件，下次启动时由后台线程逐条放回队列（队列已满时等待，不丢弃）。
+    """
+
+    def __init__(
+        self,
+        spool: NotificationSpool,
+        metrics: NotificationMetrics,
+        maxsize: int = 64,
+        workers: int = 2,
+        history: int = 100,
+    ):
+        """
+        :param spool: 未送达通知的暂存文件
+        :param metrics: 发送统计
+        :param maxsize: 队列容量（队列已满时暂存新的推送）
+        :param workers: 后台线程数量
+        :param history: 保留的投递报告数量
+        """
+        self._spool = spool
+        self._metrics = metrics
+        self._queue: "Queue[Optional[DispatchTask]]" = Queue(maxsize=maxsize)
+        self._worker_count = max(1, workers)
+        self._workers: List[Thread] = []
+        self._replayer: Optional[Thread] = None
+        self._reports: "deque[NotificationReport]" = deque(maxlen=history)
+        self._inflight: Set[DispatchTask] = set()
+        self._stop_hooks: List[Callable[[], None]] = []
+        self._ids = count(1)
+        self._lock = Lock()
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """
+        等待发送的推送数量
+        """
+        return self._queue.qsize()
+
+    def submit(
+        self, content: NotificationContent, methods: Optional[Iterable[str]] = None
+    ) -> "Future[NotificationReport]":
+        """
+        提交推送（不阻塞）
+
+        :param content: 通知内容
+        :param methods: 发送的通知方式，为 None 时发送全部已配置的渠道
+        :return: 结果句柄，完成后返回投递报告
+        """
+        task = self._task(content, methods)
+
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._start()
+
+        if closed:
+            # 退出过程中提交的推送直接暂存
+            self._spool_tasks([task])
+            task.future.set_exception(NotificationError("程序正在退出，通知已暂存"))
+            return task.future
+
+        try:
+            self._queue.put_nowait(task)
+        except Full:
+            # 队列已满时暂存（退出时合并推送的刷新也可能走到这里），下次启动时重新发送
+            log.warning("通知队列已满，暂存本次通知")
+            self._spool_tasks([task])
+            task.future.set_exception(NotificationError("通知队列已满，通知已暂存"))
+            return task.future
+
+        with self._lock:
+            self._reports.append(task.report)
+        return task.future
+
+    def replay(self) -> int:
+        """
+        重新发送暂存的未送达通知（由后台线程放入队列，不阻塞调用方）
+
+        :return: 待重新发送的数量
+        """
+        with self._lock:
+            if self._closed:
+                return 0
+            if self._replayer is not None and self._replayer.is_alive():
+                return 0
+            entries = self._spool.claim()
+            if not entries:
+                # 清理只含损坏记录的重新发送文件
+                self._spool.release([])
+                return 0
+            self._replayer = Thread(
+                target=self._replay,
+                args=(entries,),
+                name="NotificationReplay",
+                daemon=True,
+            )
+            self._replayer.start()
+        log.info(f"开始重新发送 {len(entries)} 条未送达的通知")
+        return len(entries)
+
+    def add_stop_hook(self, hook: Callable[[], None]) -> None:
+        """
+        添加停止钩子（停止前调用，用于将上游等待中的通知交给分发器）
+
+        :param hook: 钩子
+        """
+        with self._lock:
+            self._stop_hooks.append(hook)
+
+    def reports(self, limit: Optional[int] = None) -> List[NotificationReport]:
+        """
+        获取最近的投递报告（按提交顺序，未完成的报告 finished 为 None）
+
+        :param limit: 最多返回的数量
+        :return: 投递报告副本
+        """
+        with self._lock:
+            reports = list(self._reports)
+        if limit is not None:
+            reports = reports[-limit:] if limit > 0 else []
+        return [report.model_copy(deep=True) for report in reports]
+
+    def stop(self, timeout: Optional[float] = None) -> int:
+        """
+        停止分发器（等待正在发送的推送完成，其余未送达的通知写入暂存文件）
+
+        :param timeout: 等待时间（秒），为 None 时使用退出流程的剩余时间
+        :return: 暂存的推送数量
+        """
+        deadline = perf_counter() + (
+            SystemUtils.exit_remaining() if timeout is None else timeout
+        )
+        with self._lock:
+            if self._closed:
+                return 0
+            hooks, self._stop_hooks = self._stop_hooks, []
+
+        # 先发送上游等待中的通知（如合并中的摘要），使其进入队列或暂存
+        for hook in hooks:
+            try:
+                hook()
+            except Exception as e:
+                log.error(f"执行通知停止钩子失败: {e}")
+
+        with self._lock:
+            if self._closed:
+                return 0
+            self._closed = True
+            workers, self._workers = self._workers, []
+            replayer, self._replayer = self._replayer, None
+
+        # 重新发送线程在放入下一条之前退出，并写回尚未放入队列的通知
+        if replayer is not None:
+            replayer.join(max(0.0, deadline - perf_counter()))
+
+        queued = []
+        while True:
+            try:
+                task = self._queue.get_nowait()
+            except Empty:
+                break
+            if task is not None and task.future.cancel():
+                queued.append(task)
+
+        for _ in workers:
+            self._queue.put(None)
+
+        for worker in workers:
+            worker.join(max(0.0, deadline - perf_counter()))
+
+        # 超时仍在发送（或等待重试）的推送只暂存尚未成功的渠道
+        with self._lock:
+            inflight = list(self._inflight)
+            self._inflight.clear()
+        written = self._spool_tasks(queued + inflight)
+        # 已暂存的渠道不再由后台线程重复暂存
+        for task in inflight:
+            task.remaining = set()
+        return written
+
+    def on_exit(self, code: int = 0) -> None:
+        """
+        退出钩子
+
+        :param code: 退出码
+        """
+        self.stop()
+
+    def _task(
+        self, content: NotificationContent, methods: Optional[Iterable[str]]
+    ) -> DispatchTask:
+        """
+        创建推送任务
+
+        :param content: 通知内容
+        :param methods: 发送的通知方式，为 None 时发送全部已配置的渠道
+        :return: 推送任务
+        """
+        report = NotificationReport(id=next(self._ids), title=content.title)
+        return DispatchTask(
+            report, content, set(methods) if methods is not None else None
+        )
+
+    def _enqueue(self, task: DispatchTask) -> bool:
+        """
+        等待队列空位并放入推送（退出时放弃）
+
+        :param task: 推送任务
+        :return: 是否已放入队列
+        """
+        while True:
+            with self._lock:
+                if self._closed:
+                    return False
+                self._start()
+            try:
+                self._queue.put(task, timeout=REPLAY_POLL_INTERVAL)
+            except Full:
+                continue
+            with self._lock:
+                self._reports.append(task.report)
+            return True
+
+    def _replay(self, entries: List[NotificationSpoolEntry]) -> None:
+        """
+        后台线程：逐条重新提交暂存的通知，全部放入队列后才删除重新发送文件
+
+        :param entries: 暂存的通知
+        """
+        submitted = 0
+        try:
+            for entry in entries:
+                content = NotificationContent(title=entry.title, body=entry.body)
+                if not self._enqueue(self._task(content, entry.methods)):
+                    break
+                submitted += 1
+        finally:
+            try:
+                restored = self._spool.release(entries[submitted:])
+            except OSError as e:
+                # 重新发送文件保留，下次启动时再次取出
+                log.error(f"写回暂存通知失败: {e}")
+                restored = 0
+        message = f"已重新提交 {submitted} 条未送达的通知"
+        if restored:
+            message += f"，{restored} 条已写回暂存文件"
+        log.info(message)
+
+    def _spool_tasks(self, tasks: List[DispatchTask]) -> int:
+        """
+        将未送达的推送写入暂存文件
+
+        :param tasks: 推送任务
+        :return: 暂存的数量
+        """
+        entries = [entry for entry in map(DispatchTask.spool_entry, tasks) if entry]
+        try:
+            written = self._spool.append(entries)
+        except OSError as e:
+            log.error(f"暂存未送达的通知失败: {e}")
+            return 0
+        if written:
+            log.warning(f"已暂存 {written} 条未送达的通知，下次启动时重新发送")
+        return written
+
+    def _start(self) -> None:
+        """
+        启动后台线程（首次提交时启动，需持有锁）
+        """
+        if self._workers:
+            return
+        for index in range(self._worker_count):
+            worker = Thread(
+                target=self._run,
+                name=f"NotificationDispatcher-{index}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _run(self) -> None:
+        """
+        后台线程：使用独立的事件循环依次处理队列中的推送
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                task = self._queue.get()
+                if task is None:
+                    break
+                if not task.future.set_running_or_notify_cancel():
+                    continue
+                with self._lock:
+                    self._inflight.add(task)
+                try:
+                    task.report.results = loop.run_until_complete(self.dispatch(task))
+                except Exception as e:
+                    log.error(f"推送通知失败: {e}")
+                    task.future.set_exception(e)
+                    continue
+                finally:
+                    task.report.finished = time()
+                    with self._lock:
+                        self._inflight.discard(task)
+                for result in task.report.results:
+                    self._metrics.record(result)
+                self._log(task.report)
+                # 超出重试次数仍失败的渠道写入暂存文件
+                self._spool_tasks([task])
+                task.future.set_result(task.report)
+        finally:
+            # 不等待超时渠道的发送线程结束
+            loop.close()
+
+    @staticmethod
+    def _log(report: NotificationReport) -> None:
+        """
+        记录投递报告
+
+        :param report: 投递报告
+        """
+        for result in report.results:
+            if result.success:
+                message = (
+                    f"推送 {result.protocol} 通知成功，"
+                    f"耗时 {result.latency:.2f} 秒，发送 {result.attempts} 次"
+                )
+                if result.attempts > 1:
+                    message += (
+                        f"（重试耗时 {result.retry_latency:.2f} 秒，"
+                        f"退避 {result.wait:.2f} 秒）"
+                    )
+                log.info(message)
+            else:
+                log.error(
+                    f"推送 {result.protocol} 通知失败（发送 {result.attempts} 次）: "
+                    f"{result.error}"
+                )
+
+    @staticmethod
+    def backoff(attempt: int) -> float:
+        """
+        计算重试等待时间（指数退避，在上限的后一半范围内随机抖动，避免同时重试）
+
+        :param attempt: 第几次重试（从 1 开始）
+        :return: 等待时间（秒）
+        """
+        limit = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        return uniform(limit / 2, limit)
+
+    @staticmethod
+    async def _deliver(
+        protocol: str,
+        send: Callable[[], Awaitable],
+        timeout: float,
+        retries: int,
+    ) -> NotificationResult:
+        """
+        发送单个渠道，失败时退避重试（超时或出错仅影响该渠道，超时的发送结束前不重试）
+
+        :param protocol: 通知方式
+        :param send: 创建发送任务
+        :param timeout: 单次发送的超时时间（秒）
+        :param retries: 重试次数
+        :return: 发送结果
+        """
+        attempts, success, error = 0, False, None
+        # 耗时只统计最后一次发送，此前失败的发送与退避等待分开记录
+        latency = retry_latency = wait = 0.0
+        # 超时后仍在执行的发送
+        pending: Optional[asyncio.Future] = None
+        while not success and attempts <= retries:
+            if attempts:
+                retry_latency += latency
+                start = perf_counter()
+                await asyncio.sleep(NotificationDispatcher.backoff(attempts))
+                wait += perf_counter() - start
+                if pending is not None:
+                    # 线程池中的发送无法取消，结束前重试可能使同一通知送达两次
+                    if not pending.done():
+                        error = f"{error}，且上一次发送仍未结束，不再重试"
+                        break
+                    success, error = NotificationDispatcher._outcome(pending)
+                    pending = None
+                    if success:
+                        break
+            attempts += 1
+            start = perf_counter()
+            future = asyncio.ensure_future(send())
+            done, _ = await asyncio.wait({future}, timeout=timeout)
+            if done:
+                success, error = NotificationDispatcher._outcome(future)
+            else:
+                success, error = False, f"发送超时（{timeout:g} 秒）"
+                pending = future
+            latency = perf_counter() - start
+        if pending is not None and not pending.done():
+            pending.cancel()
+        return NotificationResult(
+            protocol=protocol,
+            success=success,
+            latency=latency,
+            error=error,
+            attempts=attempts,
+            retry_latency=retry_latency,
+            wait=wait,
+        )
+
+    @staticmethod
+    def _outcome(future: asyncio.Future) -> Tuple[bool, Optional[str]]:
+        """
+        获取已结束的发送结果
+
+        :param future: 发送任务
+        :return: 是否发送成功，以及失败原因
+        """
+        if future.cancelled():
+            return False, "发送已取消"
+        error = future.exception()
+        if error is not None:
+            return False, str(error) or type(error).__name__
+        # 外部渠道发送成功时无返回值，失败时抛出异常
+        if future.result() is False:
+            return False, "发送通知失败"
+        return True, None
+
+    @staticmethod
+    async def dispatch(task: DispatchTask) -> List[NotificationResult]:
+        """
+        按当前通知配置并发发送推送的各渠道（总耗时取决于最慢的渠道）
+
+        :param task: 推送任务
+        :return: 各渠道发送结果
+        """
+        loop = asyncio.get_running_loop()
+        content = task.content
+        # 通知配置未修改时复用已生成的渠道
+        notification, apprise_queues, external_queue = NotificationRegistry.resolve()
+
+        senders = {}
+        # 内置渠道由 Apprise 异步发送（在事件循环的默认线程池中执行）
+        for method, apprise_queue in apprise_queues.items():
+            senders[method] = lambda queue=apprise_queue: queue.async_notify(
+                title=content.title, body=content.body
+            )
+        # 外部渠道在线程池中发送
+        for method in external_queue:
+            channel = NotificationRegistry.get(method)
+            if channel is None or not issubclass(channel, ExternalNotificationChannel):
+                continue
+            senders[method] = lambda channel=channel: loop.run_in_executor(
+                None, channel.send, content
+            )
+
+        if task.methods is not None:
+            senders = {k: v for k, v in senders.items() if k in task.methods}
+        task.remaining = set(senders)
+
+        async def deliver(method: str) -> NotificationResult:
+            config = notification.channel(method)
+            result = await NotificationDispatcher._deliver(
+                method, senders[method], config.timeout, config.retries
+            )
+            if result.success:
+                task.remaining.discard(method)
+            return result
+
+        return list(await asyncio.gather(*map(deliver, senders)))
+
+
+notification_dispatcher = NotificationDispatcher(
+    NotificationSpool(SystemUtils.get_config_path() / "notification.spool"),
+    notification_metrics,
+)
+SystemUtils.add_exit_hook(notification_dispatcher.on_exit)
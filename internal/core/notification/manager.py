@@ -1,11 +1,13 @@
-from collections import deque
-
-from apprise import Apprise
+from concurrent.futures import Future
+from typing import Optional
 
 from internal.config import configer
-from internal.core.notification import NotificationContent, channels
 from internal.core.notification.channels.base import ExternalNotificationChannel
-from internal.error import NotificationError
+from internal.core.notification.coalescer import notification_coalescer
+from internal.core.notification.content import NotificationContent
+from internal.core.notification.dispatcher import notification_dispatcher
+from internal.core.notification.registry import NotificationRegistry
+from internal.core.notification.result import NotificationReport
 from internal.util import log
 
 
@@ -14,104 +16,53 @@ class NotificationManager:
     推送通知
     """
 
-    notify_channels = [
-        channels.Desktop,
-        channels.PushPlus,
-        channels.Bark,
-        channels.Gotify,
-        channels.DingTalk,
-        channels.Email,
-        channels.PushMe,
-        channels.PushDeer,
-        channels.ServerChan,
-        channels.Slack,
-        channels.Telegram,
-        channels.WeComBot,
-        channels.DGLab,
-    ]
+    notify_channels = list(NotificationRegistry.channels.values())
 
     @staticmethod
-    def append(apprise_queue: Apprise, external_queue: deque) -> None:
-        """
-        添加至队列
+    def push() -> Optional["Future[NotificationReport]"]:
         """
-        for channel in NotificationManager.notify_channels:
-            for method in configer.notification.methods:
-                if channel.protocol != method:
-                    continue
-
-                # 添加外部渠道
-                if channel.external:
-                    if issubclass(channel, ExternalNotificationChannel):
-                        result = channel.add(external_queue)
-                    else:
-                        log.error(f"渠道 {method} 类型错误")
-                        continue
-                # 添加内置渠道
-                else:
-                    result = channel.add(apprise_queue)
-
-                if result:
-                    log.info(f"添加 {method} 渠道成功")
-                else:
-                    log.error(f"添加 {method} 渠道失败")
+        推送通知（经合并后放入后台分发队列，立即返回，不等待发送）
 
-    @staticmethod
-    def send(apprise_queue: Apprise, external_queue: deque) -> None:
-        """
-        发送通知
+        :return: 结果句柄，完成后返回投递报告；未启用通知时返回 None
         """
-        content = NotificationContent()
-
-        # 推送内置渠道通知
-        if len(apprise_queue) > 0:
-            result = apprise_queue.notify(
-                title=content.title,
-                body=content.body,
-            )
-            if not result:
-                raise NotificationError("发送通知失败")
-
-        # 发送外部渠道通知
-        while len(external_queue) > 0:
-            method = external_queue.popleft()
-            for channel in NotificationManager.notify_channels:
-                if channel.protocol == method:
-                    if issubclass(channel, ExternalNotificationChannel):
-                        channel.send(content)
+        notification = configer.snapshot().notification
+
+        if not notification.isEnable:
+            return None
+
+        if not notification.methods:
+            log.warning("未启用任何通知方式")
+            return None
+
+        # 通知内容在提交时生成，与发送时的配置修改无关
+        return notification_coalescer.submit(NotificationContent())
 
     @staticmethod
-    def push() -> None:
+    def replay() -> int:
         """
-        推送通知
-        """
-        if not configer.notification.isEnable:
-            return
+        重新发送上次未送达的通知（后台放入队列，未启用通知时保留暂存）
 
-        if not configer.notification.methods:
-            log.warning("未启用任何通知方式")
-            return
+        :return: 待重新发送的数量
+        """
+        notification = configer.snapshot().notification
 
-        apprise_queue = Apprise()
-        external_queue = deque()
+        if not notification.isEnable or not notification.methods:
+            return 0
 
-        try:
-            NotificationManager.append(apprise_queue, external_queue)
-            NotificationManager.send(apprise_queue, external_queue)
-        except NotificationError as e:
-            log.error(f"推送通知失败: {e}")
+        return notification_dispatcher.replay()
 
     @staticmethod
     def init_external() -> None:
         """
         初始化外部通知
         """
+        methods = configer.snapshot().notification.methods
         for channel in NotificationManager.notify_channels:
             if not channel.external:
                 continue
             if not issubclass(channel, ExternalNotificationChannel):
                 continue
-            if channel.protocol not in configer.notification.methods:
+            if channel.protocol not in methods:
                 continue
             try:
                 channel.init()
@@ -124,12 +75,13 @@ class NotificationManager:
         """
         启动外部通知服务
         """
+        methods = configer.snapshot().notification.methods
         for channel in NotificationManager.notify_channels:
             if not channel.external:
                 continue
             if not issubclass(channel, ExternalNotificationChannel):
                 continue
-            if channel.protocol not in configer.notification.methods:
+            if channel.protocol not in methods:
                 continue
             try:
                 channel.start()
@@ -142,12 +94,13 @@ class NotificationManager:
         """
         等待外部通知服务连接
         """
+        methods = configer.snapshot().notification.methods
         for channel in NotificationManager.notify_channels:
             if not channel.external:
                 continue
             if not issubclass(channel, ExternalNotificationChannel):
                 continue
-            if channel.protocol not in configer.notification.methods:
+            if channel.protocol not in methods:
                 continue
             try:
                 channel.connect()
@@ -160,12 +113,13 @@ class NotificationManager:
         """
         停止外部服务
         """
+        methods = configer.snapshot().notification.methods
         for channel in NotificationManager.notify_channels:
             if not channel.external:
                 continue
             if not issubclass(channel, ExternalNotificationChannel):
                 continue
-            if channel.protocol not in configer.notification.methods:
+            if channel.protocol not in methods:
                 continue
             try:
                 channel.stop()
@@ -0,0 +1,168 @@
+from bisect import bisect_left
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from orjson import OPT_INDENT_2, dumps
+from pydantic import BaseModel, Field
+
+from internal.core.notification.result import NotificationResult
+
+# 耗时直方图分桶上限（秒），最后一个桶记录超过最大上限的发送
+LATENCY_BUCKETS: Tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class ChannelMetrics(BaseModel):
+    """
+    单个渠道的发送统计
+    """
+
+    protocol: str = Field(description="通知方式 (protocol)")
+    sent: int = Field(default=0, description="推送次数")
+    success: int = Field(default=0, description="成功次数")
+    failure: int = Field(default=0, description="失败次数")
+    attempts: int = Field(default=0, description="发送次数（含重试）")
+    latency_total: float = Field(default=0.0, description="累计耗时（秒）")
+    latency_max: float = Field(default=0.0, description="最大耗时（秒）")
+    retry_latency_total: float = Field(
+        default=0.0, description="重试前失败发送的累计耗时（秒）"
+    )
+    wait_total: float = Field(default=0.0, description="重试退避的累计等待时间（秒）")
+    buckets: List[int] = Field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1),
+        description="耗时直方图（各分桶的推送次数）",
+    )
+    last_error: Optional[str] = Field(default=None, description="最近一次失败原因")
+
+    @property
+    def success_rate(self) -> float:
+        """
+        成功率
+        """
+        return self.success / self.sent if self.sent else 0.0
+
+    @property
+    def latency_avg(self) -> float:
+        """
+        平均耗时（秒，仅统计每次推送的最后一次发送）
+        """
+        return self.latency_total / self.sent if self.sent else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        按直方图估算耗时分位数（取所在分桶的上限，不超过最大耗时）
+
+        :param q: 分位（0-1）
+        :return: 耗时（秒）
+        """
+        if not self.sent:
+            return 0.0
+        rank = q * self.sent
+        total = 0
+        for index, count in enumerate(self.buckets[: len(LATENCY_BUCKETS)]):
+            total += count
+            if total >= rank:
+                return min(LATENCY_BUCKETS[index], self.latency_max)
+        return self.latency_max
+
+    def observe(self, result: NotificationResult) -> None:
+        """
+        记录一次发送结果
+
+        :param result: 发送结果
+        """
+        self.sent += 1
+        self.attempts += result.attempts
+        if result.success:
+            self.success += 1
+        else:
+            self.failure += 1
+            self.last_error = result.error
+        self.latency_total += result.latency
+        self.latency_max = max(self.latency_max, result.latency)
+        self.buckets[bisect_left(LATENCY_BUCKETS, result.latency)] += 1
+        self.retry_latency_total += result.retry_latency
+        self.wait_total += result.wait
+
+
+class NotificationMetrics:
+    """
+    通知发送统计 - 按通知方式记录推送次数、成功率与耗时直方图
+    """
+
+    def __init__(self):
+        self._channels: Dict[str, ChannelMetrics] = {}
+        self._since = time()
+        self._lock = Lock()
+
+    def record(self, result: NotificationResult) -> None:
+        """
+        记录一次发送结果
+
+        :param result: 发送结果
+        """
+        with self._lock:
+            metrics = self._channels.get(result.protocol)
+            if metrics is None:
+                metrics = self._channels[result.protocol] = ChannelMetrics(
+                    protocol=result.protocol
+                )
+            metrics.observe(result)
+
+    def snapshot(self) -> Dict[str, ChannelMetrics]:
+        """
+        获取各渠道统计副本
+
+        :return: 通知方式 -> 渠道统计
+        """
+        with self._lock:
+            return {
+                protocol: metrics.model_copy(deep=True)
+                for protocol, metrics in sorted(self._channels.items())
+            }
+
+    def reset(self) -> None:
+        """
+        清空统计
+        """
+        with self._lock:
+            self._channels.clear()
+            self._since = time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        导出为字典（附带成功率、平均耗时与分位数）
+
+        :return: 统计数据
+        """
+        channels = {}
+        for protocol, metrics in self.snapshot().items():
+            channels[protocol] = {
+                **metrics.model_dump(),
+                "success_rate": metrics.success_rate,
+                "latency_avg": metrics.latency_avg,
+                "latency_p50": metrics.percentile(0.5),
+                "latency_p95": metrics.percentile(0.95),
+            }
+        return {
+            "since": self._since,
+            "exported": time(),
+            "buckets": list(LATENCY_BUCKETS),
+            "channels": channels,
+        }
+
+    def export(self, path: Path) -> Path:
+        """
+        导出为 JSON 文件
+
+        :param path: 文件路径
+        :return: 文件路径
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(dumps(self.to_dict(), option=OPT_INDENT_2))
+        return path
+
+
+notification_metrics = NotificationMetrics()
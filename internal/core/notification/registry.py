@@ -0,0 +1,111 @@
+from collections import deque
+from threading import Lock
+from typing import ClassVar, Dict, Optional, Tuple, Type
+
+from apprise import Apprise
+
+from internal.config import configer
+from internal.config.notification import NotificationConfig
+from internal.core.notification import channels
+from internal.core.notification.channels.base import (
+    BaseNotificationChannel,
+    ExternalNotificationChannel,
+)
+from internal.util import log
+
+
+class NotificationRegistry:
+    """
+    通知渠道注册表
+
+    按通知方式 (protocol) 索引渠道，并缓存由通知配置生成的 Apprise 实例与外部渠道列表。
+    配置快照中的通知分组未变化时直接复用，修改通知配置后在下次推送时重新生成。
+    """
+
+    channels: ClassVar[Dict[str, Type[BaseNotificationChannel]]] = {
+        channel.protocol: channel
+        for channel in (
+            channels.Desktop,
+            channels.PushPlus,
+            channels.Bark,
+            channels.Gotify,
+            channels.DingTalk,
+            channels.Email,
+            channels.PushMe,
+            channels.PushDeer,
+            channels.ServerChan,
+            channels.Slack,
+            channels.Telegram,
+            channels.WeComBot,
+            channels.DGLab,
+        )
+    }
+
+    _lock: ClassVar[Lock] = Lock()
+    _section: ClassVar[Optional[NotificationConfig]] = None
+    _apprise: ClassVar[Dict[str, Apprise]] = {}
+    _external: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def get(cls, protocol: str) -> Optional[Type[BaseNotificationChannel]]:
+        """
+        获取通知方式对应的渠道
+
+        :param protocol: 通知方式
+        :return: 渠道，不存在时返回 None
+        """
+        return cls.channels.get(protocol)
+
+    @classmethod
+    def resolve(
+        cls,
+    ) -> Tuple[NotificationConfig, Dict[str, Apprise], Tuple[str, ...]]:
+        """
+        获取当前通知配置对应的渠道（配置未变化时返回缓存，返回值不可修改）
+
+        :return: 通知配置、内置渠道（通知方式 -> Apprise 实例）与外部渠道列表
+        """
+        notification = configer.snapshot().notification
+        with cls._lock:
+            if notification is not cls._section:
+                cls._build(notification)
+            return cls._section, cls._apprise, cls._external
+
+    @classmethod
+    def _build(cls, notification: NotificationConfig) -> None:
+        """
+        生成渠道（每个内置渠道使用独立的 Apprise 实例，以便单独计时与统计结果）
+
+        :param notification: 通知配置
+        """
+        apprise_queues: Dict[str, Apprise] = {}
+        external_queue = deque()
+
+        for method in dict.fromkeys(notification.methods):
+            channel = cls.channels.get(method)
+            if channel is None:
+                log.error(f"未知的通知方式 {method}")
+                continue
+
+            # 添加外部渠道
+            if channel.external:
+                if issubclass(channel, ExternalNotificationChannel):
+                    result = channel.add(external_queue)
+                else:
+                    log.error(f"渠道 {method} 类型错误")
+                    continue
+            # 添加内置渠道
+            else:
+                apprise_queue = Apprise()
+                result = channel.add(apprise_queue, notification)
+                if result:
+                    apprise_queues[method] = apprise_queue
+
+            if result:
+                log.info(f"添加 {method} 渠道成功")
+            else:
+                log.error(f"添加 {method} 渠道失败")
+
+        cls._section = notification
+        cls._apprise = apprise_queues
+        cls._external = tuple(external_queue)
@@ -0,0 +1,41 @@
+from time import time
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class NotificationResult(BaseModel):
+    """
+    单个渠道的发送结果
+    """
+
+    protocol: str = Field(description="通知方式 (protocol)")
+    success: bool = Field(default=False, description="是否发送成功")
+    latency: float = Field(default=0.0, description="最后一次发送的耗时（秒）")
+    error: Optional[str] = Field(default=None, description="失败原因")
+    attempts: int = Field(default=1, description="发送次数（含重试）")
+    retry_latency: float = Field(
+        default=0.0, description="此前失败发送的累计耗时（秒）"
+    )
+    wait: float = Field(default=0.0, description="重试退避的累计等待时间（秒）")
+
+
+class NotificationReport(BaseModel):
+    """
+    一次推送的投递报告
+    """
+
+    id: int = Field(description="推送序号")
+    title: str = Field(default="", description="通知标题")
+    created: float = Field(default_factory=time, description="提交时间（时间戳）")
+    finished: Optional[float] = Field(default=None, description="完成时间（时间戳）")
+    results: List[NotificationResult] = Field(
+        default_factory=list, description="各渠道发送结果"
+    )
+
+    @property
+    def success(self) -> bool:
+        """
+        是否全部渠道发送成功
+        """
+        return self.finished is not None and all(r.success for r in self.results)
@@ -0,0 +1,112 @@
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Iterable, List
+
+from orjson import OPT_APPEND_NEWLINE, JSONDecodeError, dumps, loads
+from pydantic import BaseModel, Field, ValidationError
+
+from internal.util import log
+
+
+class NotificationSpoolEntry(BaseModel):
+    """
+    暂存的未送达通知
+    """
+
+    title: str = Field(description="通知标题")
+    body: str = Field(description="通知内容")
+    methods: List[str] = Field(description="未送达的通知方式 (protocol)")
+    created: float = Field(default_factory=time, description="暂存时间（时间戳）")
+
+
+class NotificationSpool:
+    """
+    通知暂存文件
+
+    未送达的通知以每行一条 JSON 的格式追加写入，下次启动时取出并重新发送。
+    取出的通知在全部重新提交之前保留在重新发送文件中，程序中途退出时下次启动会再次取出
+    （可能重复发送，但不会丢失）。
+    """
+
+    def __init__(self, path: Path):
+        """
+        :param path: 暂存文件路径
+        """
+        self._path = path
+        self._lock = Lock()
+
+    @property
+    def path(self) -> Path:
+        """
+        暂存文件路径
+        """
+        return self._path
+
+    def append(self, entries: Iterable[NotificationSpoolEntry]) -> int:
+        """
+        追加暂存通知
+
+        :param entries: 暂存的通知
+        :return: 写入的数量
+        """
+        lines = [
+            dumps(entry.model_dump(), option=OPT_APPEND_NEWLINE) for entry in entries
+        ]
+        if not lines:
+            return 0
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._path, "ab") as f:
+                f.write(b"".join(lines))
+        return len(lines)
+
+    @property
+    def claimed_path(self) -> Path:
+        """
+        重新发送文件路径
+        """
+        return self._path.with_name(self._path.name + ".replay")
+
+    def claim(self) -> List[NotificationSpoolEntry]:
+        """
+        取出全部暂存通知以重新发送（暂存文件并入重新发送文件，之后的暂存写入新文件）
+
+        :return: 暂存的通知（跳过损坏的记录）
+        """
+        with self._lock:
+            claimed = self.claimed_path
+            if self._path.exists():
+                if claimed.exists():
+                    # 上次重新发送未完成，合并后一并取出
+                    with open(claimed, "ab") as f:
+                        f.write(self._path.read_bytes())
+                    self._path.unlink()
+                else:
+                    self._path.replace(claimed)
+            try:
+                data = claimed.read_bytes()
+            except FileNotFoundError:
+                return []
+
+        entries = []
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entries.append(NotificationSpoolEntry.model_validate(loads(line)))
+            except (JSONDecodeError, ValidationError):
+                log.warning("跳过损坏的暂存通知记录")
+        return entries
+
+    def release(self, entries: Iterable[NotificationSpoolEntry]) -> int:
+        """
+        结束重新发送：未能重新提交的通知写回暂存文件，然后删除重新发送文件
+
+        :param entries: 未能重新提交的通知
+        :return: 写回的数量
+        """
+        written = self.append(entries)
+        with self._lock:
+            self.claimed_path.unlink(missing_ok=True)
+        return written
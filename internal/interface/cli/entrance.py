@@ -11,6 +11,7 @@ from internal.interface.cli.menu import (
     CliRiskedInterval,
     CliStressTest,
     CliTicketMonitor,
+    CliWatch,
 )
 from internal.util import CliUtils
 from internal.version import __version__
@@ -105,6 +106,10 @@ class CliEntrance:
                                 "name": "刷新余票间隔配置",
                                 "target": CliRefreshInterval,
                             },
+                            {
+                                "name": "配置热加载",
+                                "target": CliWatch,
+                            },
                         ],
                     },
                 },
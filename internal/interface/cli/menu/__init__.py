@@ -9,6 +9,7 @@ from internal.interface.cli.menu.setting import (
     CliMaxConsecutiveRequest,
     CliRefreshInterval,
     CliRiskedInterval,
+    CliWatch,
 )
 from internal.interface.cli.menu.stress_test import CliStressTest
 from internal.interface.cli.menu.user import CliLogin
@@ -26,4 +27,5 @@ __all__ = [
     "CliRefreshInterval",
     "CliRiskedInterval",
     "CliMaxConsecutiveRequest",
+    "CliWatch",
 ]
@@ -51,8 +51,9 @@ class CliBuyer:
 
             selected_buyers = [buyer_map[selected_text] for selected_text in selected]
 
-            configer.buyer.buyer = selected_buyers
-            configer.buyer.count = len(selected_buyers)
+            with configer.batch():
+                configer.buyer.buyer = selected_buyers
+                configer.buyer.count = len(selected_buyers)
 
             CliUtils.print("", end="\n")
             CliUtils.print(
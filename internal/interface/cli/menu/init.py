@@ -154,3 +154,6 @@ class CliInit:
 
         # 初始化外部通知服务
         CliInit.init_external_notification()
+
+        # 重新发送上次未送达的通知
+        NotificationManager.replay()
@@ -160,10 +160,12 @@ class CliTicketMonitor:
 
         original_log_level = log_settings.LOG_LEVEL
         log_settings.LOG_LEVEL = "CRITICAL"
+        log.update_loggers()
 
         def restore_log_level():
             """恢复原始日志级别"""
             log_settings.LOG_LEVEL = original_log_level
+            log.update_loggers()
 
         CliUtils.print("", end="\n")
         CliUtils.print("开始监控票务状态", color="green", bold=True)
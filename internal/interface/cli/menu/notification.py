@@ -2,9 +2,9 @@ from functools import partial
 from typing import ClassVar, List
 
 from internal.config import configer
-from internal.core.notification import NotificationManager
+from internal.core.notification import NotificationManager, notification_metrics
 from internal.core.notification.external.dglab.pulse import PULSE_DATA
-from internal.util import CliUtils, log
+from internal.util import CliUtils, SystemUtils, log
 
 
 class CliNotification:
@@ -205,6 +205,13 @@ class CliNotification:
                 "description": "切换通知开关",
             }
         )
+        items.append(
+            {
+                "name": "发送统计",
+                "target": CliNotification._show_metrics,
+                "description": "查看各渠道耗时与成功率",
+            }
+        )
 
         if not configer.notification.isEnable:
             return items
@@ -214,6 +221,62 @@ class CliNotification:
 
         return items
 
+    @staticmethod
+    def _show_metrics():
+        """
+        显示各渠道发送统计
+        """
+        CliUtils.print("", end="\n")
+        CliUtils.print("发送统计", color="blue", size="large", style="underline")
+        CliUtils.print("", end="\n")
+
+        metrics = notification_metrics.snapshot()
+        if not metrics:
+            CliUtils.print("暂无发送记录", color="yellow")
+            return
+
+        for protocol, channel in metrics.items():
+            name = CliNotification.METHOD_NAMES.get(protocol, protocol)
+            if not channel.failure:
+                color = "green"
+            elif channel.success:
+                color = "yellow"
+            else:
+                color = "red"
+            CliUtils.print(
+                f"{name}: 推送 {channel.sent} 次，成功率 {channel.success_rate:.0%}，"
+                f"平均 {channel.latency_avg:.2f}s，P95 {channel.percentile(0.95):.2f}s，"
+                f"最大 {channel.latency_max:.2f}s，重试 {channel.attempts - channel.sent} 次"
+                f"（耗时 {channel.retry_latency_total:.2f}s，退避 {channel.wait_total:.2f}s）",
+                color=color,
+            )
+            if channel.last_error:
+                CliUtils.print(f"  最近失败原因: {channel.last_error}", size="small")
+
+        CliUtils.print("", end="\n")
+        action = CliUtils.inquire(
+            type="List",
+            message="请选择操作",
+            choices=["导出为 JSON", "清空统计", "返回"],
+        )
+
+        if action == "导出为 JSON":
+            path = CliUtils.inquire(
+                type="Text",
+                message="请输入导出文件路径",
+                default=str(SystemUtils.get_data_path() / "notification_metrics.json"),
+            )
+            try:
+                path = notification_metrics.export(path)
+            except OSError as e:
+                CliUtils.print(f"导出失败: {e}", color="red")
+                return
+            CliUtils.print(f"✅ 发送统计已导出至 {path}", color="green")
+            log.info(f"发送统计已导出至 {path}")
+        elif action == "清空统计":
+            notification_metrics.reset()
+            CliUtils.print("✅ 发送统计已清空", color="green")
+
     @staticmethod
     def _handle_channel(method: str):
         """
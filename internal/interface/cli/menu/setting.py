@@ -26,6 +26,30 @@ class CliDebug:
         log.info(f"调试模式已{'开启' if configer.setting.isDebug else '关闭'}")
 
 
+class CliWatch:
+    """
+    配置热加载 配置
+    """
+
+    @staticmethod
+    def generate():
+        """
+        配置窗口
+        """
+        CliUtils.print("", end="\n")
+        CliUtils.print("配置热加载", color="blue", size="large", style="underline")
+        CliUtils.print("", end="\n")
+
+        watch_result = CliUtils.inquire(
+            type="Confirm",
+            message="是否监听配置文件修改（外部修改后自动重新加载）？",
+            default=configer.setting.isWatch,
+        )
+        configer.setting.isWatch = bool(watch_result)
+
+        log.info(f"配置热加载已{'开启' if configer.setting.isWatch else '关闭'}")
+
+
 class CliMaxConsecutiveRequest:
     """
     初始连续请求次数配置
@@ -1,17 +1,21 @@
+import gzip
 import logging
 import sys
 from asyncio import get_running_loop
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import count
 from logging.handlers import RotatingFileHandler
+from os import fsync, replace
 from pathlib import Path
 from queue import Empty, Full, Queue
 from sys import exc_info
-from threading import Lock, Thread
-from time import sleep, time
-from typing import Any, Dict, Optional
+from threading import Event, Lock, Thread
+from time import monotonic, sleep, time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from click import style
+from orjson import JSONDecodeError, dumps, loads
 from pydantic import BaseModel, ConfigDict
 from pydantic_settings import BaseSettings
 
@@ -34,18 +38,52 @@ class LogConfigModel(BaseModel):
     LOG_MAX_FILE_SIZE: int = 10
     # 备份的日志文件数量
     LOG_BACKUP_COUNT: int = 100
+    # 滚动日志压缩方式（gzip：后台压缩，none：不压缩）
+    LOG_COMPRESS: str = "gzip"
+    # 日志目录磁盘占用上限（单位：MB，0 表示不限制）
+    LOG_DIR_MAX_SIZE: int = 500
     # 控制台日志格式
     LOG_CONSOLE_FORMAT: str = "%(leveltext)s[%(name)s] %(asctime)s %(message)s"
+    # 是否在日志中记录调用者文件名称
+    LOG_CALLER: bool = True
     # 文件日志格式
     LOG_FILE_FORMAT: str = "【%(levelname)s】%(asctime)s - %(message)s"
+    # 是否同时输出结构化日志（JSON Lines）
+    LOG_JSON: bool = False
+    # 结构化日志文件名称
+    LOG_JSON_FILE: str = "app.jsonl"
     # 异步文件写入队列大小
     ASYNC_FILE_QUEUE_SIZE: int = 1000
     # 异步文件写入线程数
     ASYNC_FILE_WORKERS: int = 2
+    # 异步写入模式（always：所有线程均交由后台线程写入，loop：仅协程环境使用后台线程）
+    ASYNC_FILE_MODE: str = "always"
+    # 队列满时的处理策略（block：限时阻塞，drop_oldest：丢弃最旧日志，spill：交由线程池写入）
+    ASYNC_FILE_OVERFLOW: str = "block"
+    # 限时阻塞的最长等待时间（毫秒），超时后丢弃该条日志
+    ASYNC_FILE_ENQUEUE_TIMEOUT: int = 50
     # 批量写入大小
     BATCH_WRITE_SIZE: int = 50
-    # 写入超时时间（秒）
+    # 写入线程空闲等待时间（秒）
     WRITE_TIMEOUT: float = 3.0
+    # 刷新策略（batch：每批刷新，interval：按间隔刷新，shutdown：仅关闭时刷新）
+    LOG_FLUSH_POLICY: str = "batch"
+    # 落盘策略（never：不主动落盘，batch / interval / shutdown 同刷新策略）
+    LOG_FSYNC_POLICY: str = "never"
+    # 刷新 / 落盘间隔（毫秒，仅 interval 策略生效）
+    LOG_FLUSH_INTERVAL: int = 1000
+    # 退出时排空日志队列的最长时间（毫秒）
+    LOG_DRAIN_TIMEOUT: int = 200
+    # 重复日志折叠时间窗口（秒，0 表示不折叠）
+    LOG_SUPPRESS_WINDOW: float = 0
+    # 各级别每秒允许的日志条数（令牌桶速率，如 {"DEBUG": 50}，未配置的级别不限制）
+    LOG_RATE_LIMIT: Dict[str, float] = {}
+    # 令牌桶容量（允许的突发条数）
+    LOG_RATE_BURST: int = 20
+    # 内存中保留的最近日志条数（异常退出时转储，0 表示关闭）
+    LOG_RING_SIZE: int = 1000
+    # 记录至环形缓冲区的最低级别（默认包括未输出的调试日志，以便异常退出时转储）
+    LOG_RING_LEVEL: str = "DEBUG"
 
     model_config = ConfigDict(extra="ignore")
 
@@ -73,6 +111,13 @@ class LogSettings(BaseSettings, LogConfigModel):
         """
         return self.LOG_MAX_FILE_SIZE * 1024 * 1024
 
+    @property
+    def LOG_DIR_MAX_SIZE_BYTES(self):
+        """
+        将日志目录占用上限转换为字节（MB -> Bytes）
+        """
+        return self.LOG_DIR_MAX_SIZE * 1024 * 1024
+
     model_config = ConfigDict(case_sensitive=True)
 
 
@@ -104,6 +149,27 @@ class CustomFormatter(logging.Formatter):
         return super().format(record)
 
 
+class JsonLinesFormatter(logging.Formatter):
+    """
+    结构化日志格式（每行一个 JSON 对象）
+    """
+
+    def format(self, record):
+        data = {
+            "time": datetime.fromtimestamp(record.created).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+        }
+        structured = getattr(record, "structured", None)
+        if structured:
+            data.update(structured)
+        data["message"] = record.getMessage()
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return dumps(data, default=str).decode()
+
+
 class LogEntry:
     """
     日志条目
@@ -115,15 +181,193 @@ class LogEntry:
         message: str,
         file_path: Path,
         timestamp: datetime = None,
+        structured: Optional[Dict[str, Any]] = None,
         **kwargs,
     ):
         self.level = level
         self.message = message
         self.file_path = file_path
         self.timestamp = timestamp or datetime.now()
+        self.structured = structured
         self.kwargs = kwargs
 
 
+class LogCompressor:
+    """
+    滚动日志压缩器 - 在低优先级后台线程中压缩已关闭的日志分段，并控制日志目录占用
+    """
+
+    _instance = None
+    _lock = Lock()
+
+    # 压缩时每次读取的块大小
+    CHUNK_SIZE = 64 * 1024
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        if hasattr(self, "_initialized"):
+            return
+
+        self._initialized = True
+        self._queue: Queue = Queue()
+        self._thread: Optional[Thread] = None
+
+    @staticmethod
+    def segments(file_path: Path) -> List[Path]:
+        """
+        获取日志文件已滚动的分段（从旧到新）
+
+        :param file_path: 日志文件路径
+        :return: 分段路径列表（同一分段压缩中时仅返回未压缩文件）
+        """
+        numbered = []
+        stamped = {}
+        for path in file_path.parent.glob(f"{file_path.name}.*"):
+            suffix = path.name[len(file_path.name) + 1 :]
+            if suffix.isdigit():
+                numbered.append((int(suffix), path))
+                continue
+            if suffix.endswith(".tmp"):
+                continue
+            key = suffix.removesuffix(".gz")
+            if key not in stamped or not path.name.endswith(".gz"):
+                stamped[key] = path
+
+        # 序号越大越旧，时间戳分段均晚于序号分段
+        return [path for _, path in sorted(numbered, reverse=True)] + [
+            stamped[key] for key in sorted(stamped)
+        ]
+
+    def submit(self, segment: Optional[Path], file_path: Path):
+        """
+        提交待压缩的日志分段（压缩后按限额清理旧分段）
+
+        :param segment: 已关闭的日志分段，为 None 时只清理
+        :param file_path: 所属日志文件路径
+        """
+        self._queue.put((segment, file_path))
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = Thread(
+                        target=self._worker, name="LogCompressor", daemon=True
+                    )
+                    self._thread.start()
+
+    def resume(self, file_path: Path):
+        """
+        重新提交上次退出前未完成压缩的分段
+
+        :param file_path: 日志文件路径
+        """
+        for segment in self.segments(file_path):
+            suffix = segment.name[len(file_path.name) + 1 :]
+            if not suffix.isdigit() and segment.suffix != ".gz":
+                self.submit(segment, file_path)
+
+    def _worker(self):
+        """
+        后台压缩线程
+        """
+        while True:
+            segment, file_path = self._queue.get()
+            try:
+                if segment is not None and segment.exists():
+                    self._compress(segment)
+                self._enforce_budget(file_path)
+            except Exception as e:
+                print(f"日志压缩失败 {segment or file_path}: {e}")
+
+    def _compress(self, segment: Path):
+        """
+        分块压缩日志分段，完成后替换原文件
+        """
+        target = segment.with_name(segment.name + ".gz")
+        temp = segment.with_name(segment.name + ".gz.tmp")
+        with open(segment, "rb") as src, gzip.open(temp, "wb") as dst:
+            while chunk := src.read(self.CHUNK_SIZE):
+                dst.write(chunk)
+                # 每块让出执行权，避免与写入线程争抢
+                sleep(0)
+        replace(temp, target)
+        segment.unlink()
+
+    @staticmethod
+    def _enforce_budget(file_path: Path):
+        """
+        按备份数量和目录占用上限删除最旧的分段
+        """
+        segments = LogCompressor.segments(file_path)
+        while len(segments) > log_settings.LOG_BACKUP_COUNT:
+            segments.pop(0).unlink(missing_ok=True)
+
+        budget = log_settings.LOG_DIR_MAX_SIZE_BYTES
+        if budget <= 0:
+            return
+
+        files = [path for path in file_path.parent.iterdir() if path.is_file()]
+        total = sum(path.stat().st_size for path in files)
+        if total <= budget:
+            return
+
+        # 跨目录内所有日志文件，从最旧的分段开始删除（不删除正在写入或压缩中的文件）
+        names = {path.name for path in files}
+        candidates = [
+            path
+            for path in files
+            if not path.name.endswith(".tmp")
+            and any(
+                path.name.startswith(name + ".") for name in names if name != path.name
+            )
+        ]
+        candidates.sort(key=lambda path: path.stat().st_mtime)
+
+        for path in candidates:
+            if total <= budget:
+                break
+            size = path.stat().st_size
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class BudgetRotatingFileHandler(RotatingFileHandler):
+    """
+    滚动后由后台线程按备份数量和目录占用上限清理旧分段的文件处理器（不压缩）
+    """
+
+    def doRollover(self):
+        super().doRollover()
+        LogCompressor().submit(None, Path(self.baseFilename))
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """
+    滚动时将已关闭的分段交由后台压缩的文件处理器（不阻塞写入线程）
+    """
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        base = Path(self.baseFilename)
+        if base.exists():
+            segment = base.with_name(
+                f"{base.name}.{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}"
+            )
+            replace(base, segment)
+            LogCompressor().submit(segment, base)
+
+        if not self.delay:
+            self.stream = self._open()
+
+
 class NonBlockingFileHandler:
     """
     非阻塞文件处理器 - 使用RotatingFileHandler实现日志滚动
@@ -151,6 +395,20 @@ class NonBlockingFileHandler:
         )
         self._running = True
 
+        # 溢出统计
+        self._stats_lock = Lock()
+        self._dropped = 0
+        self._spilled = 0
+
+        # 当前文件大小（字节），用于每批一次的滚动检查
+        self._file_sizes: Dict[Path, int] = {}
+        # 待刷新 / 待落盘的处理器
+        self._flush_lock = Lock()
+        self._pending_flush: set = set()
+        self._pending_fsync: set = set()
+        self._last_flush = monotonic()
+        self._last_fsync = monotonic()
+
         # 启动后台写入线程
         self._write_thread = Thread(target=self._batch_writer, daemon=True)
         self._write_thread.start()
@@ -159,23 +417,39 @@ class NonBlockingFileHandler:
         """
         获取或创建RotatingFileHandler实例
         """
-        if file_path not in self._rotating_handlers:
-            # 确保目录存在
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # 创建RotatingFileHandler
-            handler = RotatingFileHandler(
-                filename=str(file_path),
-                maxBytes=log_settings.LOG_MAX_FILE_SIZE_BYTES,
-                backupCount=log_settings.LOG_BACKUP_COUNT,
-                encoding="utf-8",
-            )
-
-            # 设置格式化器
-            formatter = logging.Formatter(log_settings.LOG_FILE_FORMAT)
-            handler.setFormatter(formatter)
+        handler = self._rotating_handlers.get(file_path)
+        if handler is not None:
+            return handler
+
+        with self._lock:
+            if file_path not in self._rotating_handlers:
+                # 确保目录存在
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+
+                # 创建RotatingFileHandler（滚动后在后台压缩并清理旧分段）
+                if log_settings.LOG_COMPRESS == "gzip":
+                    handler_cls = CompressingRotatingFileHandler
+                    LogCompressor().resume(file_path)
+                else:
+                    handler_cls = BudgetRotatingFileHandler
+                handler = handler_cls(
+                    filename=str(file_path),
+                    maxBytes=log_settings.LOG_MAX_FILE_SIZE_BYTES,
+                    backupCount=log_settings.LOG_BACKUP_COUNT,
+                    encoding="utf-8",
+                )
+
+                # 设置格式化器（.jsonl 文件使用结构化格式）
+                if file_path.suffix == ".jsonl":
+                    formatter = JsonLinesFormatter()
+                else:
+                    formatter = logging.Formatter(log_settings.LOG_FILE_FORMAT)
+                handler.setFormatter(formatter)
 
-            self._rotating_handlers[file_path] = handler
+                self._file_sizes[file_path] = (
+                    file_path.stat().st_size if file_path.exists() else 0
+                )
+                self._rotating_handlers[file_path] = handler
 
         return self._rotating_handlers[file_path]
 
@@ -212,20 +486,38 @@ class NonBlockingFileHandler:
                 if key not in record.__dict__:
                     setattr(record, key, value)
 
+        if entry.structured:
+            record.structured = entry.structured
+
         if record.levelname == "WARNING":
             record.levelname = "WARN"
 
         return record
 
-    def write_log(self, level: str, message: str, file_path: Path, **kwargs):
+    def write_log(
+        self,
+        level: str,
+        message: str,
+        file_path: Path,
+        structured: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ):
         """
-        写入日志 - 自动检测协程环境并使用合适的方式
+        写入日志 - 根据写入模式交由后台线程或直接同步写入
+
+        :param structured: 结构化字段（用于 JSON Lines 日志）
         """
-        entry = LogEntry(level, message, file_path, **kwargs)
+        # 异常信息需在调用线程中获取
+        if kwargs.get("exc_info") is True:
+            kwargs["exc_info"] = exc_info()
+
+        entry = LogEntry(level, message, file_path, structured=structured, **kwargs)
 
-        # 检测是否在协程环境中
-        if self._is_in_event_loop():
-            # 在协程环境中，使用非阻塞方式
+        if not self._running:
+            # 后台线程已停止，直接同步写入
+            self._write_sync(entry)
+        elif log_settings.ASYNC_FILE_MODE == "always" or self._is_in_event_loop():
+            # 交由后台线程写入，调用方不等待磁盘 I/O
             self._write_non_blocking(entry)
         else:
             # 不在协程环境中，直接同步写入
@@ -244,13 +536,80 @@ class NonBlockingFileHandler:
 
     def _write_non_blocking(self, entry: LogEntry):
         """
-        非阻塞写入（用于协程环境）
+        非阻塞写入（入队至后台写入线程）
         """
         try:
             self._write_queue.put_nowait(entry)
         except Full:
+            self._handle_overflow(entry)
+
+    def _handle_overflow(self, entry: LogEntry):
+        """
+        按溢出策略处理队列已满时的日志条目
+        """
+        policy = log_settings.ASYNC_FILE_OVERFLOW
+
+        if policy == "spill":
             # 队列满时，使用线程池处理
             self._executor.submit(self._write_sync, entry)
+            self._count("_spilled")
+            return
+
+        if policy == "drop_oldest":
+            # 丢弃最旧的日志，为新日志腾出位置
+            for _ in range(3):
+                if self._evict_oldest():
+                    self._count("_dropped")
+                try:
+                    self._write_queue.put_nowait(entry)
+                    return
+                except Full:
+                    continue
+        else:
+            # 限时阻塞等待队列空位
+            try:
+                self._write_queue.put(
+                    entry, timeout=log_settings.ASYNC_FILE_ENQUEUE_TIMEOUT / 1000
+                )
+                return
+            except Full:
+                pass
+
+        self._count("_dropped")
+
+    def _evict_oldest(self) -> bool:
+        """
+        丢弃队列中最旧的日志条目（保留排空标记，避免等待排空的调用方超时）
+
+        :return: 是否丢弃了日志条目
+        """
+        queue = self._write_queue
+        with queue.mutex:
+            for index, entry in enumerate(queue.queue):
+                if not isinstance(entry, Event):
+                    del queue.queue[index]
+                    queue.not_full.notify()
+                    return True
+        return False
+
+    def _count(self, name: str):
+        """
+        溢出计数
+        """
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        获取写入队列统计信息
+
+        :return: 队列长度、丢弃数、转交线程池数
+        """
+        return {
+            "queued": self._write_queue.qsize(),
+            "dropped": self._dropped,
+            "spilled": self._spilled,
+        }
 
     @staticmethod
     def _write_sync(entry: LogEntry):
@@ -258,41 +617,206 @@ class NonBlockingFileHandler:
         同步写入日志
         """
         try:
-            # 获取RotatingFileHandler实例
-            handler = NonBlockingFileHandler()._get_rotating_handler(entry.file_path)
-
-            record = NonBlockingFileHandler._create_log_record(entry)
-            handler.emit(record)
+            NonBlockingFileHandler()._write_entries(entry.file_path, [entry])
         except Exception as e:
             # 如果文件写入失败，至少输出到控制台
             print(f"日志写入失败 {entry.file_path}: {e}")
             print(f"【{entry.level.upper()}】{entry.timestamp} - {entry.message}")
 
+    def _write_entries(self, file_path: Path, entries: list):
+        """
+        将一组日志条目格式化后一次性写入文件（每批仅检查一次滚动）
+
+        :param file_path: 日志文件路径
+        :param entries: 日志条目列表
+        """
+        handler = self._get_rotating_handler(file_path)
+
+        data = "".join(
+            handler.format(self._create_log_record(entry)) + handler.terminator
+            for entry in entries
+        )
+        size = len(data.encode(handler.encoding or "utf-8"))
+
+        handler.acquire()
+        try:
+            current_size = self._file_sizes.get(file_path, 0)
+            if (
+                handler.maxBytes > 0
+                and current_size > 0
+                and current_size + size > handler.maxBytes
+            ):
+                handler.doRollover()
+                current_size = 0
+
+            if handler.stream is None:
+                handler.stream = handler._open()  # noqa
+
+            handler.stream.write(data)
+            self._file_sizes[file_path] = current_size + size
+        finally:
+            handler.release()
+
+        with self._flush_lock:
+            self._pending_flush.add(handler)
+            self._pending_fsync.add(handler)
+
+        if log_settings.LOG_FLUSH_POLICY == "batch":
+            self._flush_pending()
+
+    def _flush_pending(self, force: bool = False):
+        """
+        按刷新 / 落盘策略处理待刷新的文件
+
+        :param force: 是否忽略策略强制刷新并落盘
+        """
+        now = monotonic()
+        flush_policy = log_settings.LOG_FLUSH_POLICY
+        fsync_policy = log_settings.LOG_FSYNC_POLICY
+
+        do_flush = (
+            force
+            or flush_policy == "batch"
+            or (
+                flush_policy == "interval"
+                and now - self._last_flush >= log_settings.LOG_FLUSH_INTERVAL / 1000
+            )
+        )
+        do_fsync = force or (
+            fsync_policy == "batch"
+            or (
+                fsync_policy == "interval"
+                and now - self._last_fsync >= log_settings.LOG_FLUSH_INTERVAL / 1000
+            )
+        )
+        if not do_flush and not do_fsync:
+            return
+
+        with self._flush_lock:
+            flush_handlers = self._pending_flush if do_flush else set()
+            fsync_handlers = (
+                self._pending_fsync if do_fsync and fsync_policy != "never" else set()
+            )
+            if do_flush:
+                self._pending_flush = set()
+                self._last_flush = now
+            if do_fsync:
+                self._pending_fsync = set()
+                self._last_fsync = now
+
+        for handler in flush_handlers | fsync_handlers:
+            handler.acquire()
+            try:
+                if handler.stream is None:
+                    continue
+                handler.stream.flush()
+                if handler in fsync_handlers:
+                    fsync(handler.stream.fileno())
+            except Exception as e:
+                print(f"日志刷新失败 {handler.baseFilename}: {e}")
+            finally:
+                handler.release()
+
+    def _next_wait(self) -> float:
+        """
+        计算写入线程下一次等待的超时时间（秒）
+        """
+        timeout = log_settings.WRITE_TIMEOUT
+        if (self._pending_flush and log_settings.LOG_FLUSH_POLICY == "interval") or (
+            self._pending_fsync and log_settings.LOG_FSYNC_POLICY == "interval"
+        ):
+            timeout = min(timeout, log_settings.LOG_FLUSH_INTERVAL / 1000)
+        return max(timeout, 0.001)
+
     def _batch_writer(self):
         """
         后台批量写入线程
         """
         while self._running:
             try:
-                # 收集一批日志条目
+                # 阻塞等待第一条日志，空闲时不占用 CPU
                 batch = []
-                end_time = time() + log_settings.WRITE_TIMEOUT
+                try:
+                    batch.append(self._write_queue.get(timeout=self._next_wait()))
+                except Empty:
+                    pass
 
-                while len(batch) < log_settings.BATCH_WRITE_SIZE and time() < end_time:
+                # 收集队列中已有的日志条目，组成一批
+                while batch and len(batch) < log_settings.BATCH_WRITE_SIZE:
                     try:
-                        remaining_time = max(0, int(end_time) - int(time()))
-                        entry = self._write_queue.get(timeout=remaining_time)
-                        batch.append(entry)
+                        batch.append(self._write_queue.get_nowait())
                     except Empty:
                         break
 
+                # 排空标记：本批日志写入后立即刷新并通知等待方
+                drained = [entry for entry in batch if isinstance(entry, Event)]
+                if drained:
+                    batch = [entry for entry in batch if not isinstance(entry, Event)]
+
                 if batch:
                     self._write_batch(batch)
 
+                self._flush_pending(force=bool(drained))
+
+                for event in drained:
+                    event.set()
+
             except Exception as e:
                 print(f"批量写入线程错误: {e}")
                 sleep(0.1)
 
+        # 停止前写入队列中剩余的日志
+        self._write_remaining()
+
+    def _write_remaining(self):
+        """
+        写入队列中剩余的日志条目，并通知等待排空的调用方
+        """
+        batch = []
+        drained = []
+        while True:
+            try:
+                entry = self._write_queue.get_nowait()
+            except Empty:
+                break
+            if isinstance(entry, Event):
+                drained.append(entry)
+            else:
+                batch.append(entry)
+
+        try:
+            if batch:
+                self._write_batch(batch)
+            self._flush_pending(force=True)
+        except Exception as e:
+            print(f"写入剩余日志失败: {e}")
+
+        for event in drained:
+            event.set()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        限时排空写入队列，并刷新所有日志文件
+
+        :param timeout: 最长等待时间（秒），默认使用 LOG_DRAIN_TIMEOUT
+        :return: 是否在限时内完成
+        """
+        if timeout is None:
+            timeout = log_settings.LOG_DRAIN_TIMEOUT / 1000
+        deadline = monotonic() + timeout
+
+        if not self._running or not self._write_thread.is_alive():
+            self._flush_pending(force=True)
+            return True
+
+        drained = Event()
+        try:
+            self._write_queue.put(drained, timeout=max(deadline - monotonic(), 0))
+        except Full:
+            return False
+
+        return drained.wait(max(deadline - monotonic(), 0))
+
     def _write_batch(self, batch: list):
         """
         批量写入日志
@@ -307,13 +831,7 @@ class NonBlockingFileHandler:
         # 批量写入每个文件
         for file_path, entries in file_groups.items():
             try:
-                # 获取RotatingFileHandler
-                handler = self._get_rotating_handler(file_path)
-
-                # 批量写入
-                for entry in entries:
-                    record = self._create_log_record(entry)
-                    handler.emit(record)
+                self._write_entries(file_path, entries)
             except Exception as e:
                 print(f"批量写入失败 {file_path}: {e}")
                 # 回退到逐个写入
@@ -327,11 +845,254 @@ class NonBlockingFileHandler:
         self._running = False
         if hasattr(self, "_write_thread"):
             self._write_thread.join(timeout=5)
+            # 写入线程已退出时，由当前线程写入停止期间入队的日志
+            if not self._write_thread.is_alive():
+                self._write_remaining()
         if self._executor:
             self._executor.shutdown(wait=True)
 
+        # 刷新并关闭所有文件
+        self._flush_pending(force=True)
+        for handler in self._rotating_handlers.values():
+            handler.close()
+
         # 清理缓存
         self._rotating_handlers.clear()
+        self._file_sizes.clear()
+
+
+class LogSuppressor:
+    """
+    日志抑制器 - 折叠时间窗口内重复的日志，并按级别进行令牌桶限流
+    """
+
+    def __init__(self, window: float, limits: Dict[str, float], burst: int):
+        """
+        :param window: 重复日志折叠时间窗口（秒）
+        :param limits: 各级别每秒允许的日志条数
+        :param burst: 令牌桶容量
+        """
+        self._lock = Lock()
+        self._window = window
+        self._limits = {
+            level.lower(): rate for level, rate in limits.items() if rate > 0
+        }
+        self._burst = max(burst, 1)
+        # (调用者, 级别, 消息) -> [窗口开始时间, 重复次数]
+        self._seen: Dict[Tuple[Optional[str], str, str], List] = {}
+        # 级别 -> [剩余令牌, 上次补充时间, 丢弃条数]
+        self._buckets: Dict[str, List] = {}
+        self._last_sweep = monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        是否启用
+        """
+        return self._window > 0 or bool(self._limits)
+
+    def check(
+        self, caller: Optional[str], method: str, message: str
+    ) -> Tuple[bool, List[Tuple[str, Optional[str], str]]]:
+        """
+        检查日志是否允许输出
+
+        :param caller: 调用者名称
+        :param method: 日志方法
+        :param message: 日志内容
+        :return: 是否允许输出，以及需要先输出的汇总记录 (日志方法, 调用者, 内容)
+        """
+        now = monotonic()
+        notices = []
+
+        with self._lock:
+            if self._window > 0:
+                if now - self._last_sweep >= self._window:
+                    notices.extend(self._sweep(now))
+
+                key = (caller, method, message)
+                seen = self._seen.get(key)
+                if seen is not None and now - seen[0] < self._window:
+                    seen[1] += 1
+                    return False, notices
+                if seen is not None and seen[1]:
+                    notices.append(self._repeated(key, seen[1]))
+                self._seen[key] = [now, 0]
+
+            rate = self._limits.get(method)
+            if rate:
+                bucket = self._buckets.get(method)
+                if bucket is None:
+                    bucket = self._buckets[method] = [float(self._burst), now, 0]
+                bucket[0] = min(self._burst, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+                if bucket[0] < 1:
+                    bucket[2] += 1
+                    return False, notices
+                bucket[0] -= 1
+                if bucket[2]:
+                    message = f"{method.upper()} 级别日志已限流丢弃 {bucket[2]} 条"
+                    notices.append((method, None, message))
+                    bucket[2] = 0
+
+        return True, notices
+
+    def flush(self) -> List[Tuple[str, Optional[str], str]]:
+        """
+        输出所有尚未汇总的重复 / 限流记录
+
+        :return: 汇总记录 (日志方法, 调用者, 内容)
+        """
+        with self._lock:
+            notices = self._sweep(None)
+            for method, bucket in self._buckets.items():
+                if bucket[2]:
+                    message = f"{method.upper()} 级别日志已限流丢弃 {bucket[2]} 条"
+                    notices.append((method, None, message))
+                    bucket[2] = 0
+        return notices
+
+    def _sweep(self, now: Optional[float]) -> List[Tuple[str, Optional[str], str]]:
+        """
+        清理已过期的折叠窗口（now 为 None 时清理全部）
+        """
+        notices = []
+        for key, seen in list(self._seen.items()):
+            if now is None or now - seen[0] >= self._window:
+                if seen[1]:
+                    notices.append(self._repeated(key, seen[1]))
+                del self._seen[key]
+        if now is not None:
+            self._last_sweep = now
+        return notices
+
+    @staticmethod
+    def _repeated(
+        key: Tuple[Optional[str], str, str], count: int
+    ) -> Tuple[str, Optional[str], str]:
+        """
+        生成重复汇总记录
+        """
+        caller, method, message = key
+        return method, caller, f"{message}（已重复 {count} 次）"
+
+
+class LogRingBuffer:
+    """
+    最近日志环形缓冲区 - 预分配固定大小，记录不低于 LOG_RING_LEVEL 的日志，异常退出时转储
+    """
+
+    __slots__ = ("size", "_records", "_counter")
+
+    def __init__(self, size: int):
+        """
+        :param size: 保留的日志条数
+        """
+        self.size = size
+        self._records: List[Optional[tuple]] = [None] * size
+        # itertools.count 的 next() 在 GIL 下是原子的，写入无需加锁
+        self._counter = count()
+
+    def append(self, method: str, caller: Optional[str], msg: str, args: tuple):
+        """
+        记录一条日志（延迟到转储时再格式化）
+
+        :param method: 日志方法
+        :param caller: 调用者名称
+        :param msg: 日志信息
+        :param args: 格式化参数
+        """
+        seq = next(self._counter)
+        self._records[seq % self.size] = (seq, time(), method, caller, msg, args)
+
+    def records(self) -> List[tuple]:
+        """
+        获取按时间排序的日志记录
+        """
+        return sorted(
+            (record for record in self._records if record is not None),
+            key=lambda record: record[0],
+        )
+
+    def dump(self, file_path: Path, machine_id: str = "") -> Path:
+        """
+        将缓冲区内容转储至文件
+
+        :param file_path: 转储文件路径
+        :param machine_id: 机器标识
+        :return: 转储文件路径
+        """
+        lines = []
+        for _, created, method, caller, msg, args in self.records():
+            message_body = msg
+            if args:
+                try:
+                    message_body = msg % args
+                except (TypeError, ValueError):
+                    message_body = f"{msg} {' '.join(str(arg) for arg in args)}"
+            timestamp = datetime.fromtimestamp(created).strftime(
+                "%Y-%m-%d %H:%M:%S.%f"
+            )[:-3]
+            source = f"{caller} - " if caller else ""
+            lines.append(
+                f"【{method.upper()}】{timestamp} - [{machine_id}] {source}{message_body}\n"
+            )
+
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        return file_path
+
+
+class LoggerState:
+    """
+    日志状态（预计算，仅在 update_loggers 时重建）
+    """
+
+    __slots__ = (
+        "level",
+        "machine_id",
+        "prefix",
+        "console",
+        "file_path",
+        "json_path",
+        "suppressor",
+        "ring",
+        "ring_level",
+        "threshold",
+    )
+
+    def __init__(
+        self,
+        level: int,
+        machine_id: str,
+        console: logging.Logger,
+        file_path: Path,
+        json_path: Optional[Path] = None,
+        suppressor: Optional[LogSuppressor] = None,
+        ring: Optional[LogRingBuffer] = None,
+        ring_level: int = logging.DEBUG,
+    ):
+        # 当前日志级别
+        self.level = level
+        # 机器标识
+        self.machine_id = machine_id
+        # 消息前缀（machine_id）
+        self.prefix = f"[{machine_id}] "
+        # 控制台日志实例
+        self.console = console
+        # 日志文件路径
+        self.file_path = file_path
+        # 结构化日志文件路径（未启用时为 None）
+        self.json_path = json_path
+        # 日志抑制器（未启用时为 None）
+        self.suppressor = suppressor
+        # 最近日志环形缓冲区（未启用时为 None）
+        self.ring = ring
+        # 记录至环形缓冲区的最低级别
+        self.ring_level = ring_level
+        # 需要处理的最低级别（低于该级别的日志直接返回）
+        self.threshold = min(level, ring_level) if ring is not None else level
 
 
 class LoggerManager:
@@ -345,6 +1106,20 @@ class LoggerManager:
     _default_log_file = "app.log"
     # 线程锁
     _lock = Lock()
+    # 调用者名称缓存（代码文件路径 -> 调用者名称）
+    _caller_cache: Dict[str, str] = {}
+    # 日志方法级别映射
+    _method_levels: Dict[str, int] = {
+        "debug": logging.DEBUG,
+        "info": logging.INFO,
+        "warning": logging.WARNING,
+        "error": logging.ERROR,
+        "critical": logging.CRITICAL,
+    }
+    # 预计算的日志状态
+    _state: Optional[LoggerState] = None
+    # 最近日志环形缓冲区
+    _ring: Optional[LogRingBuffer] = None
     # 非阻塞文件处理器
     _file_handler = NonBlockingFileHandler()
 
@@ -366,44 +1141,29 @@ class LoggerManager:
                 self._loggers[logfile] = _logger
         return _logger
 
-    @staticmethod
-    def __get_caller():
+    @classmethod
+    def __get_caller(cls) -> str:
         """
-        获取调用者的文件名称
+        获取调用者的文件名称（按代码文件缓存，避免每次遍历调用栈）
         """
-        # 调用者文件名称
-        caller_name = None
-
         try:
-            frame = sys._getframe(3)  # noqa
+            filename = sys._getframe(3).f_code.co_filename  # noqa
         except (AttributeError, ValueError):
             # 如果无法获取帧，返回默认值
             return "log.py"
 
-        while frame:
-            filepath = Path(frame.f_code.co_filename)
-            parts = filepath.parts
-
-            # 设定调用者文件名称
-            if not caller_name:
-                if parts[-1] == "__init__.py" and len(parts) >= 2:
-                    caller_name = parts[-2]
-                else:
-                    caller_name = parts[-1]
-
-            # 如果已经找到调用者名称，可以提前退出
-            if caller_name:
-                # 检查是否在项目目录内
-                if "internal" in parts or "cli.py" in parts:
-                    break
-
-            # 获取上一个帧
-            try:
-                frame = frame.f_back
-            except AttributeError:
-                break
+        caller_name = cls._caller_cache.get(filename)
+        if caller_name is None:
+            parts = Path(filename).parts
+            if not parts:
+                caller_name = "log.py"
+            elif parts[-1] == "__init__.py" and len(parts) >= 2:
+                caller_name = parts[-2]
+            else:
+                caller_name = parts[-1]
+            cls._caller_cache[filename] = caller_name
 
-        return caller_name or "log.py"
+        return caller_name
 
     @staticmethod
     def __setup_console_logger(log_file: str):
@@ -441,6 +1201,65 @@ class LoggerManager:
         with LoggerManager._lock:
             for _logger in self._loggers.values():
                 self.__update_logger_handlers(_logger)
+            LoggerManager._state = self.__build_state()
+
+    def __get_state(self) -> LoggerState:
+        """
+        获取日志状态（首次调用时构建）
+        """
+        state = LoggerManager._state
+        if state is None:
+            with LoggerManager._lock:
+                state = LoggerManager._state
+                if state is None:
+                    state = LoggerManager._state = self.__build_state()
+        return state
+
+    def __build_state(self) -> LoggerState:
+        """
+        构建日志状态（需持有线程锁）
+        """
+        logfile = self._default_log_file
+        _logger = self._loggers.get(logfile)
+        if not _logger:
+            _logger = self.__setup_console_logger(log_file=logfile)
+            self._loggers[logfile] = _logger
+
+        suppressor = LogSuppressor(
+            window=log_settings.LOG_SUPPRESS_WINDOW,
+            limits=log_settings.LOG_RATE_LIMIT,
+            burst=log_settings.LOG_RATE_BURST,
+        )
+
+        # 缓冲区大小不变时保留已有记录
+        ring_size = log_settings.LOG_RING_SIZE
+        if ring_size <= 0:
+            LoggerManager._ring = None
+        elif LoggerManager._ring is None or LoggerManager._ring.size != ring_size:
+            LoggerManager._ring = LogRingBuffer(ring_size)
+
+        # 重建前输出旧抑制器中尚未汇总的记录
+        previous = LoggerManager._state
+        if previous is not None and previous.suppressor is not None:
+            for notice in previous.suppressor.flush():
+                self.__emit(previous, *notice, {})
+
+        return LoggerState(
+            level=self.__get_log_level(),
+            machine_id=DeviceUtils.get_guid()[:12],
+            console=_logger,
+            file_path=log_settings.LOG_PATH / logfile,
+            json_path=(
+                log_settings.LOG_PATH / log_settings.LOG_JSON_FILE
+                if log_settings.LOG_JSON
+                else None
+            ),
+            suppressor=suppressor if suppressor.enabled else None,
+            ring=LoggerManager._ring,
+            ring_level=getattr(
+                logging, log_settings.LOG_RING_LEVEL.upper(), logging.DEBUG
+            ),
+        )
 
     @staticmethod
     def __update_logger_handlers(_logger: logging.Logger):
@@ -477,19 +1296,23 @@ class LoggerManager:
         :param method: 日志方法
         :param msg: 日志信息
         """
-        # 获取当前日志级别
-        current_level = self.__get_log_level()
-        method_level = getattr(logging, method.upper(), logging.INFO)
+        state = LoggerManager._state or self.__get_state()
 
-        # 如果当前方法的级别低于设定的日志级别，则不处理
-        if method_level < current_level:
+        # 低于日志级别与缓冲区级别的日志直接返回，不做任何额外处理
+        level = self._method_levels.get(method, logging.INFO)
+        if level < state.threshold:
             return
 
-        # 获取调用者文件名
-        caller_name = self.__get_caller()
+        # 获取调用者文件名（缓冲区与日志输出共用）
+        caller_name = self.__get_caller() if log_settings.LOG_CALLER else None
+
+        # 记录至环形缓冲区（可包括低于当前日志级别的日志）
+        if state.ring is not None and level >= state.ring_level:
+            state.ring.append(method, caller_name, msg, args)
 
-        # 获取 machine_id
-        machine_id = DeviceUtils.get_guid()[:12]
+        # 如果当前方法的级别低于设定的日志级别，则不处理
+        if level < state.level:
+            return
 
         # 使用 f-string 安全地格式化，避免 % 带来的问题
         message_body = msg
@@ -500,29 +1323,60 @@ class LoggerManager:
             except (TypeError, ValueError):
                 message_body = f"{msg} {' '.join(str(arg) for arg in args)}"
 
-        formatted_msg = f"[{machine_id}] {caller_name} - {message_body}"
+        # 折叠重复日志并限流
+        if state.suppressor is not None:
+            allowed, notices = state.suppressor.check(caller_name, method, message_body)
+            for notice in notices:
+                self.__emit(state, *notice, {})
+            if not allowed:
+                return
 
-        # 使用默认日志文件
-        logfile = self._default_log_file
+        self.__emit(state, method, caller_name, message_body, kwargs)
 
-        # 构建完整的日志文件路径
-        log_file_path = log_settings.LOG_PATH / logfile
+    def __emit(
+        self,
+        state: LoggerState,
+        method: str,
+        caller_name: Optional[str],
+        message_body: str,
+        kwargs: Dict[str, Any],
+    ):
+        """
+        输出日志至文件及控制台
+
+        :param state: 日志状态
+        :param method: 日志方法
+        :param caller_name: 调用者名称
+        :param message_body: 日志内容
+        :param kwargs: 日志参数
+        """
+        if caller_name is not None:
+            formatted_msg = f"{state.prefix}{caller_name} - {message_body}"
+        else:
+            formatted_msg = f"{state.prefix}{message_body}"
 
         # 使用非阻塞文件处理器写入文件日志
         self._file_handler.write_log(
-            method.upper(), formatted_msg, log_file_path, **kwargs
+            method.upper(), formatted_msg, state.file_path, **kwargs
         )
 
-        # 同时保持控制台输出（使用标准 logging）
-        with LoggerManager._lock:
-            _logger = self._loggers.get(logfile)
-            if not _logger:
-                _logger = self.__setup_console_logger(log_file=logfile)
-                self._loggers[logfile] = _logger
+        # 写入结构化日志
+        if state.json_path is not None:
+            self._file_handler.write_log(
+                method.upper(),
+                message_body,
+                state.json_path,
+                structured={
+                    "caller": caller_name,
+                    "machine_id": state.machine_id,
+                    "extra": kwargs.get("extra"),
+                },
+                **kwargs,
+            )
 
         # 只在控制台输出，文件写入已由 _file_handler 处理
-        if hasattr(_logger, method):
-            log_method = getattr(_logger, method)
+        log_method = getattr(state.console, method, None)
+        if log_method:
             log_method(formatted_msg, **kwargs)
 
     def info(self, msg: str, *args, **kwargs):
@@ -547,7 +1401,7 @@ class LoggerManager:
         """
         输出警告级别日志（兼容）
         """
-        self.warning(msg, *args, **kwargs)
+        self.logger("warning", msg, *args, **kwargs)
 
     def error(self, msg: str, *args, **kwargs):
         """
@@ -561,6 +1415,88 @@ class LoggerManager:
         """
         self.logger("critical", msg, *args, **kwargs)
 
+    @classmethod
+    def stats(cls) -> Dict[str, int]:
+        """
+        获取文件日志写入统计信息
+        """
+        return cls._file_handler.stats()
+
+    @staticmethod
+    def read_json_logs(file_path: Optional[Path] = None) -> Iterator[Dict[str, Any]]:
+        """
+        按时间顺序逐行读取结构化日志（含已滚动的备份文件）
+
+        :param file_path: 结构化日志文件路径，默认使用 LOG_JSON_FILE
+        :return: 日志对象生成器
+        """
+        file_path = Path(
+            file_path or log_settings.LOG_PATH / log_settings.LOG_JSON_FILE
+        )
+
+        paths = LogCompressor.segments(file_path)
+        if file_path.exists():
+            paths.append(file_path)
+
+        for path in paths:
+            opener = gzip.open if path.suffix == ".gz" else open
+            with opener(path, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield loads(line)
+                    except JSONDecodeError:
+                        continue
+
+    @classmethod
+    def drain(cls, timeout: Optional[float] = None) -> bool:
+        """
+        限时排空文件日志队列
+
+        :param timeout: 最长等待时间（秒），默认使用 LOG_DRAIN_TIMEOUT
+        :return: 是否在限时内完成
+        """
+        return cls._file_handler.drain(timeout)
+
+    def dump_recent(self, file_path: Optional[Path] = None) -> Optional[Path]:
+        """
+        转储环形缓冲区中的最近日志
+
+        :param file_path: 转储文件路径，默认为日志目录下的 crash-时间.log
+        :return: 转储文件路径，未启用缓冲区时返回 None
+        """
+        state = LoggerManager._state
+        if state is None or state.ring is None:
+            return None
+
+        if file_path is None:
+            file_path = (
+                log_settings.LOG_PATH
+                / f"crash-{datetime.now().strftime('%Y%m%d-%H%M%S')}.log"
+            )
+        return state.ring.dump(Path(file_path), state.machine_id)
+
+    def on_exit(self, code: int):
+        """
+        退出钩子：在进程退出前排空日志，异常退出时转储最近日志
+
+        :param code: 退出码
+        """
+        if code != 0:
+            try:
+                path = self.dump_recent()
+                if path is not None:
+                    self.error(f"最近日志已转储至 {path}")
+            except Exception as e:
+                print(f"转储最近日志失败: {e}")
+
+        state = LoggerManager._state
+        if state is not None and state.suppressor is not None:
+            for notice in state.suppressor.flush():
+                self.__emit(state, *notice, {})
+        self.drain()
+
     @classmethod
     def shutdown(cls):
         """
@@ -572,3 +1508,4 @@ class LoggerManager:
 
 # 初始化日志管理
 log = LoggerManager()
+SystemUtils.add_exit_hook(log.on_exit, reserve=log_settings.LOG_DRAIN_TIMEOUT / 1000)
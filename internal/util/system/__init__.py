@@ -1,8 +1,10 @@
-from os import getcwd
+import sys
+from atexit import register
+from os import _exit, getcwd
 from pathlib import Path
 from socket import AF_INET, SOCK_DGRAM, socket
-from time import sleep, time
-from typing import Any, Optional
+from time import monotonic, sleep, time
+from typing import Any, Callable, List, Optional, Tuple
 
 from httpx import Client
 
@@ -12,6 +14,22 @@ class SystemUtils:
     系统工具类
     """
 
+    # 执行退出钩子的总限时（秒），各钩子按剩余时间限时完成
+    EXIT_TIMEOUT: float = 3.0
+
+    # 退出钩子及为其保留的时间（按注册的逆序执行）
+    _exit_hooks: List[Tuple[Callable[[int], None], float]] = []
+    # 是否正在退出
+    _exiting: bool = False
+    # 退出钩子的截止时间
+    _exit_deadline: Optional[float] = None
+    # 为尚未执行的钩子保留的时间（秒）
+    _exit_reserved: float = 0.0
+    # 解释器结束时的退出码（出现未捕获的异常时为 1）
+    _exit_code: int = 0
+    # 原异常处理函数
+    _excepthook: Optional[Callable] = None
+
     @staticmethod
     def get_data_path(path: Optional[Any] = None) -> Path:
         """
@@ -52,21 +70,99 @@ class SystemUtils:
         sleep(t / 1000.0)
 
     @staticmethod
-    def exit(code: int = 0) -> None:
+    def add_exit_hook(hook: Callable[[int], None], reserve: float = 0.0) -> None:
+        """
+        注册退出钩子，在强制退出前执行
+
+        :param hook: 钩子函数，参数为退出码
+        :param reserve: 为该钩子保留的时间（秒），先执行的钩子不会占用
+        """
+        if not SystemUtils._exit_hooks:
+            # 结束解释器时同样执行退出钩子，并记录未捕获的异常以传入退出码
+            register(SystemUtils._run_atexit)
+            SystemUtils._excepthook = sys.excepthook
+            sys.excepthook = SystemUtils._record_exception
+        SystemUtils._exit_hooks.append((hook, reserve))
+
+    @staticmethod
+    def _record_exception(exc_type, exc_value, exc_traceback) -> None:
+        """
+        记录未捕获的异常（解释器随后以退出码 1 结束），再交由原异常处理函数输出
+        """
+        SystemUtils._exit_code = 1
+        excepthook = SystemUtils._excepthook or sys.__excepthook__
+        excepthook(exc_type, exc_value, exc_traceback)
+
+    @staticmethod
+    def _run_atexit() -> None:
+        """
+        解释器结束时执行退出钩子
+        """
+        SystemUtils.run_exit_hooks(SystemUtils._exit_code)
+
+    @staticmethod
+    def exit_remaining() -> float:
+        """
+        当前退出钩子可用的时间（扣除为之后的钩子保留的时间）
+
+        :return: 剩余时间（秒），尚未开始退出时返回完整的退出限时
         """
-        退出程序（强制退出，不等待线程）
+        if SystemUtils._exit_deadline is None:
+            return SystemUtils.EXIT_TIMEOUT
+        remaining = SystemUtils._exit_deadline - monotonic()
+        return max(0.0, remaining - SystemUtils._exit_reserved)
+
+    @staticmethod
+    def run_exit_hooks(code: int = 0) -> None:
+        """
+        执行退出钩子（后注册的先执行，共用 EXIT_TIMEOUT 限时，每个钩子自行保证限时完成）
+
+        :param code: 退出码
+        """
+        if SystemUtils._exiting:
+            return
+        SystemUtils._exiting = True
+        SystemUtils._exit_deadline = monotonic() + SystemUtils.EXIT_TIMEOUT
+
+        hooks = list(reversed(SystemUtils._exit_hooks))
+        reserved = sum(reserve for _, reserve in hooks)
+        for hook, reserve in hooks:
+            reserved -= reserve
+            SystemUtils._exit_reserved = reserved
+            try:
+                hook(code)
+            except Exception:
+                pass
+
+    @staticmethod
+    def request_exit(code: int = 0) -> None:
+        """
+        请求退出（供信号处理器调用）
+
+        退出钩子可能需要被中断的主线程已持有的锁，不能在信号处理器中执行。
+        此处只抛出 SystemExit，由主流程捕获后调用 exit；正在退出时再次请求则立即退出。
 
         :param code: 退出码
         """
-        import os
+        if SystemUtils._exiting:
+            _exit(code)
+        raise SystemExit(code)
+
+    @staticmethod
+    def exit(code: int = 0) -> None:
+        """
+        退出程序（执行退出钩子后强制退出，不等待线程）
 
+        :param code: 退出码
+        """
         from internal.util.logger import log  # 防止循环导入
 
         if code != 0:
             log.error("出现异常，正在强制退出程序...")
         else:
             log.info("正在强制退出程序...")
-        os._exit(code)
+        SystemUtils.run_exit_hooks(code)
+        _exit(code)
 
 
 class IPUtils:
@@ -0,0 +1,109 @@
+from io import BytesIO
+from os import urandom
+
+import pytest
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from internal.config import ConfigManager
+from internal.config.cipher import (
+    CHUNK_SIZE,
+    CIPHER_MAGIC,
+    CIPHER_VERSION,
+    HEADER_SIZE,
+    NONCE_SIZE,
+    SALT_SIZE,
+    ConfigCipher,
+    derive_key,
+)
+from internal.util import AESUtils, DeviceUtils
+
+SECRET = "0123456789abcdef0123"
+PLAIN = ("buyer:\n  realname: 测试\n" * (CHUNK_SIZE // 8)).encode("utf-8")
+SALT_START = len(CIPHER_MAGIC) + 1
+
+
+def _legacy_encrypt(data: bytes, secret: str = SECRET) -> bytes:
+    salt, nonce = urandom(SALT_SIZE), urandom(NONCE_SIZE)
+    sealed = AESGCM(derive_key(secret, salt, 1)).encrypt(nonce, data, None)
+    return CIPHER_MAGIC + bytes([1]) + salt + nonce + sealed
+
+
+def test_round_trip():
+    cipher = ConfigCipher(SECRET)
+    data = cipher.encrypt_bytes(PLAIN)
+
+    assert ConfigCipher.is_encrypted(data)
+    assert data[len(CIPHER_MAGIC)] == CIPHER_VERSION
+    assert PLAIN not in data
+    assert ConfigCipher(SECRET).decrypt_bytes(data) == PLAIN
+
+    reader = ConfigCipher(SECRET).reader(BytesIO(data))
+    chunks = iter(lambda: reader.read(1000), b"")
+    assert b"".join(chunks) == PLAIN
+
+
+def test_reads_version_1_files():
+    cipher = ConfigCipher(SECRET)
+    assert cipher.decrypt_bytes(_legacy_encrypt(PLAIN)) == PLAIN
+
+    # 重新保存时写入当前版本
+    data = cipher.encrypt_bytes(PLAIN)
+    assert data[len(CIPHER_MAGIC)] == CIPHER_VERSION
+    assert ConfigCipher(SECRET).decrypt_bytes(data) == PLAIN
+
+
+def test_reuses_salt_of_loaded_file():
+    data = ConfigCipher(SECRET).encrypt_bytes(PLAIN)
+    salt = data[SALT_START : SALT_START + SALT_SIZE]
+
+    cipher = ConfigCipher(SECRET)
+    cipher.decrypt_bytes(data)
+    again = cipher.encrypt_bytes(PLAIN)
+
+    assert again[SALT_START : SALT_START + SALT_SIZE] == salt
+    assert (
+        again[SALT_START + SALT_SIZE : HEADER_SIZE]
+        != data[SALT_START + SALT_SIZE : HEADER_SIZE]
+    )
+
+
+@pytest.mark.parametrize(
+    "offset",
+    [SALT_START, SALT_START + SALT_SIZE, HEADER_SIZE, HEADER_SIZE + 100, -1],
+    ids=["salt", "nonce", "ciphertext", "ciphertext-middle", "tag"],
+)
+def test_rejects_tampered_data(offset):
+    data = bytearray(ConfigCipher(SECRET).encrypt_bytes(PLAIN))
+    data[offset] ^= 0x01
+
+    with pytest.raises(ValueError):
+        ConfigCipher(SECRET).decrypt_bytes(bytes(data))
+
+
+def test_rejects_other_devices_and_truncated_data():
+    data = ConfigCipher(SECRET).encrypt_bytes(PLAIN)
+
+    with pytest.raises(ValueError):
+        ConfigCipher("another-device").decrypt_bytes(data)
+    with pytest.raises(ValueError):
+        ConfigCipher(SECRET).decrypt_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        ConfigCipher(SECRET).decrypt_bytes(data[: HEADER_SIZE - 1])
+    with pytest.raises(ValueError):
+        ConfigCipher("another-device").decrypt_bytes(_legacy_encrypt(PLAIN))
+
+
+def test_loads_headerless_legacy_config(tmp_path):
+    path = tmp_path / "config.yaml"
+    manager = ConfigManager(config_path=path, auto_save=False)
+    manager.account.account = "13800000000"
+    path.write_text(AESUtils.encrypt(manager._serialize(), DeviceUtils.get_guid()))
+
+    loaded = ConfigManager(config_path=path, auto_save=False).load()
+    assert loaded.account.account == "13800000000"
+
+    # 重新保存时写入带文件头的加密格式
+    loaded.save()
+    assert ConfigCipher.is_encrypted(path.read_bytes())
+    reloaded = ConfigManager(config_path=path, auto_save=False).load()
+    assert reloaded.account.account == "13800000000"
@@ -0,0 +1,75 @@
+import asyncio
+from time import monotonic, sleep
+
+import pytest
+
+from internal.core.notification.dispatcher import NotificationDispatcher
+from internal.core.notification.metrics import NotificationMetrics
+from internal.core.notification.result import NotificationResult
+from internal.core.notification.spool import NotificationSpool, NotificationSpoolEntry
+
+QUEUE_SIZE = 4
+SPOOLED = 200
+TITLES = {f"notice-{i}" for i in range(SPOOLED)}
+
+
+def _wait_until(condition, timeout: float = 10.0) -> bool:
+    deadline = monotonic() + timeout
+    while not condition():
+        if monotonic() >= deadline:
+            return False
+        sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def delivered():
+    return []
+
+
+@pytest.fixture
+def spool(tmp_path):
+    spool = NotificationSpool(tmp_path / "notification.spool")
+    spool.append(
+        NotificationSpoolEntry(title=title, body="", methods=["bark"])
+        for title in sorted(TITLES)
+    )
+    return spool
+
+
+def _dispatcher(monkeypatch, spool, delivered, delay: float = 0.0):
+    async def dispatch(task):
+        if delay:
+            await asyncio.sleep(delay)
+        delivered.append(task.content.title)
+        task.remaining = set()
+        return [NotificationResult(protocol=m, success=True) for m in task.methods]
+
+    monkeypatch.setattr(NotificationDispatcher, "dispatch", staticmethod(dispatch))
+    return NotificationDispatcher(
+        spool, NotificationMetrics(), maxsize=QUEUE_SIZE, workers=1
+    )
+
+
+def test_replay_waits_for_queue_space(monkeypatch, spool, delivered):
+    dispatcher = _dispatcher(monkeypatch, spool, delivered)
+    try:
+        assert dispatcher.replay() == SPOOLED
+        assert _wait_until(lambda: len(delivered) == SPOOLED)
+        assert _wait_until(lambda: not spool.claimed_path.exists())
+    finally:
+        dispatcher.stop()
+
+    assert set(delivered) == TITLES
+    assert not spool.path.exists()
+
+
+def test_replay_interrupted_by_stop_keeps_the_rest(monkeypatch, spool, delivered):
+    dispatcher = _dispatcher(monkeypatch, spool, delivered, delay=0.005)
+    assert dispatcher.replay() == SPOOLED
+    assert _wait_until(lambda: len(delivered) >= QUEUE_SIZE)
+    dispatcher.stop(timeout=5.0)
+
+    remaining = {entry.title for entry in spool.claim()}
+    assert remaining
+    assert set(delivered) | remaining == TITLES